@@ -0,0 +1,27 @@
+"""
+Analytics Data Transfer Objects.
+"""
+from typing import List, Optional
+from pydantic import BaseModel
+
+class DailyOccupancyDTO(BaseModel):
+    """Occupancy and revenue figures for one day"""
+    date: str
+    rooms_sold: int
+    rooms_pending: int
+    inventory: int
+    occupancy_rate: float
+    adr: float
+    revenue: float
+
+class HotelOccupancyReportDTO(BaseModel):
+    """DTO for hotel occupancy reports"""
+    hotel_id: str
+    room_type: Optional[str]
+    start_date: str
+    end_date: str
+    days: List[DailyOccupancyDTO]
+    total_rooms_sold: int
+    total_revenue: float
+    occupancy_rate: float
+    adr: float
@@ -1,7 +1,8 @@
 """
 Booking Data Transfer Objects.
 """
-from typing import Optional
+from typing import List, Optional
+from enum import Enum
 from pydantic import BaseModel, Field, validator
 from datetime import date
 from app.domain.models.booking import Booking
@@ -40,6 +41,7 @@ class BookingResponseDTO(BaseModel):
     can_cancel: bool
     created_at: str
     updated_at: str
+    hold_expires_at: Optional[str] = None
 
     @classmethod
     def from_domain(cls, booking: Booking, hotel_name: str) -> "BookingResponseDTO":
@@ -60,7 +62,64 @@ class BookingResponseDTO(BaseModel):
             special_requests=booking.special_requests,
             can_cancel=booking.can_cancel(),
             created_at=booking.created_at.isoformat() if booking.created_at else "",
-            updated_at=booking.updated_at.isoformat() if booking.updated_at else ""
+            updated_at=booking.updated_at.isoformat() if booking.updated_at else "",
+            hold_expires_at=booking.hold_expires_at.isoformat() if booking.hold_expires_at else None
         )
 
-    
\ No newline at end of file
+class BookingSummaryDTO(BaseModel):
+    """DTO for bookings in paginated listings"""
+    id: str
+    hotel_id: str
+    hotel_name: str
+    user_id: str
+    room_type: str
+    check_in_date: str
+    check_out_date: str
+    guests_count: int
+    total_price: float
+    status: str
+    payment_status: str
+    created_at: str
+
+    @classmethod
+    def from_domain(cls, booking: Booking, hotel_name: str) -> "BookingSummaryDTO":
+        """Create DTO from domain model"""
+        return cls(
+            id=booking.booking_id,
+            hotel_id=booking.hotel_id,
+            hotel_name=hotel_name,
+            user_id=booking.user_id,
+            room_type=booking.room_type,
+            check_in_date=booking.check_in_date.isoformat(),
+            check_out_date=booking.check_out_date.isoformat(),
+            guests_count=booking.guests_count,
+            total_price=booking.total_price,
+            status=booking.status,
+            payment_status=booking.payment_status,
+            created_at=booking.created_at.isoformat() if booking.created_at else ""
+        )
+
+class BookingPageDTO(BaseModel):
+    """DTO for one page of a booking listing"""
+    items: List[BookingSummaryDTO]
+    next_cursor: Optional[str] = None
+
+class BulkBookingMode(str, Enum):
+    """How a bulk booking request treats lines that cannot be booked"""
+    ALL_OR_NOTHING = "all_or_nothing"
+    BEST_EFFORT = "best_effort"
+
+class BulkCreateBookingDTO(BaseModel):
+    """DTO for booking several rooms in one request"""
+    bookings: List[CreateBookingDTO] = Field(min_length=1, max_length=100)
+    mode: BulkBookingMode = BulkBookingMode.ALL_OR_NOTHING
+
+class BulkBookingFailureDTO(BaseModel):
+    """A bulk booking line that could not be booked"""
+    index: int
+    error: str
+
+class BulkBookingResultDTO(BaseModel):
+    """DTO for bulk booking responses"""
+    created: List[BookingResponseDTO]
+    failed: List[BulkBookingFailureDTO]
@@ -2,7 +2,7 @@
 Hotel Data Transfer Objects.
 Separates API contract from domain models (SRP).
 """
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple, Union
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from app.domain.models.hotel import Hotel, HotelCategory, Amenity, Room, Location
@@ -175,4 +175,83 @@ class HotelResponseDTO(BaseModel):
             available_rooms=hotel.get_available_rooms_count(),
             created_at=hotel.created_at.isoformat() if hotel.created_at else "",
             updated_at=hotel.updated_at.isoformat() if hotel.updated_at else ""
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def from_document(cls, doc: Dict[str, Any]) -> "HotelResponseDTO":
+        """
+        Create DTO from a stored hotel read document without validation.
+        Stored hotels were validated on write, so read-only endpoints skip
+        domain hydration and pydantic validation entirely.
+        """
+        return cls.model_construct(**{field: build(doc) for field, build in DOCUMENT_FIELDS.items()})
+
+    @staticmethod
+    def sparse_from_document(doc: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+        """Build only the requested response fields from a (projected) read document"""
+        return {field: (SPARSE_FIELDS.get(field) or DOCUMENT_FIELDS[field])(doc) for field in fields}
+
+MAX_BATCH_HOTELS = 100
+
+class HotelBatchRequestDTO(BaseModel):
+    """DTO for fetching several hotels at once"""
+    ids: List[str] = Field(min_length=1, max_length=MAX_BATCH_HOTELS)
+
+class HotelBatchResponseDTO(BaseModel):
+    """DTO for a batch of hotels in requested order"""
+    # Plain dicts when a sparse fieldset was requested
+    hotels: List[Union[HotelResponseDTO, Dict[str, Any]]]
+    missing: List[str]
+
+def _stamp(value: Optional[datetime]) -> str:
+    return value.isoformat() if value else ""
+
+# Response field -> how it is built from a read document
+DOCUMENT_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "id": lambda doc: doc["id"],
+    "name": lambda doc: doc["name"],
+    "description": lambda doc: doc["description"],
+    "location": lambda doc: LocationDTO.model_construct(**doc["location"]),
+    "category": lambda doc: doc["category"],
+    "star_rating": lambda doc: doc["star_rating"],
+    "amenities": lambda doc: doc.get("amenities", []),
+    "rooms": lambda doc: [RoomDTO.model_construct(**r) for r in doc.get("rooms", [])],
+    "images": lambda doc: doc.get("images", []),
+    "check_in_time": lambda doc: doc.get("check_in_time", "14:00"),
+    "check_out_time": lambda doc: doc.get("check_out_time", "11:00"),
+    "policies": lambda doc: doc.get("policies", {}),
+    "minimum_price": lambda doc: min((r["price_per_night"] for r in doc.get("rooms", [])), default=0.0),
+    "available_rooms": lambda doc: sum(r["available_count"] for r in doc.get("rooms", [])),
+    "created_at": lambda doc: _stamp(doc.get("created_at")),
+    "updated_at": lambda doc: _stamp(doc.get("updated_at")),
+}
+
+# Sparse-only fields, not part of the full response
+SPARSE_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "primary_image": lambda doc: next(iter(doc.get("images") or []), None),
+}
+
+# The fields ETags derive from, enough to revalidate without a full read
+VERSION_FIELDS: Tuple[str, ...] = ("id", "updated_at")
+
+HOTEL_FIELD_PRESETS: Dict[str, Optional[Tuple[str, ...]]] = {
+    "card": ("id", "name", "location", "star_rating", "minimum_price", "primary_image", "updated_at"),
+    # None means the full response
+    "detail": None,
+}
+
+def parse_hotel_fields(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a fields= parameter (comma-separated fields or a preset name).
+    Returns None for the full response. id and updated_at are always
+    included; raises ValueError for unknown fields.
+    """
+    if not value or not value.strip():
+        return None
+    if value.strip() in HOTEL_FIELD_PRESETS:
+        return HOTEL_FIELD_PRESETS[value.strip()]
+    requested = [field.strip() for field in value.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in DOCUMENT_FIELDS and field not in SPARSE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown hotel fields: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(["id", *requested, "updated_at"]))
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Catalog import Data Transfer Objects.
+"""
+from enum import Enum
+from typing import List
+from pydantic import BaseModel, Field
+from app.domain.models.hotel import Hotel
+from app.application.dto.hotel_dto import CreateHotelDTO
+
+class ImportFormat(str, Enum):
+    """Supported catalog file formats"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+    MSGPACK = "msgpack"
+
+class ImportHotelDTO(CreateHotelDTO):
+    """One catalog record: a hotel keyed by the supplier's own ID"""
+    external_id: str = Field(min_length=1, max_length=200)
+
+    def to_domain(self) -> Hotel:
+        """Convert DTO to domain model"""
+        hotel = super().to_domain()
+        hotel.external_id = self.external_id
+        return hotel
+
+class HotelImportErrorDTO(BaseModel):
+    """A catalog line that could not be imported"""
+    line: int
+    message: str
+
+class HotelImportResultDTO(BaseModel):
+    """Outcome of a catalog import"""
+    processed: int
+    inserted: int
+    updated: int
+    failed: int
+    errors: List[HotelImportErrorDTO]
+    elapsed_seconds: float
+    hotels_per_second: float
@@ -1,11 +1,14 @@
 """
 Search-related Data Transfer Objects.
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 from datetime import date
 from app.application.dto.hotel_dto import HotelResponseDTO
 
+# Upper bound on matches considered for ranking
+MAX_SEARCH_RESULTS = 50
+
 class SearchQueryDTO(BaseModel):
     """DTO for search queries"""
     destination: Optional[str] = None
@@ -22,7 +25,8 @@ class SearchQueryDTO(BaseModel):
 
 class SearchResultDTO(BaseModel):
     """DTO for search results"""
-    hotels: List[HotelResponseDTO]
+    # Plain dicts when a sparse fieldset was requested
+    hotels: List[Union[HotelResponseDTO, Dict[str, Any]]]
     total_count: int
     page: int
     page_size: int
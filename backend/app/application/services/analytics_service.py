@@ -0,0 +1,79 @@
+"""
+Hotel analytics service.
+Builds occupancy and revenue reports from the daily booking rollup.
+"""
+from typing import Dict, Optional
+from datetime import date, timedelta
+from app.domain.models.analytics import DailyRoomStats
+from app.domain.interfaces.repositories import IBookingStatsRepository, IHotelRepository
+from app.application.dto.analytics_dto import DailyOccupancyDTO, HotelOccupancyReportDTO
+
+MAX_REPORT_DAYS = 366
+
+class AnalyticsService:
+    """
+    Analytics service layer.
+    Reads only from the rollup collection, never from bookings.
+    """
+    def __init__(self, stats_repository: IBookingStatsRepository, hotel_repository: IHotelRepository):
+        """Initialize with repository dependencies"""
+        self.stats_repository = stats_repository
+        self.hotel_repository = hotel_repository
+
+    async def get_hotel_daily_report(
+        self,
+        hotel_id: str,
+        start_date: date,
+        end_date: date,
+        room_type: Optional[str] = None
+    ) -> Optional[HotelOccupancyReportDTO]:
+        """Get occupancy rate, ADR and revenue per day for a hotel"""
+        if end_date <= start_date:
+            raise ValueError("End date must be after start date")
+        if (end_date - start_date).days > MAX_REPORT_DAYS:
+            raise ValueError(f"Report range cannot exceed {MAX_REPORT_DAYS} days")
+
+        hotel = await self.hotel_repository.get_by_id(hotel_id)
+        if not hotel:
+            return None
+        inventory = sum(
+            room.available_count for room in hotel.rooms
+            if room_type is None or room.room_type == room_type
+        )
+
+        rows = await self.stats_repository.get_daily_stats(hotel_id, start_date, end_date, room_type)
+        by_day: Dict[date, DailyRoomStats] = {}
+        for row in rows:
+            day = by_day.setdefault(row.day, DailyRoomStats(hotel_id, room_type or "", row.day))
+            day.pending_rooms += row.pending_rooms
+            day.confirmed_rooms += row.confirmed_rooms
+            day.revenue += row.revenue
+
+        days = []
+        current = start_date
+        while current < end_date:
+            stats = by_day.get(current) or DailyRoomStats(hotel_id, room_type or "", current)
+            days.append(DailyOccupancyDTO(
+                date=current.isoformat(),
+                rooms_sold=stats.confirmed_rooms,
+                rooms_pending=stats.pending_rooms,
+                inventory=inventory,
+                occupancy_rate=stats.confirmed_rooms / inventory if inventory else 0.0,
+                adr=stats.revenue / stats.confirmed_rooms if stats.confirmed_rooms else 0.0,
+                revenue=round(stats.revenue, 2)
+            ))
+            current += timedelta(days=1)
+
+        total_sold = sum(d.rooms_sold for d in days)
+        total_revenue = sum(d.revenue for d in days)
+        return HotelOccupancyReportDTO(
+            hotel_id=hotel_id,
+            room_type=room_type,
+            start_date=start_date.isoformat(),
+            end_date=end_date.isoformat(),
+            days=days,
+            total_rooms_sold=total_sold,
+            total_revenue=round(total_revenue, 2),
+            occupancy_rate=total_sold / (inventory * len(days)) if inventory else 0.0,
+            adr=total_revenue / total_sold if total_sold else 0.0
+        )
@@ -0,0 +1,119 @@
+"""
+In-process availability feed.
+Publishes inventory and price changes to subscribers (the SSE endpoints)
+through bounded per-subscriber queues.
+"""
+import asyncio
+import itertools
+from typing import Any, Dict, Iterable, List, Optional, Set
+from app.domain.models.booking import Booking
+from app.domain.models.hotel import Hotel
+from app.application.services.surrogate_keys import hotel_key, city_key
+
+class FeedEvent:
+    """One published change; ids increase so clients can spot gaps"""
+    __slots__ = ("id", "type", "data")
+
+    def __init__(self, event_id: int, event_type: str, data: Dict[str, Any]):
+        self.id = event_id
+        self.type = event_type
+        self.data = data
+
+class FeedSubscription:
+    """
+    A subscriber's bounded queue of events.
+    When a slow subscriber falls behind, the oldest events are dropped
+    rather than letting memory grow or blocking publishers.
+    """
+    def __init__(self, topics: List[str], max_queue: int):
+        self.topics = topics
+        self.dropped = 0
+        self._queue: "asyncio.Queue[FeedEvent]" = asyncio.Queue(max_queue)
+
+    def offer(self, event: FeedEvent):
+        """Enqueue without blocking, dropping the oldest event when full"""
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def next(self, timeout: float) -> Optional[FeedEvent]:
+        """Wait for the next event; None when nothing arrived within timeout"""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+class AvailabilityFeed:
+    """
+    Topic-based pub/sub for one process.
+    Topics reuse the surrogate keys: hotel-<id> for one hotel and
+    city-<city> for searches in a city. Publishing never awaits.
+    """
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self._subscribers: Dict[str, Set[FeedSubscription]] = {}
+        self._ids = itertools.count(1)
+
+    def subscribe(self, topics: Iterable[str]) -> FeedSubscription:
+        """Start receiving events published to any of the topics"""
+        subscription = FeedSubscription(list(dict.fromkeys(topics)), self.max_queue)
+        for topic in subscription.topics:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: FeedSubscription):
+        """Stop delivering events to a subscription"""
+        for topic in subscription.topics:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    @property
+    def subscriber_count(self) -> int:
+        return len({s for subscribers in self._subscribers.values() for s in subscribers})
+
+    def publish(self, topics: Iterable[str], event_type: str, data: Dict[str, Any]) -> int:
+        """Deliver an event to every subscriber of any topic; returns the number reached"""
+        recipients: Set[FeedSubscription] = set()
+        for topic in topics:
+            recipients.update(self._subscribers.get(topic, ()))
+        if not recipients:
+            return 0
+        event = FeedEvent(next(self._ids), event_type, data)
+        for subscription in recipients:
+            subscription.offer(event)
+        return len(recipients)
+
+    def publish_booking(self, booking: Booking, hotel: Optional[Hotel] = None):
+        """Announce that a booking changed the inventory of its room type"""
+        topics = [hotel_key(booking.hotel_id)]
+        if hotel is not None:
+            topics.append(city_key(hotel.location.city))
+        self.publish(topics, "availability", {
+            "hotel_id": booking.hotel_id,
+            "room_type": booking.room_type,
+            "check_in_date": booking.check_in_date.isoformat(),
+            "check_out_date": booking.check_out_date.isoformat(),
+            "status": booking.status.value,
+        })
+
+    def publish_hotel(self, hotel: Hotel):
+        """Announce a hotel's current rooms, prices and inventory"""
+        self.publish([hotel_key(hotel.hotel_id), city_key(hotel.location.city)], "hotel", {
+            "hotel_id": hotel.hotel_id,
+            "minimum_price": hotel.get_minimum_price(),
+            "available_rooms": hotel.get_available_rooms_count(),
+            "rooms": [
+                {
+                    "room_type": room.room_type,
+                    "price_per_night": room.price_per_night,
+                    "capacity": room.capacity,
+                    "available_count": room.available_count,
+                }
+                for room in hotel.rooms
+            ],
+            "updated_at": hotel.updated_at.isoformat() if hotel.updated_at else "",
+        })
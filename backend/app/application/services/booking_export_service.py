@@ -0,0 +1,192 @@
+"""
+Booking export service.
+Streams bookings into gzipped CSV or Arrow/Parquet in fixed-size batches.
+"""
+import csv
+import io
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Optional
+from app.domain.interfaces.repositories import IBookingRepository
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+    pq = None
+
+EXPORT_COLUMNS = [
+    "booking_id", "hotel_id", "user_id", "room_type", "check_in_date", "check_out_date",
+    "nights", "guests_count", "total_price", "status", "payment_status", "created_at", "updated_at"
+]
+
+# updated_at is stamped before a write commits; the watermark trails the
+# clock so a write still in flight is left to the next incremental run
+WATERMARK_LAG = timedelta(seconds=30)
+
+def export_watermark() -> datetime:
+    """Upper bound (exclusive) on updated_at for an export starting now"""
+    return datetime.utcnow() - WATERMARK_LAG
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert a timezone-aware time to the naive UTC that updated_at is stored in"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+class ExportFormat(str, Enum):
+    """Supported export encodings"""
+    CSV = "csv"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "application/gzip",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+}
+
+EXPORT_EXTENSIONS = {
+    ExportFormat.CSV: "csv.gz",
+    ExportFormat.PARQUET: "parquet",
+    ExportFormat.ARROW: "arrows",
+}
+
+class CsvGzipWriter:
+    """Incremental gzip-compressed CSV encoder"""
+    def __init__(self, level: int = 6):
+        # wbits=31 writes a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        self._header_written = False
+
+    def write_batch(self, rows: List[Dict[str, Any]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if not self._header_written:
+            writer.writerow(EXPORT_COLUMNS)
+            self._header_written = True
+        for row in rows:
+            writer.writerow([
+                value.isoformat() if isinstance(value, (date, datetime)) else value
+                for value in (row[column] for column in EXPORT_COLUMNS)
+            ])
+        return self._compressor.compress(buffer.getvalue().encode("utf-8"))
+
+    def close(self) -> bytes:
+        header = b"" if self._header_written else self.write_batch([])
+        return header + self._compressor.flush()
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only byte sink whose contents are handed out and dropped per batch"""
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+class ArrowWriter:
+    """Incremental Parquet or Arrow IPC stream encoder (requires pyarrow)"""
+    def __init__(self, fmt: ExportFormat):
+        if pa is None:
+            raise ValueError(f"{fmt.value} export requires pyarrow to be installed")
+        self._schema = pa.schema([
+            ("booking_id", pa.string()),
+            ("hotel_id", pa.string()),
+            ("user_id", pa.string()),
+            ("room_type", pa.string()),
+            ("check_in_date", pa.date32()),
+            ("check_out_date", pa.date32()),
+            ("nights", pa.int32()),
+            ("guests_count", pa.int32()),
+            ("total_price", pa.float64()),
+            ("status", pa.dictionary(pa.int8(), pa.string())),
+            ("payment_status", pa.dictionary(pa.int8(), pa.string())),
+            ("created_at", pa.timestamp("ms")),
+            ("updated_at", pa.timestamp("ms")),
+        ])
+        self._sink = _DrainableSink()
+        if fmt == ExportFormat.PARQUET:
+            self._writer = pq.ParquetWriter(self._sink, self._schema, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_stream(self._sink, self._schema)
+
+    def write_batch(self, rows: List[Dict[str, Any]]) -> bytes:
+        if rows:
+            columns = {column: [row[column] for row in rows] for column in EXPORT_COLUMNS}
+            self._writer.write_table(pa.Table.from_pydict(columns, schema=self._schema))
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+class BookingExportService:
+    """
+    Export service layer.
+    Rows are pulled from a repository stream and encoded one batch at a
+    time, so memory stays bounded by the batch size.
+    """
+    def __init__(self, booking_repository: IBookingRepository, batch_size: int = 5000):
+        """Initialize with repository dependency"""
+        self.booking_repository = booking_repository
+        self.batch_size = batch_size
+
+    @staticmethod
+    def _writer(fmt: ExportFormat):
+        return CsvGzipWriter() if fmt == ExportFormat.CSV else ArrowWriter(fmt)
+
+    def open_export(
+        self,
+        fmt: ExportFormat,
+        updated_since: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+        hotel_id: Optional[str] = None,
+        check_in_from: Optional[date] = None,
+        check_in_to: Optional[date] = None,
+        include_archived: bool = False
+    ) -> AsyncIterator[bytes]:
+        """
+        Validate the request and return the encoded export stream.
+        Pass the previous run's updated_before as updated_since for an
+        incremental export. Delivery is at-least-once per booking: a
+        booking updated again later is exported again, so consumers should
+        upsert on booking_id.
+        """
+        updated_since, updated_before = naive_utc(updated_since), naive_utc(updated_before)
+        if updated_since and updated_before and updated_since >= updated_before:
+            raise ValueError("updated_since must be before updated_before")
+        writer = self._writer(fmt)
+        rows = self.booking_repository.iter_export_rows(
+            updated_since, updated_before, hotel_id, check_in_from, check_in_to,
+            include_archived, batch_size=self.batch_size
+        )
+        return self._encode(rows, writer)
+
+    async def _encode(self, rows: AsyncIterator[Dict[str, Any]], writer) -> AsyncIterator[bytes]:
+        batch: List[Dict[str, Any]] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                chunk = writer.write_batch(batch)
+                batch = []
+                if chunk:
+                    yield chunk
+        chunk = writer.write_batch(batch) + writer.close()
+        if chunk:
+            yield chunk
@@ -2,11 +2,31 @@
 Booking business logic service.
 Manages booking operations and validations.
 """
-from typing import List, Optional
-from datetime import date
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
 from app.domain.models.booking import Booking, BookingStatus
-from app.domain.interfaces.repositories import IBookingRepository, IHotelRepository
-from app.application.dto.booking_dto import CreateBookingDTO, BookingResponseDTO
+from app.domain.models.hotel import Hotel
+from app.domain.interfaces.repositories import (
+    IBookingRepository,
+    IHotelRepository,
+    IBookingStatsRepository
+)
+from app.application.services.popularity_tracker import PopularityTracker
+from app.application.services.availability_feed import AvailabilityFeed
+from app.application.dto.booking_dto import (
+    CreateBookingDTO,
+    BookingResponseDTO,
+    BookingSummaryDTO,
+    BookingPageDTO,
+    BulkCreateBookingDTO,
+    BulkBookingMode,
+    BulkBookingFailureDTO,
+    BulkBookingResultDTO
+)
+
+logger = logging.getLogger(__name__)
 
 class BookingService:
     """
@@ -16,10 +36,38 @@ class BookingService:
     def __init__(
     self,
     booking_repository: IBookingRepository,
-    hotel_repository: IHotelRepository ):
+    hotel_repository: IHotelRepository,
+    hold_duration: timedelta = timedelta(minutes=15),
+    stats_repository: Optional[IBookingStatsRepository] = None,
+    popularity_tracker: Optional[PopularityTracker] = None,
+    availability_feed: Optional[AvailabilityFeed] = None ):
         """Initialize with repository dependencies"""
         self.booking_repository = booking_repository
         self.hotel_repository = hotel_repository
+        self.hold_duration = hold_duration
+        self.stats_repository = stats_repository
+        self.popularity_tracker = popularity_tracker
+        self.availability_feed = availability_feed
+
+    async def _record_stats(
+        self,
+        transitions: List[Tuple[Booking, Optional[BookingStatus], Optional[BookingStatus]]]
+    ):
+        """
+        Feed status changes into the analytics rollup without failing the booking.
+        Failed batches are recorded so the next stats rebuild reconciles them.
+        """
+        if not self.stats_repository or not transitions:
+            return
+        try:
+            await self.stats_repository.record_transitions(transitions)
+        except Exception as e:
+            booking_ids = [booking.booking_id for booking, _, _ in transitions]
+            logger.exception("Failed to update booking stats for bookings %s", ", ".join(booking_ids))
+            try:
+                await self.stats_repository.record_failure(booking_ids, str(e))
+            except Exception:
+                logger.exception("Failed to record the booking stats failure for bookings %s", ", ".join(booking_ids))
 
     async def create_booking(self, dto: CreateBookingDTO) -> Optional[BookingResponseDTO]:
         """Create a new booking with availability check"""
@@ -61,13 +109,95 @@ class BookingService:
             total_price=total_price,
             special_requests=dto.special_requests
         )
+        booking.place_hold(self.hold_duration)
         
         created_booking = await self.booking_repository.create(booking)
+        await self._record_stats([(created_booking, None, BookingStatus.PENDING)])
+        if self.popularity_tracker:
+            self.popularity_tracker.record_booking(hotel)
+        if self.availability_feed:
+            self.availability_feed.publish_booking(created_booking, hotel)
         return BookingResponseDTO.from_domain(created_booking, hotel.name)
 
-    async def get_booking(self, booking_id: str) -> Optional[BookingResponseDTO]:
-        """Get booking by ID"""
-        booking = await self.booking_repository.get_by_id(booking_id)
+    async def create_bookings_bulk(self, dto: BulkCreateBookingDTO) -> BulkBookingResultDTO:
+        """
+        Create several bookings at once.
+        Hotels are fetched in one query and availability is computed once per
+        hotel and room type before a single insert. In all-or-nothing mode any
+        failed line aborts the whole request.
+        """
+        lines = dto.bookings
+        hotels = await self.hotel_repository.get_by_ids(list({line.hotel_id for line in lines}))
+        hotels_by_id = {hotel.hotel_id: hotel for hotel in hotels}
+        failures: Dict[int, str] = {}
+
+        # Validate hotel and room type, grouping the remaining lines for availability
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for index, line in enumerate(lines):
+            hotel = hotels_by_id.get(line.hotel_id)
+            if not hotel:
+                failures[index] = "Hotel not found"
+            elif not any(room.room_type == line.room_type for room in hotel.rooms):
+                failures[index] = "Invalid room type"
+            else:
+                groups.setdefault((line.hotel_id, line.room_type), []).append(index)
+
+        for (hotel_id, room_type), indexes in groups.items():
+            availability = await self.booking_repository.check_availability_bulk(
+                hotel_id,
+                room_type,
+                [(lines[i].check_in_date, lines[i].check_out_date) for i in indexes]
+            )
+            for index, is_available in zip(indexes, availability):
+                if not is_available:
+                    failures[index] = "Room not available for selected dates"
+
+        failed = [BulkBookingFailureDTO(index=i, error=failures[i]) for i in sorted(failures)]
+        if failures and dto.mode == BulkBookingMode.ALL_OR_NOTHING:
+            return BulkBookingResultDTO(created=[], failed=failed)
+
+        bookings = []
+        for index, line in enumerate(lines):
+            if index in failures:
+                continue
+            hotel = hotels_by_id[line.hotel_id]
+            room = next(r for r in hotel.rooms if r.room_type == line.room_type)
+            nights = (line.check_out_date - line.check_in_date).days
+            booking = Booking(
+                booking_id=None,
+                hotel_id=line.hotel_id,
+                user_id=line.user_id,
+                room_type=line.room_type,
+                check_in_date=line.check_in_date,
+                check_out_date=line.check_out_date,
+                guests_count=line.guests_count,
+                total_price=room.price_per_night * nights,
+                special_requests=line.special_requests
+            )
+            booking.place_hold(self.hold_duration)
+            bookings.append(booking)
+
+        # create_many removes a partial insert and raises before anything is
+        # counted, so only bookings that were kept reach the popularity tracker
+        created = await self.booking_repository.create_many(bookings)
+        await self._record_stats([(booking, None, BookingStatus.PENDING) for booking in created])
+        if self.popularity_tracker:
+            for booking in created:
+                self.popularity_tracker.record_booking(hotels_by_id[booking.hotel_id])
+        if self.availability_feed:
+            for booking in created:
+                self.availability_feed.publish_booking(booking, hotels_by_id[booking.hotel_id])
+        return BulkBookingResultDTO(
+            created=[
+                BookingResponseDTO.from_domain(booking, hotels_by_id[booking.hotel_id].name)
+                for booking in created
+            ],
+            failed=failed
+        )
+
+    async def get_booking(self, booking_id: str, include_history: bool = False) -> Optional[BookingResponseDTO]:
+        """Get booking by ID; archived bookings only with include_history"""
+        booking = await self.booking_repository.get_by_id(booking_id, include_archived=include_history)
         if not booking:
             return None
         
@@ -75,29 +205,83 @@ class BookingService:
         hotel_name = hotel.name if hotel else "Unknown Hotel"
         return BookingResponseDTO.from_domain(booking, hotel_name)
 
-    async def get_user_bookings(self, user_id: str) -> List[BookingResponseDTO]:
-        """Get all bookings for a user"""
-        bookings = await self.booking_repository.get_by_user_id(user_id)
+    async def get_user_bookings(self, user_id: str, include_history: bool = False) -> List[BookingResponseDTO]:
+        """Get all bookings for a user; archived bookings only with include_history"""
         result = []
+        hotel_names: Dict[str, str] = {}
         
-        for booking in bookings:
-            hotel = await self.hotel_repository.get_by_id(booking.hotel_id)
-            hotel_name = hotel.name if hotel else "Unknown Hotel"
-            result.append(BookingResponseDTO.from_domain(booking, hotel_name))
+        bookings = self.booking_repository.iter_by_user_id(user_id, include_archived=include_history)
+        async for booking in bookings:
+            if booking.hotel_id not in hotel_names:
+                hotel = await self.hotel_repository.get_by_id(booking.hotel_id)
+                hotel_names[booking.hotel_id] = hotel.name if hotel else "Unknown Hotel"
+            result.append(BookingResponseDTO.from_domain(booking, hotel_names[booking.hotel_id]))
         
         return result
 
+    async def list_user_bookings(
+        self,
+        user_id: str,
+        statuses: Optional[List[BookingStatus]] = None,
+        check_in_from: Optional[date] = None,
+        check_in_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        include_history: bool = False
+    ) -> BookingPageDTO:
+        """Get one page of a user's bookings, newest first"""
+        bookings, next_cursor = await self.booking_repository.list_by_user(
+            user_id, statuses, check_in_from, check_in_to, cursor, limit, include_archived=include_history
+        )
+        hotels = await self.hotel_repository.get_by_ids(list({b.hotel_id for b in bookings}))
+        return self._to_page(bookings, next_cursor, hotels)
+
+    async def list_hotel_bookings(
+        self,
+        hotel_id: str,
+        statuses: Optional[List[BookingStatus]] = None,
+        check_in_from: Optional[date] = None,
+        check_in_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        include_history: bool = False
+    ) -> BookingPageDTO:
+        """Get one page of a hotel's bookings ordered by check-in date"""
+        bookings, next_cursor = await self.booking_repository.list_by_hotel(
+            hotel_id, statuses, check_in_from, check_in_to, cursor, limit, include_archived=include_history
+        )
+        hotels = await self.hotel_repository.get_by_ids([hotel_id]) if bookings else []
+        return self._to_page(bookings, next_cursor, hotels)
+
+    @staticmethod
+    def _to_page(bookings: List[Booking], next_cursor: Optional[str], hotels: List[Hotel]) -> BookingPageDTO:
+        """Build a listing page, resolving hotel names from a prefetched batch"""
+        names = {hotel.hotel_id: hotel.name for hotel in hotels}
+        return BookingPageDTO(
+            items=[
+                BookingSummaryDTO.from_domain(booking, names.get(booking.hotel_id, "Unknown Hotel"))
+                for booking in bookings
+            ],
+            next_cursor=next_cursor
+        )
+
     async def cancel_booking(self, booking_id: str) -> Optional[BookingResponseDTO]:
         """Cancel a booking"""
         booking = await self.booking_repository.get_by_id(booking_id)
         if not booking:
             return None
         
+        previous_status = booking.status
         booking.cancel()
         updated_booking = await self.booking_repository.update(booking_id, booking)
         
         if updated_booking:
+            await self._record_stats([(updated_booking, previous_status, BookingStatus.CANCELLED)])
             hotel = await self.hotel_repository.get_by_id(updated_booking.hotel_id)
+            if self.popularity_tracker and hotel:
+                self.popularity_tracker.record_cancellation(hotel, updated_booking)
+            if self.availability_feed:
+                self.availability_feed.publish_booking(updated_booking, hotel)
             hotel_name = hotel.name if hotel else "Unknown Hotel"
             return BookingResponseDTO.from_domain(updated_booking, hotel_name)
         
@@ -113,8 +297,46 @@ class BookingService:
         updated_booking = await self.booking_repository.update(booking_id, booking)
         
         if updated_booking:
+            await self._record_stats([(updated_booking, BookingStatus.PENDING, BookingStatus.CONFIRMED)])
             hotel = await self.hotel_repository.get_by_id(updated_booking.hotel_id)
+            if self.availability_feed:
+                self.availability_feed.publish_booking(updated_booking, hotel)
             hotel_name = hotel.name if hotel else "Unknown Hotel"
             return BookingResponseDTO.from_domain(updated_booking, hotel_name)
         
-        return None
\ No newline at end of file
+        return None
+
+    async def expire_stale_holds(self, batch_size: int = 500) -> int:
+        """Cancel pending bookings whose hold has expired, releasing their inventory"""
+        now = datetime.utcnow()
+        expired_count = 0
+        while True:
+            expired = await self.booking_repository.expire_holds(now, batch_size)
+            await self._record_stats([
+                (booking, BookingStatus.PENDING, BookingStatus.CANCELLED) for booking in expired
+            ])
+            if expired and (self.availability_feed or self.popularity_tracker):
+                # The hotel's city routes the event to destination feeds too
+                hotels = await self.hotel_repository.get_by_ids(list({booking.hotel_id for booking in expired}))
+                hotels_by_id = {hotel.hotel_id: hotel for hotel in hotels}
+                for booking in expired:
+                    hotel = hotels_by_id.get(booking.hotel_id)
+                    if self.popularity_tracker and hotel:
+                        self.popularity_tracker.record_cancellation(hotel, booking)
+                    if self.availability_feed:
+                        self.availability_feed.publish_booking(booking, hotel)
+            expired_count += len(expired)
+            if len(expired) < batch_size:
+                return expired_count
+
+    async def archive_old_bookings(self, retention: timedelta, batch_size: int = 500, pause_seconds: float = 0.1) -> int:
+        """Move finished bookings that checked out before the retention window to the archive"""
+        cutoff = date.today() - retention
+        archived_count = 0
+        while True:
+            archived = await self.booking_repository.archive_finished(cutoff, batch_size)
+            archived_count += archived
+            if archived < batch_size:
+                return archived_count
+            # Leave room for foreground traffic between batches
+            await asyncio.sleep(pause_seconds)
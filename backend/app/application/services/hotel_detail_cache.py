@@ -0,0 +1,138 @@
+"""
+Hotel detail response cache.
+Keeps the final encoded response bytes per hotel so repeat detail views
+skip Mongo, DTO building and JSON encoding.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+Serializer = Callable[[Any], bytes]
+Encoder = Callable[[bytes], bytes]
+Tagger = Callable[[Any], str]
+VariantTagger = Callable[[str, str], str]
+
+class EncodedPayload:
+    """Encoded response body with lazily built compressed variants"""
+    __slots__ = ("body", "etag", "expires_at", "_encoders", "_variants", "_variant_tagger")
+
+    def __init__(
+        self,
+        body: bytes,
+        encoders: Dict[str, Encoder],
+        expires_at: float,
+        etag: Optional[str] = None,
+        variant_tagger: Optional[VariantTagger] = None
+    ):
+        self.body = body
+        self.etag = etag
+        self.expires_at = expires_at
+        self._encoders = encoders
+        self._variants: Dict[str, bytes] = {}
+        self._variant_tagger = variant_tagger
+
+    @property
+    def encodings(self):
+        """Content encodings this payload can be served with"""
+        return self._encoders.keys()
+
+    def variant(self, encoding: Optional[str]) -> bytes:
+        """Get the body compressed with the given encoding (None for identity)"""
+        if encoding is None:
+            return self.body
+        data = self._variants.get(encoding)
+        if data is None:
+            data = self._variants[encoding] = self._encoders[encoding](self.body)
+        return data
+
+    def variant_etag(self, encoding: Optional[str]) -> Optional[str]:
+        """Get the ETag of the variant with the given encoding (None for identity)"""
+        if self.etag is None or encoding is None or self._variant_tagger is None:
+            return self.etag
+        return self._variant_tagger(self.etag, encoding)
+
+class HotelDetailCache:
+    """
+    Per-process LRU of encoded hotel detail payloads.
+    HotelService invalidates entries on writes; the TTL bounds staleness
+    for writes handled by other worker processes. Concurrent misses for
+    the same hotel share a single load.
+    """
+    def __init__(
+        self,
+        serializer: Serializer,
+        encoders: Dict[str, Encoder],
+        max_entries: int = 10000,
+        ttl_seconds: float = 60,
+        tagger: Optional[Tagger] = None,
+        variant_tagger: Optional[VariantTagger] = None
+    ):
+        self.serializer = serializer
+        self.encoders = encoders
+        self.tagger = tagger
+        self.variant_tagger = variant_tagger
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, EncodedPayload]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._generation = 0
+
+    def encode(self, content: Any) -> EncodedPayload:
+        """Encode content into a payload without caching it"""
+        return EncodedPayload(
+            self.serializer(content),
+            self.encoders,
+            time.monotonic() + self.ttl_seconds,
+            self.tagger(content) if self.tagger else None,
+            self.variant_tagger
+        )
+
+    async def get_or_load(
+        self,
+        hotel_id: str,
+        loader: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[EncodedPayload]:
+        """Get the cached payload, loading and encoding it on a miss"""
+        entry = self._entries.get(hotel_id)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(hotel_id)
+                return entry
+            del self._entries[hotel_id]
+
+        pending = self._loading.get(hotel_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = asyncio.ensure_future(self._load(hotel_id, loader))
+        self._loading[hotel_id] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._loading.get(hotel_id) is future:
+                del self._loading[hotel_id]
+
+    async def _load(self, hotel_id: str, loader: Callable[[], Awaitable[Optional[Any]]]) -> Optional[EncodedPayload]:
+        generation = self._generation
+        content = await loader()
+        if content is None:
+            return None
+        payload = self.encode(content)
+        # Drop the result if a write invalidated the cache while loading
+        if generation == self._generation:
+            self._entries[hotel_id] = payload
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def invalidate(self, hotel_id: str):
+        """Forget one hotel's payload"""
+        self._generation += 1
+        self._entries.pop(hotel_id, None)
+        self._loading.pop(hotel_id, None)
+
+    def clear(self):
+        """Forget every payload"""
+        self._generation += 1
+        self._entries.clear()
+        self._loading.clear()
@@ -0,0 +1,248 @@
+"""
+Bulk hotel catalog import.
+Streams NDJSON or CSV catalog lines (or MessagePack records), validates
+them in chunks and upserts each chunk with one unordered bulk write keyed
+by the supplier hotel ID.
+"""
+import asyncio
+import csv
+import json
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from pydantic import TypeAdapter, ValidationError
+from app.domain.models.hotel import Hotel
+from app.domain.interfaces.repositories import IHotelRepository
+from app.domain.interfaces.cache import ICachePurger
+from app.application.services.hotel_detail_cache import HotelDetailCache
+from app.application.services.surrogate_keys import CATALOG_KEY, HOTEL_LIST_KEY
+from app.application.dto.import_dto import (
+    ImportFormat,
+    ImportHotelDTO,
+    HotelImportErrorDTO,
+    HotelImportResultDTO
+)
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+# Built once: constructing a TypeAdapter compiles the validator
+HOTEL_ADAPTER = TypeAdapter(ImportHotelDTO)
+
+LOCATION_COLUMNS = ("address", "city", "country", "latitude", "longitude", "postal_code")
+LIST_COLUMNS = ("amenities", "images")
+JSON_COLUMNS = ("rooms", "policies")
+
+async def iter_text_lines(chunks: AsyncIterator[bytes], encoding: str = "utf-8") -> AsyncIterator[str]:
+    """Split a stream of byte chunks (e.g. a request body) into text lines"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode(encoding)
+    if buffer:
+        yield buffer.decode(encoding)
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Join text lines into CSV records, numbered by their first line.
+    Quoted fields may span lines (e.g. supplier descriptions): while a
+    record holds an odd number of quote characters it continues on the
+    next line.
+    """
+    number = start = quotes = 0
+    parts: List[str] = []
+    async for line in lines:
+        number += 1
+        line = line.rstrip("\r\n")
+        if not parts:
+            start = number
+        parts.append(line)
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield start, "\n".join(parts)
+            parts, quotes = [], 0
+    if parts:
+        # Unterminated quoted field; parsing reports it against its first line
+        yield start, "\n".join(parts)
+
+async def _numbered(lines: AsyncIterator[Any]) -> AsyncIterator[Tuple[int, Any]]:
+    number = 0
+    async for line in lines:
+        number += 1
+        yield number, line
+
+async def iter_msgpack_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """Decode a stream of byte chunks holding concatenated MessagePack records"""
+    if msgpack is None:
+        raise ValueError("MessagePack import requires msgpack to be installed")
+    unpacker = msgpack.Unpacker(raw=False)
+    async for chunk in chunks:
+        unpacker.feed(chunk)
+        for record in unpacker:
+            yield record
+
+def csv_row_to_record(row: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Map a flat CSV row to the nested import record.
+    Location fields are plain columns, amenities and images are
+    `|`-separated and rooms/policies hold JSON.
+    """
+    record: Dict[str, Any] = {}
+    location: Dict[str, Any] = {}
+    for column, value in row.items():
+        if column is None or value is None or value == "":
+            continue
+        if column in LOCATION_COLUMNS:
+            location[column] = value
+        elif column in LIST_COLUMNS:
+            record[column] = [item for item in value.split("|") if item]
+        elif column in JSON_COLUMNS:
+            record[column] = json.loads(value)
+        else:
+            record[column] = value
+    record["location"] = location
+    return record
+
+class HotelImportReport:
+    """Running counters of an import"""
+    def __init__(self, max_errors: int):
+        self.max_errors = max_errors
+        self.processed = 0
+        self.inserted = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors: List[HotelImportErrorDTO] = []
+        self.started = time.monotonic()
+
+    def add_error(self, line: int, message: str):
+        """Count a failed line, keeping the first max_errors messages"""
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(HotelImportErrorDTO(line=line, message=message))
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def hotels_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return (self.inserted + self.updated) / elapsed if elapsed else 0.0
+
+    def to_dto(self) -> HotelImportResultDTO:
+        """Snapshot the report as a response DTO"""
+        return HotelImportResultDTO(
+            processed=self.processed,
+            inserted=self.inserted,
+            updated=self.updated,
+            failed=self.failed,
+            errors=self.errors,
+            elapsed_seconds=round(self.elapsed_seconds, 3),
+            hotels_per_second=round(self.hotels_per_second, 1)
+        )
+
+ProgressCallback = Callable[[HotelImportReport], None]
+
+class HotelImportService:
+    """
+    Catalog import service.
+    Validation of one chunk overlaps with the bulk write of the previous one.
+    """
+    def __init__(
+        self,
+        hotel_repository: IHotelRepository,
+        chunk_size: int = 1000,
+        max_errors: int = 100,
+        detail_cache: Optional[HotelDetailCache] = None,
+        purger: Optional[ICachePurger] = None
+    ):
+        """Initialize with repository dependency"""
+        self.hotel_repository = hotel_repository
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.detail_cache = detail_cache
+        self.purger = purger
+
+    def _parse(self, line: Any, fmt: ImportFormat, header: Optional[List[str]]) -> Hotel:
+        """Validate one catalog line (a decoded record for MessagePack) into a domain hotel"""
+        if fmt == ImportFormat.NDJSON:
+            dto = HOTEL_ADAPTER.validate_json(line)
+        elif fmt == ImportFormat.MSGPACK:
+            dto = HOTEL_ADAPTER.validate_python(line)
+        else:
+            values = next(csv.reader([line], strict=True))
+            dto = HOTEL_ADAPTER.validate_python(csv_row_to_record(dict(zip(header, values))))
+        return dto.to_domain()
+
+    async def _write(self, chunk: List[Tuple[int, Hotel]], report: HotelImportReport):
+        """Upsert one validated chunk and fold the outcome into the report"""
+        inserted, updated, errors = await self.hotel_repository.upsert_many_by_external_id(
+            [hotel for _, hotel in chunk]
+        )
+        report.inserted += inserted
+        report.updated += updated
+        for index, message in errors:
+            report.add_error(chunk[index][0], message)
+
+    async def import_lines(
+        self,
+        lines: AsyncIterator[Any],
+        fmt: ImportFormat,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> HotelImportResultDTO:
+        """Import catalog lines (decoded records for MessagePack); bad lines are reported and skipped"""
+        report = HotelImportReport(self.max_errors)
+        header: Optional[List[str]] = None
+        chunk: List[Tuple[int, Hotel]] = []
+        pending: Optional[Awaitable] = None
+
+        async def flush():
+            nonlocal pending, chunk
+            if pending is not None:
+                await pending
+                if on_progress:
+                    on_progress(report)
+            pending = asyncio.ensure_future(self._write(chunk, report)) if chunk else None
+            chunk = []
+
+        records = iter_csv_records(lines) if fmt == ImportFormat.CSV else _numbered(lines)
+        async for number, line in records:
+            # Records are parsed as they came: stripping would eat
+            # whitespace at the edges of quoted CSV fields
+            if fmt != ImportFormat.MSGPACK and not line.strip():
+                continue
+            if fmt == ImportFormat.CSV and header is None:
+                try:
+                    header = next(csv.reader([line], strict=True))
+                except csv.Error as e:
+                    raise ValueError(f"Malformed CSV header: {e}")
+                continue
+            report.processed += 1
+            try:
+                chunk.append((number, self._parse(line, fmt, header)))
+            except ValidationError as e:
+                report.add_error(number, "; ".join(
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" if err["loc"] else err["msg"]
+                    for err in e.errors()
+                ))
+            except ValueError as e:
+                report.add_error(number, str(e))
+            except csv.Error as e:
+                report.add_error(number, f"Malformed CSV: {e}")
+            if len(chunk) >= self.chunk_size:
+                await flush()
+
+        await flush()
+        await flush()
+        # Upserts do not report which hotels changed
+        if report.updated and self.detail_cache is not None:
+            self.detail_cache.clear()
+        if (report.inserted or report.updated) and self.purger is not None:
+            try:
+                await self.purger.purge([CATALOG_KEY if report.updated else HOTEL_LIST_KEY])
+            except Exception as e:
+                print(f"⚠️ Cache purge failed after import: {e}")
+        return report.to_dto()
@@ -2,11 +2,17 @@
 Hotel business logic service.
 Orchestrates hotel-related operations following SRP.
 """
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from datetime import date
 from app.domain.models.hotel import Hotel
 from app.domain.interfaces.repositories import IHotelRepository
-from app.application.dto.hotel_dto import CreateHotelDTO, UpdateHotelDTO, HotelResponseDTO
+from app.domain.interfaces.cache import ICachePurger
+from app.domain.exceptions import PreconditionFailedError
+from app.application.dto.hotel_dto import CreateHotelDTO, UpdateHotelDTO, HotelResponseDTO, HotelBatchResponseDTO
+from app.application.dto.search_dto import MAX_SEARCH_RESULTS
+from app.application.services.hotel_detail_cache import HotelDetailCache, EncodedPayload
+from app.application.services.surrogate_keys import HOTEL_LIST_KEY, hotel_key, city_key
+from app.application.services.availability_feed import AvailabilityFeed
 
 class HotelService:
     """
@@ -14,43 +20,134 @@ class HotelService:
     Implements business logic for hotel operations.
     Follows SRP: Only handles hotel business operations.
     """
-    def __init__(self, hotel_repository: IHotelRepository):
+    def __init__(
+        self,
+        hotel_repository: IHotelRepository,
+        detail_cache: Optional[HotelDetailCache] = None,
+        purger: Optional[ICachePurger] = None,
+        availability_feed: Optional[AvailabilityFeed] = None
+    ):
         """
         Initialize with repository dependency.
         Follows DIP: Depends on abstraction, not concrete implementation.
         """
         self.hotel_repository = hotel_repository
+        self.detail_cache = detail_cache
+        self.purger = purger
+        self.availability_feed = availability_feed
 
     async def create_hotel(self, dto: CreateHotelDTO) -> HotelResponseDTO:
         """Create a new hotel"""
         hotel = dto.to_domain()
         created_hotel = await self.hotel_repository.create(hotel)
+        await self._purge([HOTEL_LIST_KEY, city_key(created_hotel.location.city)])
         return HotelResponseDTO.from_domain(created_hotel)
 
-    async def get_hotel(self, hotel_id: str) -> Optional[HotelResponseDTO]:
-        """Get hotel by ID"""
-        hotel = await self.hotel_repository.get_by_id(hotel_id)
-        return HotelResponseDTO.from_domain(hotel) if hotel else None
+    async def get_hotel(
+        self,
+        hotel_id: str,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Optional[Union[HotelResponseDTO, Dict[str, Any]]]:
+        """Get hotel by ID; with fields, only those response fields are fetched and returned"""
+        doc = await self.hotel_repository.get_document_by_id(hotel_id, fields)
+        if not doc:
+            return None
+        return HotelResponseDTO.from_document(doc) if fields is None else HotelResponseDTO.sparse_from_document(doc, fields)
+
+    @property
+    def caches_details(self) -> bool:
+        """Whether full hotel detail responses are served from the detail cache"""
+        return self.detail_cache is not None
+
+    async def get_hotel_payload(self, hotel_id: str) -> Optional[EncodedPayload]:
+        """
+        Get the encoded hotel detail response from the detail cache.
+        Returns None when the hotel does not exist or no cache is configured.
+        """
+        if self.detail_cache is None:
+            return None
+        return await self.detail_cache.get_or_load(hotel_id, lambda: self.get_hotel(hotel_id))
+
+    async def list_hotels(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> List[Union[HotelResponseDTO, Dict[str, Any]]]:
+        """List all hotels with pagination; with fields, only those response fields are returned"""
+        docs = await self.hotel_repository.get_all_documents(skip, limit, fields)
+        if fields is not None:
+            return [HotelResponseDTO.sparse_from_document(doc, fields) for doc in docs]
+        return [HotelResponseDTO.from_document(doc) for doc in docs]
 
-    async def list_hotels(self, skip: int = 0, limit: int = 100) -> List[HotelResponseDTO]:
-        """List all hotels with pagination"""
-        hotels = await self.hotel_repository.get_all(skip, limit)
-        return [HotelResponseDTO.from_domain(hotel) for hotel in hotels]
+    async def get_hotels_batch(
+        self,
+        hotel_ids: List[str],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> HotelBatchResponseDTO:
+        """Get several hotels with one query, in requested order; unknown IDs are reported as missing"""
+        requested = list(dict.fromkeys(hotel_ids))
+        docs = await self.hotel_repository.get_documents_by_ids(requested, fields)
+        by_id = {doc["id"]: doc for doc in docs}
+        hotels = []
+        missing = []
+        for hotel_id in requested:
+            doc = by_id.get(hotel_id)
+            if doc is None:
+                missing.append(hotel_id)
+            elif fields is None:
+                hotels.append(HotelResponseDTO.from_document(doc))
+            else:
+                hotels.append(HotelResponseDTO.sparse_from_document(doc, fields))
+        return HotelBatchResponseDTO.model_construct(hotels=hotels, missing=missing)
 
-    async def update_hotel(self, hotel_id: str, dto: UpdateHotelDTO) -> Optional[HotelResponseDTO]:
-        """Update hotel information"""
+    async def update_hotel(
+        self,
+        hotel_id: str,
+        dto: UpdateHotelDTO,
+        precondition: Optional[Callable[[HotelResponseDTO], bool]] = None
+    ) -> Optional[HotelResponseDTO]:
+        """
+        Update hotel information.
+        precondition is checked against the current hotel (e.g. If-Match);
+        the versioned write catches changes made after the check.
+        """
         existing_hotel = await self.hotel_repository.get_by_id(hotel_id)
         if not existing_hotel:
             return None
+        if precondition and not precondition(HotelResponseDTO.from_domain(existing_hotel)):
+            raise PreconditionFailedError("Hotel", hotel_id)
         
         # Apply updates to existing hotel
         updated_hotel = dto.apply_to_domain(existing_hotel)
         saved_hotel = await self.hotel_repository.update(hotel_id, updated_hotel)
+        # Price, rating or amenity edits can add the hotel to city searches
+        # that did not list it, and so are not tagged with its key
+        await self._invalidate(hotel_id, [city_key(existing_hotel.location.city)])
+        if saved_hotel and self.availability_feed:
+            self.availability_feed.publish_hotel(saved_hotel)
         return HotelResponseDTO.from_domain(saved_hotel) if saved_hotel else None
 
     async def delete_hotel(self, hotel_id: str) -> bool:
         """Delete a hotel"""
-        return await self.hotel_repository.delete(hotel_id)
+        deleted = await self.hotel_repository.delete(hotel_id)
+        await self._invalidate(hotel_id)
+        return deleted
+
+    async def _invalidate(self, hotel_id: str, extra_keys: Optional[List[str]] = None):
+        """Drop cached responses for a changed hotel, locally and in shared caches"""
+        if self.detail_cache is not None:
+            self.detail_cache.invalidate(hotel_id)
+        await self._purge([hotel_key(hotel_id), *(extra_keys or [])])
+
+    async def _purge(self, keys: List[str]):
+        """Fire the purge hook; a failed purge must not fail the write"""
+        if self.purger is None:
+            return
+        try:
+            await self.purger.purge(keys)
+        except Exception as e:
+            print(f"⚠️ Cache purge failed for {keys}: {e}")
 
     async def search_hotels(
         self,
@@ -64,7 +161,7 @@ class HotelService:
         min_rating: Optional[int] = None
     ) -> List[HotelResponseDTO]:
         """Search hotels with filters"""
-        hotels = await self.hotel_repository.search(
+        docs = self.hotel_repository.iter_search_documents(
             city=city,
             check_in=check_in,
             check_out=check_out,
@@ -72,6 +169,7 @@ class HotelService:
             min_price=min_price,
             max_price=max_price,
             amenities=amenities,
-            min_rating=min_rating
+            min_rating=min_rating,
+            limit=MAX_SEARCH_RESULTS
         )
-        return [HotelResponseDTO.from_domain(hotel) for hotel in hotels]
\ No newline at end of file
+        return [HotelResponseDTO.from_document(doc) async for doc in docs]
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+Popularity tracking service.
+Maintains time-decayed demand counters for hotels and destinations.
+"""
+import heapq
+import time
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta
+from app.domain.models.hotel import Hotel
+from app.domain.models.booking import Booking, BookingStatus
+from app.domain.interfaces.repositories import IHotelRepository, IBookingRepository
+from app.application.dto.hotel_dto import HotelResponseDTO
+
+BOOKING_HOTEL_WEIGHT = 1.0
+BOOKING_DESTINATION_WEIGHT = 3.0
+SEARCH_DESTINATION_WEIGHT = 1.0
+
+def booking_timestamp(booking: Booking) -> float:
+    """Epoch seconds of a booking's creation (created_at is naive UTC)"""
+    return (booking.created_at - datetime(1970, 1, 1)).total_seconds()
+
+class DecayingCounter:
+    """
+    Exponentially decaying counters with O(1) updates.
+    Uses forward decay: increments are scaled up relative to a landmark
+    time instead of decaying every key on each tick. Compaction moves the
+    landmark forward and drops keys whose score has faded out.
+    """
+    def __init__(self, half_life_seconds: float, landmark: Optional[float] = None):
+        self.half_life_seconds = half_life_seconds
+        self._landmark = landmark if landmark is not None else time.time()
+        self._scores: Dict[Hashable, float] = {}
+
+    def _growth(self, timestamp: float) -> float:
+        return 2 ** ((timestamp - self._landmark) / self.half_life_seconds)
+
+    def add(self, key: Hashable, weight: float = 1.0, timestamp: Optional[float] = None):
+        """Record an event for key at the given time (defaults to now)"""
+        growth = self._growth(timestamp if timestamp is not None else time.time())
+        self._scores[key] = self._scores.get(key, 0.0) + weight * growth
+
+    def compact(self, now: Optional[float] = None, min_score: float = 0.01):
+        """Rebase scores on the current time and drop negligible keys"""
+        now = now if now is not None else time.time()
+        decay = 1 / self._growth(now)
+        self._scores = {
+            key: score * decay
+            for key, score in self._scores.items()
+            if score * decay >= min_score
+        }
+        self._landmark = now
+
+    def top(self, k: int, now: Optional[float] = None) -> List[Tuple[Hashable, float]]:
+        """Get the k highest-scoring keys with their current decayed scores"""
+        decay = 1 / self._growth(now if now is not None else time.time())
+        best = heapq.nlargest(k, self._scores.items(), key=lambda item: item[1])
+        return [(key, score * decay) for key, score in best]
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+class PopularityTracker:
+    """
+    Tracks booking and search demand and serves precomputed top-k lists.
+    Events only touch in-memory counters; refresh() recomputes the lists
+    periodically so request handlers just return the cached result.
+    """
+    def __init__(
+        self,
+        hotel_repository: IHotelRepository,
+        booking_repository: IBookingRepository,
+        half_life: timedelta = timedelta(hours=24),
+        top_k: int = 50
+    ):
+        """Initialize with repository dependencies"""
+        self.hotel_repository = hotel_repository
+        self.booking_repository = booking_repository
+        self.top_k = top_k
+        self._hotels = DecayingCounter(half_life.total_seconds())
+        self._destinations = DecayingCounter(half_life.total_seconds())
+        self._trending_hotels: List[HotelResponseDTO] = []
+        self._popular_destinations: List[Dict[str, Any]] = []
+
+    def record_booking(self, hotel: Hotel, rooms: int = 1, timestamp: Optional[float] = None):
+        """Count a booking towards the hotel and its destination"""
+        self._hotels.add(hotel.hotel_id, BOOKING_HOTEL_WEIGHT * rooms, timestamp)
+        self._destinations.add(
+            (hotel.location.city, hotel.location.country),
+            BOOKING_DESTINATION_WEIGHT * rooms,
+            timestamp
+        )
+
+    def record_cancellation(self, hotel: Hotel, booking: Booking, rooms: int = 1):
+        """
+        Take back a cancelled or expired booking.
+        The negative weight is added at the booking's creation time, so it
+        cancels exactly the decayed amount record_booking added for it.
+        """
+        self.record_booking(hotel, -rooms, booking_timestamp(booking))
+
+    def record_search(self, destinations: Iterable[Tuple[str, str]]):
+        """Count a search towards each (city, country) it returned hotels for"""
+        for destination in set(destinations):
+            self._destinations.add(destination, SEARCH_DESTINATION_WEIGHT)
+
+    async def warm_up(self, since: timedelta, batch_size: int = 1000):
+        """Replay recent bookings so rankings survive a restart"""
+        hotels_by_id: Dict[str, Optional[Hotel]] = {}
+        pending: List[Any] = []
+
+        async def replay():
+            unknown = list({b.hotel_id for b in pending if b.hotel_id not in hotels_by_id})
+            if unknown:
+                hotels_by_id.update({hotel_id: None for hotel_id in unknown})
+                for hotel in await self.hotel_repository.get_by_ids(unknown):
+                    hotels_by_id[hotel.hotel_id] = hotel
+            for booking in pending:
+                hotel = hotels_by_id.get(booking.hotel_id)
+                # Cancelled and expired bookings no longer count
+                if hotel and booking.status != BookingStatus.CANCELLED:
+                    self.record_booking(hotel, timestamp=booking_timestamp(booking))
+            pending.clear()
+
+        # Stream bookings and resolve their hotels one batch at a time
+        async for booking in self.booking_repository.iter_created_since(datetime.utcnow() - since, batch_size):
+            pending.append(booking)
+            if len(pending) >= batch_size:
+                await replay()
+        await replay()
+        await self.refresh()
+
+    async def refresh(self):
+        """Compact the counters and rebuild the cached top-k lists"""
+        self._hotels.compact()
+        self._destinations.compact()
+
+        top_hotel_ids = [hotel_id for hotel_id, _ in self._hotels.top(self.top_k)]
+        if top_hotel_ids:
+            hotels = await self.hotel_repository.get_by_ids(top_hotel_ids)
+            hotels_by_id = {hotel.hotel_id: hotel for hotel in hotels}
+            ranked = [hotels_by_id[i] for i in top_hotel_ids if i in hotels_by_id]
+        else:
+            # No demand recorded yet: fall back to top-rated hotels
+            ranked = await self.hotel_repository.get_all(skip=0, limit=self.top_k)
+            ranked.sort(key=lambda h: h.star_rating, reverse=True)
+        self._trending_hotels = [HotelResponseDTO.from_domain(hotel) for hotel in ranked]
+
+        top_destinations = [destination for destination, _ in self._destinations.top(self.top_k)]
+        if top_destinations:
+            counts = await self.hotel_repository.get_city_hotel_counts(
+                [city for city, _ in top_destinations], limit=self.top_k
+            )
+            hotels_count = {(c["city"], c["country"]): c["hotels_count"] for c in counts}
+            self._popular_destinations = [
+                {"city": city, "country": country, "hotels_count": hotels_count.get((city, country), 0)}
+                for city, country in top_destinations
+            ]
+        else:
+            self._popular_destinations = await self.hotel_repository.get_city_hotel_counts(limit=self.top_k)
+
+    def get_trending_hotels(self, limit: int) -> List[HotelResponseDTO]:
+        """Get the cached trending hotels"""
+        return self._trending_hotels[:limit]
+
+    def get_popular_destinations(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the cached popular destinations"""
+        return self._popular_destinations[:limit]
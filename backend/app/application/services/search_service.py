@@ -2,30 +2,43 @@
 Advanced search service.
 Implements complex search algorithms and scoring.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import date
+import heapq
 import math
 from app.domain.interfaces.repositories import IHotelRepository
-from app.application.dto.search_dto import SearchQueryDTO, SearchResultDTO
+from app.application.dto.search_dto import SearchQueryDTO, SearchResultDTO, MAX_SEARCH_RESULTS
 from app.application.dto.hotel_dto import HotelResponseDTO
+from app.application.services.popularity_tracker import PopularityTracker
 
+# Response fields the relevance score and popularity tracking read
+SCORING_FIELDS = ("location", "star_rating", "minimum_price", "available_rooms", "amenities")
 
 class SearchService:
     """
     Search service with advanced filtering and ranking.
     Follows OCP: Can be extended with new search strategies.
     """
-    def __init__(self, hotel_repository: IHotelRepository):
-        """Initialize with repository dependency"""
+    def __init__(self, hotel_repository: IHotelRepository, popularity_tracker: PopularityTracker):
+        """Initialize with repository and popularity tracker dependencies"""
         self.hotel_repository = hotel_repository
+        self.popularity_tracker = popularity_tracker
 
-    async def search(self, query: SearchQueryDTO) -> SearchResultDTO:
+    async def search(self, query: SearchQueryDTO, fields: Optional[Tuple[str, ...]] = None) -> SearchResultDTO:
         """
         Perform advanced hotel search with ranking.
         Implements search algorithm with relevance scoring.
+        With fields, hotels are returned as sparse dicts of those fields.
         """
-        # Search hotels using repository
-        hotels = await self.hotel_repository.search(
+        start = query.page * query.page_size
+        end = start + query.page_size
+        
+        # Stream matches and keep only the best `end` of them; ties keep
+        # repository order, like a stable sort would
+        best: List[Tuple[float, int, Dict[str, Any]]] = []
+        destinations: Set[Tuple[str, str]] = set()
+        total_count = 0
+        docs = self.hotel_repository.iter_search_documents(
             city=query.destination,
             check_in=query.check_in_date,
             check_out=query.check_out_date,
@@ -33,78 +46,75 @@ class SearchService:
             min_price=query.min_price,
             max_price=query.max_price,
             amenities=query.amenities,
-            min_rating=query.min_rating
+            min_rating=query.min_rating,
+            limit=MAX_SEARCH_RESULTS,
+            fields=None if fields is None else tuple(dict.fromkeys(fields + SCORING_FIELDS))
         )
-        
-        # Calculate relevance scores
-        scored_hotels = []
-        for hotel in hotels:
-            score = self._calculate_relevance_score(hotel, query)
-            scored_hotels.append((hotel, score))
-        
-        # Sort by relevance score
-        scored_hotels.sort(key=lambda x: x[1], reverse=True)
+        async for doc in docs:
+            destinations.add((doc["location"]["city"], doc["location"]["country"]))
+            entry = (self._calculate_relevance_score(doc, query), -total_count, doc)
+            total_count += 1
+            if len(best) < end:
+                heapq.heappush(best, entry)
+            elif entry[:2] > best[0][:2]:
+                heapq.heapreplace(best, entry)
+        if query.destination:
+            self.popularity_tracker.record_search(destinations)
         
         # Apply pagination
-        start = query.page * query.page_size
-        end = start + query.page_size
-        paginated_hotels = scored_hotels[start:end]
-        
-        # Convert to DTOs
-        hotel_dtos = [
-            HotelResponseDTO.from_domain(hotel)
-            for hotel, _ in paginated_hotels
-        ]
+        ranked = sorted(best, key=lambda entry: entry[:2], reverse=True)
+        page_docs = [doc for _, _, doc in ranked[start:end]]
+        if fields is not None:
+            return SearchResultDTO.model_construct(
+                hotels=[HotelResponseDTO.sparse_from_document(doc, fields) for doc in page_docs],
+                total_count=total_count,
+                page=query.page,
+                page_size=query.page_size,
+                total_pages=math.ceil(total_count / query.page_size)
+            )
+        hotel_dtos = [HotelResponseDTO.from_document(doc) for doc in page_docs]
         
         return SearchResultDTO(
             hotels=hotel_dtos,
-            total_count=len(hotels),
+            total_count=total_count,
             page=query.page,
             page_size=query.page_size,
-            total_pages=math.ceil(len(hotels) / query.page_size)
+            total_pages=math.ceil(total_count / query.page_size)
         )
 
-    def _calculate_relevance_score(self, hotel, query: SearchQueryDTO) -> float:
+    def _calculate_relevance_score(self, doc: Dict[str, Any], query: SearchQueryDTO) -> float:
         """
-        Calculate relevance score for hotel based on search criteria.
+        Calculate relevance score for a hotel read document based on search criteria.
         Higher score means better match.
         """
         score = 0.0
+        rooms = doc.get("rooms", [])
         
         # Rating score (0-50 points)
-        score += hotel.star_rating * 10
+        score += doc["star_rating"] * 10
         
         # Price score (0-30 points)
-        min_price = hotel.get_minimum_price()
+        min_price = min((r["price_per_night"] for r in rooms), default=0.0)
         if query.max_price:
             price_ratio = min_price / query.max_price
             score += (1 - price_ratio) * 30
         
         # Amenities match score (0-20 points)
         if query.amenities:
-            matched = sum(1 for a in query.amenities if hotel.has_amenity(a))
+            hotel_amenities = set(doc.get("amenities", []))
+            matched = sum(1 for a in query.amenities if a in hotel_amenities)
             score += (matched / len(query.amenities)) * 20
         
         # Availability score (bonus points)
-        if hotel.get_available_rooms_count() > 5:
+        if sum(r["available_count"] for r in rooms) > 5:
             score += 10
         
         return score
 
-    async def get_popular_destinations(self) -> List[Dict[str, Any]]:
-        """Get list of popular destinations"""
-        # In production, this would aggregate from bookings data
-        return [
-            {"city": "Paris", "country": "France", "hotels_count": 1250},
-            {"city": "London", "country": "UK", "hotels_count": 980},
-            {"city": "New York", "country": "USA", "hotels_count": 1500},
-            {"city": "Tokyo", "country": "Japan", "hotels_count": 750},
-            {"city": "Barcelona", "country": "Spain", "hotels_count": 620}
-        ]
+    async def get_popular_destinations(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get destinations ranked by recent booking and search demand"""
+        return self.popularity_tracker.get_popular_destinations(limit)
 
     async def get_trending_hotels(self, limit: int = 10) -> List[HotelResponseDTO]:
-        """Get trending hotels based on recent bookings"""
-        # Simplified: just get top-rated hotels
-        hotels = await self.hotel_repository.get_all(skip=0, limit=limit)
-        hotels.sort(key=lambda h: h.star_rating, reverse=True)
-        return [HotelResponseDTO.from_domain(hotel) for hotel in hotels[:limit]]
\ No newline at end of file
+        """Get hotels ranked by recent bookings"""
+        return self.popularity_tracker.get_trending_hotels(limit)
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+Surrogate keys.
+Responses are tagged with these keys so shared caches can purge every
+response that depends on a changed hotel.
+"""
+
+# Every hotel-derived response; purged when the catalog changes wholesale
+CATALOG_KEY = "catalog"
+# Hotel listings; purged when hotels are added
+HOTEL_LIST_KEY = "hotels"
+SEARCH_KEY = "search"
+DESTINATIONS_KEY = "destinations"
+TRENDING_KEY = "trending"
+
+def hotel_key(hotel_id: str) -> str:
+    """Key of every response containing the hotel"""
+    return f"hotel-{hotel_id}"
+
+def city_key(city: str) -> str:
+    """Key of listings and searches for a city (keys are space separated, so spaces become dashes)"""
+    return "city-" + "-".join(city.lower().split())
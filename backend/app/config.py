@@ -11,6 +11,38 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-here"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 10
+    MONGODB_MAX_CONNECTING: int = 2
+    MONGODB_MAX_IDLE_TIME_MS: int = 300000
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 5000
+    MONGODB_CONNECT_TIMEOUT_MS: int = 5000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGODB_SOCKET_TIMEOUT_MS: Optional[int] = None
+    MONGODB_COMPRESSORS: str = ""
+    BOOKING_HOLD_MINUTES: int = 15
+    BOOKING_HOLD_SWEEP_INTERVAL_SECONDS: int = 60
+    BOOKING_HOLD_SWEEP_BATCH_SIZE: int = 500
+    POPULARITY_HALF_LIFE_HOURS: float = 24
+    POPULARITY_REFRESH_INTERVAL_SECONDS: int = 60
+    POPULARITY_WARMUP_DAYS: int = 7
+    VERIFY_QUERY_SHAPES: bool = False
+    DATE_MIGRATION_CHECK_INTERVAL_SECONDS: int = 300
+    MONGODB_STREAM_BATCH_SIZE: int = 500
+    BOOKING_ARCHIVE_ENABLED: bool = True
+    BOOKING_ARCHIVE_RETENTION_DAYS: int = 365
+    BOOKING_ARCHIVE_INTERVAL_SECONDS: int = 3600
+    BOOKING_ARCHIVE_BATCH_SIZE: int = 500
+    HOTEL_DETAIL_CACHE_SIZE: int = 10000
+    HOTEL_DETAIL_CACHE_TTL_SECONDS: float = 60
+    RESPONSE_COMPRESSION_LEVEL: int = 6
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    CACHE_HOTEL_MAX_AGE_SECONDS: int = 300
+    CACHE_HOTEL_SHARED_MAX_AGE_SECONDS: int = 86400
+    CACHE_SEARCH_MAX_AGE_SECONDS: int = 30
+    CACHE_POPULAR_MAX_AGE_SECONDS: int = 60
+    FEED_QUEUE_SIZE: int = 100
+    FEED_HEARTBEAT_SECONDS: float = 15
     class Config:
         env_file = ".env"
 settings = Settings()
\ No newline at end of file
@@ -1,41 +1,124 @@
 from functools import lru_cache
+from datetime import timedelta
+from app.config import settings
 from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
 from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
 from app.infrastructure.database.repositories.user_repository import MongoUserRepository
+from app.infrastructure.database.repositories.booking_stats_repository import MongoBookingStatsRepository
 from app.application.services.hotel_service import HotelService
 from app.application.services.booking_service import BookingService
 from app.application.services.search_service import SearchService
+from app.application.services.analytics_service import AnalyticsService
+from app.application.services.popularity_tracker import PopularityTracker
+from app.application.services.hotel_import_service import HotelImportService
+from app.application.services.booking_export_service import BookingExportService
+from app.application.services.hotel_detail_cache import HotelDetailCache
+from app.application.services.availability_feed import AvailabilityFeed
 from app.infrastructure.security.auth import AuthService
+from app.infrastructure.cache.local_purger import LocalCachePurger
+from app.presentation.responses import render_json
+from app.presentation.compression import available_encoders
+from app.presentation.etags import hotel_etag, encoded_etag
 
 @lru_cache()
 def get_hotel_repository():
     """Get hotel repository instance"""
-    return MongoHotelRepository()
+    return MongoHotelRepository(batch_size=settings.MONGODB_STREAM_BATCH_SIZE)
 
 @lru_cache()
 def get_booking_repository():
     """Get booking repository instance"""
-    return MongoBookingRepository()
+    return MongoBookingRepository(batch_size=settings.MONGODB_STREAM_BATCH_SIZE)
 
 @lru_cache()
 def get_user_repository():
     """Get user repository instance"""
     return MongoUserRepository()
 
+@lru_cache()
+def get_booking_stats_repository():
+    """Get booking analytics rollup repository instance"""
+    return MongoBookingStatsRepository()
+
+@lru_cache()
+def get_popularity_tracker() -> PopularityTracker:
+    """Get the process-wide popularity tracker"""
+    return PopularityTracker(
+        get_hotel_repository(),
+        get_booking_repository(),
+        half_life=timedelta(hours=settings.POPULARITY_HALF_LIFE_HOURS)
+    )
+
+@lru_cache()
+def get_hotel_detail_cache() -> HotelDetailCache:
+    """Get the process-wide cache of encoded hotel detail responses"""
+    return HotelDetailCache(
+        render_json,
+        available_encoders(settings.RESPONSE_COMPRESSION_LEVEL),
+        max_entries=settings.HOTEL_DETAIL_CACHE_SIZE,
+        ttl_seconds=settings.HOTEL_DETAIL_CACHE_TTL_SECONDS,
+        tagger=hotel_etag,
+        variant_tagger=encoded_etag
+    )
+
+@lru_cache()
+def get_cache_purger() -> LocalCachePurger:
+    """Get the shared cache purge hook"""
+    return LocalCachePurger()
+
+@lru_cache()
+def get_availability_feed() -> AvailabilityFeed:
+    """Get the process-wide availability pub/sub"""
+    return AvailabilityFeed(max_queue=settings.FEED_QUEUE_SIZE)
+
+def get_repositories() -> list:
+    """Get every Mongo repository, for index management"""
+    return [
+        get_hotel_repository(),
+        get_booking_repository(),
+        get_user_repository(),
+        get_booking_stats_repository()
+    ]
+
 def get_hotel_service() -> HotelService:
     """Get hotel service with dependencies"""
-    return HotelService(get_hotel_repository())
+    return HotelService(
+        get_hotel_repository(),
+        detail_cache=get_hotel_detail_cache(),
+        purger=get_cache_purger(),
+        availability_feed=get_availability_feed()
+    )
+
+def get_hotel_import_service() -> HotelImportService:
+    """Get catalog import service with dependencies"""
+    return HotelImportService(
+        get_hotel_repository(),
+        detail_cache=get_hotel_detail_cache(),
+        purger=get_cache_purger()
+    )
 
 def get_booking_service() -> BookingService:
     """Get booking service with dependencies"""
     return BookingService(
         get_booking_repository(),
-        get_hotel_repository()
+        get_hotel_repository(),
+        hold_duration=timedelta(minutes=settings.BOOKING_HOLD_MINUTES),
+        stats_repository=get_booking_stats_repository(),
+        popularity_tracker=get_popularity_tracker(),
+        availability_feed=get_availability_feed()
     )
 
 def get_search_service() -> SearchService:
     """Get search service with dependencies"""
-    return SearchService(get_hotel_repository())
+    return SearchService(get_hotel_repository(), get_popularity_tracker())
+
+def get_booking_export_service() -> BookingExportService:
+    """Get booking export service with dependencies"""
+    return BookingExportService(get_booking_repository())
+
+def get_analytics_service() -> AnalyticsService:
+    """Get analytics service with dependencies"""
+    return AnalyticsService(get_booking_stats_repository(), get_hotel_repository())
 
 def get_auth_service() -> AuthService:
     """Get authentication service with dependencies"""
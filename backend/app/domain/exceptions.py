@@ -0,0 +1,17 @@
+"""
+Domain exceptions.
+"""
+
+class ConcurrentModificationError(Exception):
+    """Raised when an entity was changed by someone else since it was read"""
+    def __init__(self, entity: str, entity_id: str):
+        super().__init__(f"{entity} {entity_id} was modified concurrently, reload and retry")
+        self.entity = entity
+        self.entity_id = entity_id
+
+class PreconditionFailedError(Exception):
+    """Raised when a conditional write's precondition does not hold for the current entity"""
+    def __init__(self, entity: str, entity_id: str):
+        super().__init__(f"{entity} {entity_id} does not match the given precondition")
+        self.entity = entity
+        self.entity_id = entity_id
@@ -0,0 +1,14 @@
+"""
+Cache purge interface.
+Lets the application invalidate shared caches (CDN, reverse proxy) without
+knowing which one is deployed.
+"""
+from abc import ABC, abstractmethod
+from typing import List
+
+class ICachePurger(ABC):
+    """Purges cached responses tagged with the given surrogate keys"""
+    @abstractmethod
+    async def purge(self, keys: List[str]) -> None:
+        """Purge every cached response carrying any of the keys"""
+        pass
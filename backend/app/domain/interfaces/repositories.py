@@ -3,11 +3,12 @@ Repository interfaces following Dependency Inversion Principle.
 Domain layer defines interfaces, infrastructure implements them.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
-from datetime import date
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, Tuple
+from datetime import date, datetime
 from app.domain.models.hotel import Hotel
-from app.domain.models.booking import Booking
+from app.domain.models.booking import Booking, BookingStatus
 from app.domain.models.user import User
+from app.domain.models.analytics import DailyRoomStats
 class IHotelRepository(ABC):
     """
     Hotel repository interface.
@@ -23,11 +24,49 @@ class IHotelRepository(ABC):
         """Get hotel by ID"""
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, hotel_ids: List[str]) -> List[Hotel]:
+        """Get hotels by IDs in a single query; unknown IDs are skipped"""
+        pass
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Hotel]:
         """Get all hotels with pagination"""
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: Optional[int] = None) -> AsyncIterator[Hotel]:
+        """Stream every hotel, fetching batch_size documents per round trip"""
+        pass
+
+    @abstractmethod
+    async def get_document_by_id(
+        self,
+        hotel_id: str,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the read document of a hotel (no domain hydration), limited to the response fields given"""
+        pass
+
+    @abstractmethod
+    async def get_documents_by_ids(
+        self,
+        hotel_ids: List[str],
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get read documents of hotels by IDs in a single query; unknown IDs are skipped"""
+        pass
+
+    @abstractmethod
+    async def get_all_documents(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get a page of hotel read documents (no domain hydration), limited to the response fields given"""
+        pass
+
     @abstractmethod
     async def update(self, hotel_id: str, hotel: Hotel) -> Optional[Hotel]:
         """Update hotel"""
@@ -53,6 +92,58 @@ class IHotelRepository(ABC):
         """Search hotels with filters"""
         pass
 
+    @abstractmethod
+    def iter_search(
+        self,
+        city: Optional[str] = None,
+        check_in: Optional[date] = None,
+        check_out: Optional[date] = None,
+        guests: int = 1,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        amenities: Optional[List[str]] = None,
+        min_rating: Optional[int] = None,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[Hotel]:
+        """Stream hotels matching the search filters"""
+        pass
+
+    @abstractmethod
+    def iter_search_documents(
+        self,
+        city: Optional[str] = None,
+        check_in: Optional[date] = None,
+        check_out: Optional[date] = None,
+        guests: int = 1,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        amenities: Optional[List[str]] = None,
+        min_rating: Optional[int] = None,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream read documents of hotels matching the search filters, limited to the response fields given"""
+        pass
+
+    @abstractmethod
+    async def get_city_hotel_counts(
+        self,
+        cities: Optional[List[str]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Count hotels per city (optionally only the given cities), largest first"""
+        pass
+
+    @abstractmethod
+    async def upsert_many_by_external_id(self, hotels: List[Hotel]) -> Tuple[int, int, List[Tuple[int, str]]]:
+        """
+        Insert or replace hotels keyed by their supplier external_id in one unordered write.
+        Returns (inserted, updated, [(index in hotels, error message)]).
+        """
+        pass
+
 class IBookingRepository(ABC):
     """
     Booking repository interface.
@@ -64,20 +155,84 @@ class IBookingRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_id(self, booking_id: str) -> Optional[Booking]:
-        """Get booking by ID"""
+    async def create_many(self, bookings: List[Booking]) -> List[Booking]:
+        """Create several bookings in one write"""
         pass
 
     @abstractmethod
-    async def get_by_user_id(self, user_id: str) -> List[Booking]:
+    async def get_by_id(self, booking_id: str, include_archived: bool = False) -> Optional[Booking]:
+        """Get booking by ID, looking in the archive too when include_archived is set"""
+        pass
+
+    @abstractmethod
+    async def get_by_user_id(self, user_id: str, include_archived: bool = False) -> List[Booking]:
         """Get all bookings for a user"""
         pass
 
+    @abstractmethod
+    def iter_by_user_id(
+        self,
+        user_id: str,
+        batch_size: Optional[int] = None,
+        include_archived: bool = False
+    ) -> AsyncIterator[Booking]:
+        """Stream all bookings for a user, newest first"""
+        pass
+
     @abstractmethod
     async def get_by_hotel_id(self, hotel_id: str) -> List[Booking]:
         """Get all bookings for a hotel"""
         pass
 
+    @abstractmethod
+    def iter_by_hotel_id(self, hotel_id: str, batch_size: Optional[int] = None) -> AsyncIterator[Booking]:
+        """Stream all bookings for a hotel by check-in date"""
+        pass
+
+    @abstractmethod
+    async def get_created_since(self, since: datetime, limit: int = 10000) -> List[Booking]:
+        """Get bookings created at or after the given time, oldest first"""
+        pass
+
+    @abstractmethod
+    def iter_created_since(self, since: datetime, batch_size: Optional[int] = None) -> AsyncIterator[Booking]:
+        """Stream bookings created at or after the given time, oldest first"""
+        pass
+
+    @abstractmethod
+    async def list_by_user(
+        self,
+        user_id: str,
+        statuses: Optional[List[BookingStatus]] = None,
+        check_in_from: Optional[date] = None,
+        check_in_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        include_archived: bool = False
+    ) -> Tuple[List[Booking], Optional[str]]:
+        """
+        Get one page of a user's bookings, newest first.
+        Returns the page and the cursor for the next one, if any.
+        """
+        pass
+
+    @abstractmethod
+    async def list_by_hotel(
+        self,
+        hotel_id: str,
+        statuses: Optional[List[BookingStatus]] = None,
+        check_in_from: Optional[date] = None,
+        check_in_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        include_archived: bool = False
+    ) -> Tuple[List[Booking], Optional[str]]:
+        """
+        Get one page of a hotel's bookings by check-in date.
+        Returns the page and the cursor for the next one, if any.
+        """
+        pass
+
     @abstractmethod
     async def update(self, booking_id: str, booking: Booking) -> Optional[Booking]:
         """Update booking"""
@@ -99,6 +254,43 @@ class IBookingRepository(ABC):
         """Check room availability for dates"""
         pass
 
+    @abstractmethod
+    async def check_availability_bulk(
+        self,
+        hotel_id: str,
+        room_type: str,
+        stays: List[Tuple[date, date]]
+    ) -> List[bool]:
+        """
+        Check availability for several stays of one room type.
+        Each accepted stay counts against the stays after it.
+        """
+        pass
+
+    @abstractmethod
+    async def expire_holds(self, now: datetime, batch_size: int) -> List[Booking]:
+        """Cancel one batch of pending bookings whose hold has expired"""
+        pass
+
+    @abstractmethod
+    def iter_export_rows(
+        self,
+        updated_since: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+        hotel_id: Optional[str] = None,
+        check_in_from: Optional[date] = None,
+        check_in_to: Optional[date] = None,
+        include_archived: bool = False,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream flat booking rows for analytics exports"""
+        pass
+
+    @abstractmethod
+    async def archive_finished(self, checked_out_before: date, batch_size: int) -> int:
+        """Move one batch of finished bookings that checked out before the date to the archive"""
+        pass
+
 class IUserRepository(ABC):
     """
     User repository interface.
@@ -129,3 +321,42 @@ class IUserRepository(ABC):
         """Delete user"""
         pass
 
+class IBookingStatsRepository(ABC):
+    """
+    Booking analytics rollup interface.
+    Keeps per-day counters so reports never scan bookings.
+    """
+    @abstractmethod
+    async def record_transitions(
+        self,
+        transitions: List[Tuple[Booking, Optional[BookingStatus], Optional[BookingStatus]]]
+    ) -> None:
+        """Apply booking status changes (booking, old status, new status) to the rollup"""
+        pass
+
+    @abstractmethod
+    async def get_daily_stats(
+        self,
+        hotel_id: str,
+        start_date: date,
+        end_date: date,
+        room_type: Optional[str] = None
+    ) -> List[DailyRoomStats]:
+        """Get rollup rows for a hotel between start_date and end_date (exclusive)"""
+        pass
+
+    @abstractmethod
+    async def rebuild(self) -> int:
+        """Recompute the whole rollup from bookings; returns the number of rows written"""
+        pass
+
+    @abstractmethod
+    async def record_failure(self, booking_ids: List[str], error: str) -> None:
+        """Note transitions that could not be applied, for the next rebuild to reconcile"""
+        pass
+
+    @abstractmethod
+    async def count_failures(self) -> int:
+        """Number of failed transition batches no rebuild has reconciled yet"""
+        pass
+
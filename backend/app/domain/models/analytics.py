@@ -0,0 +1,34 @@
+from typing import Dict, Any
+from datetime import date
+
+class DailyRoomStats:
+    """
+    Daily rollup of booking activity for one hotel room type.
+    Rooms are counted per occupied night; revenue is confirmed revenue.
+    """
+    __slots__ = ("hotel_id", "room_type", "day", "pending_rooms", "confirmed_rooms", "revenue")
+
+    def __init__(self,
+                 hotel_id: str,
+                 room_type: str,
+                 day: date,
+                 pending_rooms: int = 0,
+                 confirmed_rooms: int = 0,
+                 revenue: float = 0.0):
+        self.hotel_id = hotel_id
+        self.room_type = room_type
+        self.day = day
+        self.pending_rooms = pending_rooms
+        self.confirmed_rooms = confirmed_rooms
+        self.revenue = revenue
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary representation"""
+        return {
+            "hotel_id": self.hotel_id,
+            "room_type": self.room_type,
+            "date": self.day.isoformat(),
+            "pending_rooms": self.pending_rooms,
+            "confirmed_rooms": self.confirmed_rooms,
+            "revenue": self.revenue
+        }
@@ -1,6 +1,7 @@
-from typing import Optional, Dict, Any
-from datetime import datetime, date
+from typing import Optional, Dict, Any, List
+from datetime import datetime, date, timedelta
 from enum import Enum
+from app.domain.models.tracking import ChangeTracked
 
 class BookingStatus(str, Enum):
     """Booking status enumeration"""
@@ -17,11 +18,17 @@ class PaymentStatus(str, Enum):
     REFUNDED = "refunded"
     FAILED = "failed"
 
-class Booking:
+class Booking(ChangeTracked):
     """
     Booking domain entity.
     Encapsulates booking business logic and invariants.
     """
+    __slots__ = (
+        "booking_id", "hotel_id", "user_id", "room_type", "check_in_date", "check_out_date",
+        "guests_count", "total_price", "status", "payment_status", "special_requests",
+        "created_at", "updated_at", "hold_expires_at", "version"
+    )
+
     def __init__(self, 
                  booking_id: Optional[str], 
                  hotel_id: str,
@@ -35,7 +42,9 @@ class Booking:
                  payment_status: PaymentStatus = PaymentStatus.PENDING,
                  special_requests: Optional[str] = None,
                  created_at: Optional[datetime] = None,
-                 updated_at: Optional[datetime] = None):
+                 updated_at: Optional[datetime] = None,
+                 hold_expires_at: Optional[datetime] = None,
+                 version: int = 0):
         self.booking_id = booking_id
         self.hotel_id = hotel_id
         self.user_id = user_id
@@ -49,9 +58,12 @@ class Booking:
         self.special_requests = special_requests
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        self.hold_expires_at = hold_expires_at
+        self.version = version
         self._validate_dates()
         self._validate_guests()
         self._validate_price()
+        self.mark_clean()
     
     def _validate_dates(self):
         """Validate check-in and check-out dates"""
@@ -78,6 +90,26 @@ class Booking:
         """Calculate number of nights"""
         return (self.check_out_date - self.check_in_date).days
 
+    def get_stay_nights(self) -> List[date]:
+        """List the dates of each night of the stay"""
+        return [self.check_in_date + timedelta(days=i) for i in range(self.get_nights_count())]
+
+    def get_nightly_rate(self) -> float:
+        """Average price per night"""
+        return self.total_price / self.get_nights_count()
+
+    def place_hold(self, duration: timedelta):
+        """Reserve inventory for a pending booking until the hold expires"""
+        if self.status != BookingStatus.PENDING:
+            raise ValueError(f"Cannot place hold on booking with status: {self.status}")
+        self.hold_expires_at = datetime.utcnow() + duration
+
+    def is_hold_expired(self, now: Optional[datetime] = None) -> bool:
+        """Check if a pending booking's hold has lapsed"""
+        if self.status != BookingStatus.PENDING or self.hold_expires_at is None:
+            return False
+        return self.hold_expires_at <= (now or datetime.utcnow())
+
     def can_cancel(self) -> bool:
         """Check if booking can be cancelled"""
         return self.status in [BookingStatus.PENDING, BookingStatus.CONFIRMED]
@@ -87,13 +119,17 @@ class Booking:
         if not self.can_cancel():
             raise ValueError(f"Cannot cancel booking with status: {self.status}")
         self.status = BookingStatus.CANCELLED
+        self.hold_expires_at = None
         self.updated_at = datetime.utcnow()
 
     def confirm(self):
         """Confirm the booking"""
         if self.status != BookingStatus.PENDING:
             raise ValueError(f"Cannot confirm booking with status: {self.status}")
+        if self.is_hold_expired():
+            raise ValueError("Booking hold has expired")
         self.status = BookingStatus.CONFIRMED
+        self.hold_expires_at = None
         self.updated_at = datetime.utcnow()
 
     def to_dict(self) -> Dict[str, Any]:
@@ -103,13 +139,15 @@ class Booking:
             "hotel_id": self.hotel_id,
             "user_id": self.user_id,
             "room_type": self.room_type,
-            "check_in_date": self.check_in_date.isoformat(),
-            "check_out_date": self.check_out_date.isoformat(),
+            "check_in_date": self.check_in_date,
+            "check_out_date": self.check_out_date,
             "guests_count": self.guests_count,
             "total_price": self.total_price,
             "status": self.status,
             "payment_status": self.payment_status,
             "special_requests": self.special_requests,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "hold_expires_at": self.hold_expires_at,
+            "version": self.version
         }
\ No newline at end of file
@@ -1,6 +1,8 @@
+import sys
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
+from app.domain.models.tracking import ChangeTracked
 
 class HotelCategory(str, Enum):
     """Hotel category enumeration"""
@@ -23,15 +25,28 @@ class Amenity(str, Enum):
     AIRPORT_SHUTTLE = "airport_shuttle"
     PET_FRIENDLY = "pet_friendly"
 
+# One bit per amenity, for O(1) membership tests
+AMENITY_BITS: Dict[Amenity, int] = {amenity: 1 << i for i, amenity in enumerate(Amenity)}
+
+def amenity_mask(amenities: List[Amenity]) -> int:
+    """Fold amenities into a bitset; unknown values are ignored"""
+    mask = 0
+    for amenity in amenities:
+        mask |= AMENITY_BITS.get(amenity, 0)
+    return mask
+
 class Room:
     """Room value object"""
+    __slots__ = ("room_type", "price_per_night", "capacity", "available_count", "description")
+
     def __init__(self, 
                  room_type: str, 
                  price_per_night: float,
                  capacity: int,
                  available_count: int,
                  description: str = ""):
-        self.room_type = room_type
+        # Room types repeat across the whole catalog
+        self.room_type = sys.intern(room_type)
         self.price_per_night = price_per_night
         self.capacity = capacity
         self.available_count = available_count
@@ -48,6 +63,8 @@ class Room:
     
 class Location:
     """Location value object"""
+    __slots__ = ("address", "city", "country", "latitude", "longitude", "postal_code")
+
     def __init__(self, 
                  address: str, 
                  city: str, 
@@ -56,8 +73,8 @@ class Location:
                  longitude: float,
                  postal_code: Optional[str] = None):
         self.address = address
-        self.city = city
-        self.country = country
+        self.city = sys.intern(city)
+        self.country = sys.intern(country)
         self.latitude = latitude
         self.longitude = longitude
         self.postal_code = postal_code
@@ -72,11 +89,20 @@ class Location:
             "postal_code": self.postal_code
         }
     
-class Hotel:
+class Hotel(ChangeTracked):
     """
     Hotel domain entity.
     Represents core hotel business logic and rules.
+    Amenities are mirrored in a bitset and room aggregates are cached; both
+    are refreshed when amenities or rooms are reassigned or marked dirty.
     """
+    __slots__ = (
+        "hotel_id", "name", "description", "location", "category", "star_rating",
+        "amenities", "rooms", "images", "check_in_time", "check_out_time", "policies",
+        "created_at", "updated_at", "version", "external_id",
+        "_amenity_bits", "_minimum_price", "_available_rooms"
+    )
+
     def __init__(self, 
                  hotel_id: Optional[str], 
                  name: str,
@@ -91,7 +117,9 @@ class Hotel:
                  check_out_time: str = "11:00",
                  policies: Optional[Dict[str, str]] = None,
                  created_at: Optional[datetime] = None,
-                 updated_at: Optional[datetime] = None):
+                 updated_at: Optional[datetime] = None,
+                 version: int = 0,
+                 external_id: Optional[str] = None):
         self.hotel_id = hotel_id
         self.name = name
         self.description = description
@@ -106,6 +134,29 @@ class Hotel:
         self.policies = policies or {}
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        self.version = version
+        self.external_id = external_id
+        self.mark_clean()
+
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name in ("amenities", "rooms"):
+            self._refresh_derived(name)
+
+    def mark_dirty(self, *fields: str):
+        """Flag fields changed in place and refresh values derived from them"""
+        super().mark_dirty(*fields)
+        for field in fields:
+            if field in ("amenities", "rooms"):
+                self._refresh_derived(field)
+
+    def _refresh_derived(self, field: str):
+        """Recompute the amenity bitset or drop the cached room aggregates"""
+        if field == "amenities":
+            self._amenity_bits = amenity_mask(self.amenities)
+        else:
+            self._minimum_price = None
+            self._available_rooms = None
         
     @staticmethod
     def _validate_star_rating(rating: int) -> int:
@@ -116,17 +167,19 @@ class Hotel:
 
     def get_minimum_price(self) -> float:
         """Get the minimum room price for this hotel"""
-        if not self.rooms:
-            return 0.0
-        return min(room.price_per_night for room in self.rooms)
+        if self._minimum_price is None:
+            self._minimum_price = min((room.price_per_night for room in self.rooms), default=0.0)
+        return self._minimum_price
 
     def get_available_rooms_count(self) -> int:
         """Get total number of available rooms"""
-        return sum(room.available_count for room in self.rooms)
+        if self._available_rooms is None:
+            self._available_rooms = sum(room.available_count for room in self.rooms)
+        return self._available_rooms
 
     def has_amenity(self, amenity: Amenity) -> bool:
         """Check if hotel has specific amenity"""
-        return amenity in self.amenities
+        return bool(self._amenity_bits & AMENITY_BITS.get(amenity, 0))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert hotel to dictionary representation"""
@@ -143,6 +196,8 @@ class Hotel:
             "check_in_time": self.check_in_time,
             "check_out_time": self.check_out_time,
             "policies": self.policies,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "version": self.version,
+            "external_id": self.external_id
         }
\ No newline at end of file
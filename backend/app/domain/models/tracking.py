@@ -0,0 +1,27 @@
+from typing import Set
+
+class ChangeTracked:
+    """
+    Mixin recording which public attributes changed since the entity was
+    loaded or saved, so repositories can persist only the changed fields.
+    In-place mutations of nested values must call mark_dirty explicitly.
+    """
+    __slots__ = ("_dirty", "_tracking")
+
+    def __setattr__(self, name: str, value):
+        if not name.startswith("_") and getattr(self, "_tracking", False):
+            self._dirty.add(name)
+        object.__setattr__(self, name, value)
+
+    def mark_dirty(self, *fields: str):
+        """Flag fields changed in place (e.g. a mutated dict)"""
+        self._dirty.update(fields)
+
+    def mark_clean(self):
+        """Forget recorded changes and start tracking from the current state"""
+        object.__setattr__(self, "_dirty", set())
+        object.__setattr__(self, "_tracking", True)
+
+    def get_dirty_fields(self) -> Set[str]:
+        """Get the names of fields changed since the last mark_clean"""
+        return set(getattr(self, "_dirty", ()))
@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
+from app.domain.models.tracking import ChangeTracked
 
 class UserRole(str, Enum):
     """User role enumeration"""
@@ -8,11 +9,16 @@ class UserRole(str, Enum):
     HOTEL_OWNER = "hotel_owner"
     ADMIN = "admin"
 
-class User:
+class User(ChangeTracked):
     """
     User domain entity.
     Handles user authentication and profile management.
     """
+    __slots__ = (
+        "user_id", "email", "full_name", "phone_number", "role", "is_active", "is_verified",
+        "preferences", "created_at", "updated_at", "version"
+    )
+
     def __init__(self, 
                  user_id: Optional[str], 
                  email: str,
@@ -23,7 +29,8 @@ class User:
                  is_verified: bool = False,
                  preferences: Optional[Dict[str, Any]] = None,
                  created_at: Optional[datetime] = None,
-                 updated_at: Optional[datetime] = None):
+                 updated_at: Optional[datetime] = None,
+                 version: int = 0):
         self.user_id = user_id
         self.email = email
         self.full_name = full_name
@@ -34,6 +41,8 @@ class User:
         self.preferences = preferences or {}
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        self.version = version
+        self.mark_clean()
 
     def has_permission(self, permission: str) -> bool:
         """Check if user has specific permission based on role"""
@@ -52,6 +61,7 @@ class User:
     def update_preferences(self, new_preferences: Dict[str, Any]):
         """Update user preferences"""
         self.preferences.update(new_preferences)
+        self.mark_dirty("preferences")
         self.updated_at = datetime.utcnow()
 
     def to_dict(self) -> Dict[str, Any]:
@@ -65,6 +75,7 @@ class User:
             "is_active": self.is_active,
             "is_verified": self.is_verified,
             "preferences": self.preferences,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "version": self.version
         }
\ No newline at end of file
@@ -0,0 +1,371 @@
+"""
+Synthetic data generator for load testing.
+
+Generates N hotels across M cities with a Zipf-like skew (a few cities hold
+most of the catalog), star-dependent room mixes, prices and amenities, plus
+users and bookings whose check-in dates follow a seasonal curve. The same
+--seed and --start-date always produce the same documents, ObjectIds
+included; only timestamps and statuses relative to today follow the run date.
+
+Documents are written directly in their stored shape with concurrent,
+unordered insert_many batches. Bookings are not checked against room
+inventory, so popular hotels end up overbooked, which is useful for
+stressing availability queries. Indexes are created once the data is
+loaded; run `python -m app.rebuild_booking_stats` afterwards to refresh
+the analytics rollup.
+
+Usage (from the backend directory):
+    python -m app.generate_load_data --hotels 100000 --cities 300 --users 50000 \\
+        --bookings 1000000 [--seed 42] [--batch-size 1000] [--concurrency 4] [--drop]
+"""
+import argparse
+import asyncio
+import bisect
+import itertools
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.indexes import ensure_indexes
+from app.infrastructure.database.bson_dates import date_to_bson
+from app.domain.models.hotel import HotelCategory, Amenity
+from app.domain.models.user import UserRole
+from app.domain.models.booking import BookingStatus, PaymentStatus
+from app.dependencies import get_repositories
+
+# (city, country, latitude, longitude, price level)
+BASE_CITIES = [
+    ("Paris", "France", 48.8566, 2.3522, 1.4),
+    ("London", "United Kingdom", 51.5074, -0.1278, 1.5),
+    ("New York", "United States", 40.7128, -74.0060, 1.6),
+    ("Tokyo", "Japan", 35.6762, 139.6503, 1.3),
+    ("Barcelona", "Spain", 41.3851, 2.1734, 1.1),
+    ("Rome", "Italy", 41.9028, 12.4964, 1.2),
+    ("Berlin", "Germany", 52.5200, 13.4050, 1.0),
+    ("Amsterdam", "Netherlands", 52.3676, 4.9041, 1.3),
+    ("Dubai", "United Arab Emirates", 25.2048, 55.2708, 1.4),
+    ("Singapore", "Singapore", 1.3521, 103.8198, 1.3),
+    ("Bangkok", "Thailand", 13.7563, 100.5018, 0.6),
+    ("Istanbul", "Turkey", 41.0082, 28.9784, 0.7),
+    ("Lisbon", "Portugal", 38.7223, -9.1393, 0.9),
+    ("Prague", "Czech Republic", 50.0755, 14.4378, 0.8),
+    ("Vienna", "Austria", 48.2082, 16.3738, 1.1),
+    ("Sydney", "Australia", -33.8688, 151.2093, 1.3),
+    ("Mexico City", "Mexico", 19.4326, -99.1332, 0.6),
+    ("Cape Town", "South Africa", -33.9249, 18.4241, 0.7),
+    ("Rio de Janeiro", "Brazil", -22.9068, -43.1729, 0.7),
+    ("Seoul", "South Korea", 37.5665, 126.9780, 1.0),
+]
+
+STAR_WEIGHTS = {1: 5, 2: 15, 3: 40, 4: 28, 5: 12}
+STAR_BASE_PRICE = {1: 45.0, 2: 65.0, 3: 95.0, 4: 160.0, 5: 320.0}
+STAR_CATEGORIES = {
+    1: [HotelCategory.BUDGET],
+    2: [HotelCategory.BUDGET, HotelCategory.STANDARD],
+    3: [HotelCategory.STANDARD, HotelCategory.BOUTIQUE],
+    4: [HotelCategory.STANDARD, HotelCategory.BOUTIQUE, HotelCategory.RESORT],
+    5: [HotelCategory.LUXURY, HotelCategory.RESORT],
+}
+
+# (room type, capacity, price multiplier, mix weight)
+ROOM_TYPES = [
+    ("Single Room", 1, 0.7, 3),
+    ("Double Room", 2, 1.0, 10),
+    ("Twin Room", 2, 1.0, 6),
+    ("Family Room", 4, 1.6, 3),
+    ("Junior Suite", 3, 2.2, 2),
+    ("Suite", 4, 3.0, 1),
+]
+
+# Probability of each amenity at 1 star, plus the increase per extra star
+AMENITY_ODDS = {
+    Amenity.WIFI: (0.85, 0.04),
+    Amenity.PARKING: (0.30, 0.08),
+    Amenity.POOL: (0.05, 0.15),
+    Amenity.GYM: (0.05, 0.15),
+    Amenity.SPA: (0.00, 0.12),
+    Amenity.RESTAURANT: (0.20, 0.17),
+    Amenity.BAR: (0.20, 0.15),
+    Amenity.ROOM_SERVICE: (0.00, 0.18),
+    Amenity.AIRPORT_SHUTTLE: (0.05, 0.06),
+    Amenity.PET_FRIENDLY: (0.15, 0.02),
+}
+
+# Relative demand per calendar month (summer peak, December bump)
+MONTH_WEIGHTS = [0.6, 0.6, 0.8, 0.9, 1.0, 1.3, 1.6, 1.7, 1.1, 0.9, 0.7, 1.0]
+WEEKEND_BOOST = 1.3  # check-ins on Friday and Saturday
+NIGHTS_WEIGHTS = {1: 20, 2: 25, 3: 20, 4: 10, 5: 8, 7: 10, 10: 4, 14: 3}
+LEAD_TIME_MEAN_DAYS = 30
+CITY_SKEW = 1.1
+
+def _object_id(rng: random.Random) -> ObjectId:
+    """Draw a deterministic ObjectId"""
+    return ObjectId(rng.getrandbits(96).to_bytes(12, "big"))
+
+def _cumulative(weights: List[float]) -> List[float]:
+    return list(itertools.accumulate(weights))
+
+class LoadDataGenerator:
+    """Deterministic generator of hotel, user and booking documents"""
+    def __init__(self, seed: int, cities: int, start_date: date, days: int):
+        self.seed = seed
+        self.now = datetime.utcnow().replace(microsecond=0)
+        self.cities = self._make_cities(random.Random(f"{seed}:cities"), cities)
+        self.city_cum_weights = _cumulative([1 / (rank + 1) ** CITY_SKEW for rank in range(cities)])
+        self.days = [start_date + timedelta(days=i) for i in range(days)]
+        self.day_cum_weights = _cumulative([
+            MONTH_WEIGHTS[day.month - 1] * (WEEKEND_BOOST if day.weekday() in (4, 5) else 1.0)
+            for day in self.days
+        ])
+        # city index -> [(hotel id, star rating, [(room type, capacity, price)])]
+        self.hotels_by_city: List[List[Tuple[ObjectId, int, List[Tuple[str, int, float]]]]] = [[] for _ in range(cities)]
+        self.user_ids: List[ObjectId] = []
+
+    @staticmethod
+    def _make_cities(rng: random.Random, count: int) -> List[Tuple[str, str, float, float, float]]:
+        """Take the real cities first, then invent satellite towns around them"""
+        cities = list(BASE_CITIES[:count])
+        for i in range(len(cities), count):
+            name, country, lat, lon, level = BASE_CITIES[i % len(BASE_CITIES)]
+            cities.append((
+                f"{name} District {i // len(BASE_CITIES)}", country,
+                lat + rng.uniform(-0.5, 0.5), lon + rng.uniform(-0.5, 0.5),
+                level * rng.uniform(0.6, 1.0)
+            ))
+        return cities
+
+    def hotels(self, count: int) -> Iterator[Dict[str, Any]]:
+        """Generate hotel documents, remembering what bookings need"""
+        rng = random.Random(f"{self.seed}:hotels")
+        stars, star_weights = zip(*STAR_WEIGHTS.items())
+        room_weights = [weight for *_, weight in ROOM_TYPES]
+        for i in range(count):
+            city_index = bisect.bisect_left(self.city_cum_weights, rng.random() * self.city_cum_weights[-1])
+            city, country, lat, lon, level = self.cities[city_index]
+            star_rating = rng.choices(stars, star_weights)[0]
+            room_count = min(len(ROOM_TYPES), 1 + int(rng.expovariate(1 / (star_rating * 0.6))))
+            room_types = set()
+            while len(room_types) < room_count:
+                room_types.add(rng.choices(range(len(ROOM_TYPES)), room_weights)[0])
+            rooms = []
+            for index in sorted(room_types):
+                room_type, capacity, multiplier, _ = ROOM_TYPES[index]
+                price = STAR_BASE_PRICE[star_rating] * multiplier * level * rng.lognormvariate(0, 0.25)
+                rooms.append({
+                    "room_type": room_type,
+                    "price_per_night": round(price, 2),
+                    "capacity": capacity,
+                    "available_count": max(1, int(rng.gauss(star_rating * 8, star_rating * 3))),
+                    "description": f"{room_type} for up to {capacity} guests"
+                })
+            amenities = [
+                amenity.value for amenity, (base, step) in AMENITY_ODDS.items()
+                if rng.random() < base + step * (star_rating - 1)
+            ]
+            hotel_id = _object_id(rng)
+            created_at = self.now - timedelta(days=rng.randint(0, 1500))
+            self.hotels_by_city[city_index].append((
+                hotel_id, star_rating,
+                [(r["room_type"], r["capacity"], r["price_per_night"]) for r in rooms]
+            ))
+            yield {
+                "_id": hotel_id,
+                "name": f"{city} {rng.choice(['Grand', 'Central', 'Park', 'Harbour', 'Royal', 'City', 'Garden'])} "
+                        f"{rng.choice(['Hotel', 'Inn', 'Suites', 'Lodge', 'Residence'])} {i}",
+                "description": f"A {star_rating}-star stay in {city}, {country}.",
+                "location": {
+                    "address": f"{rng.randint(1, 999)} Load Test Street",
+                    "city": city,
+                    "country": country,
+                    "latitude": round(lat + rng.uniform(-0.05, 0.05), 6),
+                    "longitude": round(lon + rng.uniform(-0.05, 0.05), 6),
+                    "postal_code": f"{rng.randint(10000, 99999)}"
+                },
+                "category": rng.choice(STAR_CATEGORIES[star_rating]).value,
+                "star_rating": star_rating,
+                "amenities": amenities,
+                "rooms": rooms,
+                "images": [],
+                "check_in_time": "14:00",
+                "check_out_time": "11:00",
+                "policies": {"cancellation": "Free cancellation up to 24 hours before check-in"},
+                "created_at": created_at,
+                "updated_at": created_at,
+                "version": 0,
+                "external_id": None
+            }
+
+    def users(self, count: int, password_hash: str) -> Iterator[Dict[str, Any]]:
+        """Generate guest user documents"""
+        rng = random.Random(f"{self.seed}:users")
+        for i in range(count):
+            user_id = _object_id(rng)
+            self.user_ids.append(user_id)
+            created_at = self.now - timedelta(days=rng.randint(0, 1500))
+            yield {
+                "_id": user_id,
+                "email": f"loadtest.{self.seed}.{i}@example.com",
+                "full_name": f"Load Test User {i}",
+                "phone_number": None,
+                "role": UserRole.GUEST.value,
+                "is_active": True,
+                "is_verified": True,
+                "preferences": {
+                    "password_hash": password_hash,
+                    "currency": rng.choice(["USD", "EUR", "GBP"]),
+                    "language": "en"
+                },
+                "created_at": created_at,
+                "updated_at": created_at,
+                "version": 0
+            }
+
+    def bookings(self, count: int) -> Iterator[Dict[str, Any]]:
+        """Generate bookings with seasonal check-ins across the generated hotels"""
+        rng = random.Random(f"{self.seed}:bookings")
+        occupied = [i for i, hotels in enumerate(self.hotels_by_city) if hotels]
+        if not occupied or not self.user_ids:
+            return
+        city_cum_weights = _cumulative([1 / (rank + 1) ** CITY_SKEW for rank in occupied])
+        nights_options, nights_weights = zip(*NIGHTS_WEIGHTS.items())
+        today = self.now.date()
+        for _ in range(count):
+            city_hotels = self.hotels_by_city[
+                occupied[bisect.bisect_left(city_cum_weights, rng.random() * city_cum_weights[-1])]
+            ]
+            # Better-rated hotels draw more demand
+            hotel_id, star_rating, rooms = max(
+                (rng.choice(city_hotels) for _ in range(2)), key=lambda hotel: hotel[1]
+            )
+            room_type, capacity, price = rng.choice(rooms)
+            check_in = self.days[bisect.bisect_left(self.day_cum_weights, rng.random() * self.day_cum_weights[-1])]
+            nights = rng.choices(nights_options, nights_weights)[0]
+            check_out = check_in + timedelta(days=nights)
+            lead_days = min(365, int(rng.expovariate(1 / LEAD_TIME_MEAN_DAYS)))
+            created_at = min(
+                datetime.combine(check_in, datetime.min.time()) - timedelta(days=lead_days, seconds=rng.randint(0, 86399)),
+                self.now
+            )
+
+            roll = rng.random()
+            if check_out <= today:
+                status = BookingStatus.COMPLETED if roll < 0.85 else (
+                    BookingStatus.CANCELLED if roll < 0.95 else BookingStatus.NO_SHOW
+                )
+            else:
+                status = BookingStatus.CONFIRMED if roll < 0.85 else BookingStatus.CANCELLED
+            payment_status = {
+                BookingStatus.COMPLETED: PaymentStatus.PAID,
+                BookingStatus.CONFIRMED: PaymentStatus.PAID,
+                BookingStatus.NO_SHOW: PaymentStatus.PAID,
+                BookingStatus.CANCELLED: PaymentStatus.REFUNDED,
+            }[status]
+
+            yield {
+                "_id": _object_id(rng),
+                "hotel_id": str(hotel_id),
+                "user_id": str(rng.choice(self.user_ids)),
+                "room_type": room_type,
+                "check_in_date": date_to_bson(check_in),
+                "check_out_date": date_to_bson(check_out),
+                "guests_count": rng.randint(1, capacity),
+                "total_price": round(price * nights, 2),
+                "status": status.value,
+                "payment_status": payment_status.value,
+                "special_requests": None,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "hold_expires_at": None,
+                "version": 0
+            }
+
+def _batches(docs: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    while True:
+        batch = list(itertools.islice(docs, size))
+        if not batch:
+            return
+        yield batch
+
+async def write_collection(name: str, docs: Iterator[Dict[str, Any]], batch_size: int, concurrency: int) -> int:
+    """Insert documents with up to `concurrency` unordered insert_many batches in flight"""
+    collection = MongoDB.get_database()[name]
+    semaphore = asyncio.Semaphore(concurrency)
+    inserted = 0
+    failed = 0
+    started = time.monotonic()
+    tasks = set()
+
+    async def insert(batch: List[Dict[str, Any]]):
+        nonlocal inserted, failed
+        try:
+            result = await collection.insert_many(batch, ordered=False)
+            inserted += len(result.inserted_ids)
+        except BulkWriteError as e:
+            inserted += e.details.get("nInserted", 0)
+            failed += len(e.details.get("writeErrors", []))
+        finally:
+            semaphore.release()
+
+    for number, batch in enumerate(_batches(docs, batch_size), start=1):
+        await semaphore.acquire()
+        task = asyncio.create_task(insert(batch))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        if number % 20 == 0:
+            print(f"  {name}: {inserted} inserted ({inserted / (time.monotonic() - started):.0f}/s)")
+    await asyncio.gather(*tasks)
+
+    elapsed = time.monotonic() - started
+    rate = inserted / elapsed if elapsed else 0.0
+    print(f"✅ {name}: {inserted} inserted in {elapsed:.1f}s ({rate:.0f}/s)")
+    if failed:
+        print(f"⚠️ {name}: {failed} documents rejected (already present?)")
+    return inserted
+
+async def main():
+    """Generate and load a synthetic data set"""
+    parser = argparse.ArgumentParser(description="Generate synthetic hotels, users and bookings")
+    parser.add_argument("--hotels", type=int, default=10000)
+    parser.add_argument("--cities", type=int, default=50)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--bookings", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--start-date", type=date.fromisoformat, default=None,
+                        help="First check-in date (default: one year ago)")
+    parser.add_argument("--days", type=int, default=730, help="Length of the check-in window")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--drop", action="store_true", help="Drop hotels, users and bookings first")
+    args = parser.parse_args()
+    if args.cities < 1 or args.days < 1:
+        parser.error("--cities and --days must be positive")
+
+    from passlib.context import CryptContext
+    password_hash = CryptContext(schemes=["bcrypt"], deprecated="auto").hash("password123")
+
+    start_date = args.start_date or (date.today() - timedelta(days=365))
+    generator = LoadDataGenerator(args.seed, args.cities, start_date, args.days)
+
+    await MongoDB.connect_to_mongo()
+    try:
+        db = MongoDB.get_database()
+        if args.drop:
+            for name in ("hotels", "users", "bookings"):
+                await db[name].drop()
+                print(f"🗑️ Dropped {name}")
+        print(f"🌱 Generating {args.hotels} hotels in {args.cities} cities (seed {args.seed})")
+        await write_collection("hotels", generator.hotels(args.hotels), args.batch_size, args.concurrency)
+        await write_collection("users", generator.users(args.users, password_hash), args.batch_size, args.concurrency)
+        await write_collection("bookings", generator.bookings(args.bookings), args.batch_size, args.concurrency)
+
+        print("📇 Creating indexes...")
+        await ensure_indexes(get_repositories())
+        print("ℹ️ Run `python -m app.rebuild_booking_stats` to refresh the analytics rollup")
+    finally:
+        await MongoDB.close_mongo_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
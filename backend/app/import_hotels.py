@@ -0,0 +1,80 @@
+"""
+Bulk import of a supplier hotel catalog.
+
+Reads an NDJSON file (one hotel per line) or a CSV file (header row;
+location columns address/city/country/latitude/longitude/postal_code,
+`|`-separated amenities and images, rooms and policies as JSON) and
+upserts hotels by their `external_id`, so re-running an import updates
+hotels in place instead of duplicating them.
+
+Usage (from the backend directory):
+    python -m app.import_hotels catalog.ndjson [--format ndjson|csv|msgpack] [--chunk-size 1000]
+"""
+import argparse
+import asyncio
+import gzip
+from typing import AsyncIterator
+from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.indexes import ensure_indexes
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from app.application.dto.import_dto import ImportFormat
+from app.application.services.hotel_import_service import HotelImportService, HotelImportReport, iter_msgpack_records
+
+async def read_lines(path: str) -> AsyncIterator[str]:
+    """Yield the lines of a (optionally gzipped) catalog file"""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", newline="") as f:
+        for line in f:
+            yield line
+
+async def read_chunks(path: str, size: int = 1 << 16) -> AsyncIterator[bytes]:
+    """Yield the bytes of a (optionally gzipped) binary catalog file"""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        while chunk := f.read(size):
+            yield chunk
+
+def print_progress(report: HotelImportReport):
+    """Print one progress line per written chunk"""
+    print(
+        f"  {report.processed} processed, {report.inserted} inserted, {report.updated} updated, "
+        f"{report.failed} failed ({report.hotels_per_second:.0f} hotels/s)"
+    )
+
+async def main():
+    """Import a catalog file"""
+    parser = argparse.ArgumentParser(description="Bulk import hotels from NDJSON, CSV or MessagePack")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat], help="Defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--max-errors", type=int, default=100, help="Error messages to keep in the report")
+    args = parser.parse_args()
+
+    if args.format:
+        fmt = ImportFormat(args.format)
+    elif ".csv" in args.path:
+        fmt = ImportFormat.CSV
+    elif ".msgpack" in args.path:
+        fmt = ImportFormat.MSGPACK
+    else:
+        fmt = ImportFormat.NDJSON
+    source = iter_msgpack_records(read_chunks(args.path)) if fmt == ImportFormat.MSGPACK else read_lines(args.path)
+    await MongoDB.connect_to_mongo()
+    try:
+        repository = MongoHotelRepository()
+        await ensure_indexes([repository])
+        service = HotelImportService(repository, chunk_size=args.chunk_size, max_errors=args.max_errors)
+        result = await service.import_lines(source, fmt, on_progress=print_progress)
+    finally:
+        await MongoDB.close_mongo_connection()
+
+    for error in result.errors:
+        print(f"⚠️ line {error.line}: {error.message}")
+    print(
+        f"✅ Imported {result.inserted + result.updated} hotels "
+        f"({result.inserted} new, {result.updated} updated, {result.failed} failed) "
+        f"in {result.elapsed_seconds:.1f}s ({result.hotels_per_second:.0f} hotels/s)"
+    )
+
+if __name__ == "__main__":
+    asyncio.run(main())
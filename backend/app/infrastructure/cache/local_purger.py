@@ -0,0 +1,17 @@
+from collections import deque
+from datetime import datetime
+from typing import Deque, List, Tuple
+from app.domain.interfaces.cache import ICachePurger
+
+class LocalCachePurger(ICachePurger):
+    """
+    Stand-in purger for deployments without a CDN.
+    Logs purges and keeps the most recent ones for inspection.
+    """
+    def __init__(self, history_size: int = 100):
+        self.history: Deque[Tuple[datetime, List[str]]] = deque(maxlen=history_size)
+
+    async def purge(self, keys: List[str]) -> None:
+        """Record the purge request"""
+        self.history.append((datetime.utcnow(), list(keys)))
+        print(f"🧽 Cache purge: {' '.join(keys)}")
@@ -0,0 +1,46 @@
+"""
+Conversions between domain dates and BSON Date values.
+BSON has no date-only type, so calendar dates are stored as midnight UTC.
+Readers still accept legacy ISO strings until app.migrate_dates has run;
+queries match them only for collections the migration has not finished.
+"""
+from typing import Any, Optional, Set
+from datetime import date, datetime
+
+# app.migrate_dates checkpoints each collection as "<MIGRATION_ID>.<collection>"
+MIGRATION_ID = "bson_dates"
+MIGRATIONS_COLLECTION = "migrations"
+
+# Collections whose migration has finished, as last read from the checkpoints
+_migrated_collections: Set[str] = set()
+
+async def load_migration_state(db) -> Set[str]:
+    """Read which collections app.migrate_dates has finished converting"""
+    prefix = f"{MIGRATION_ID}."
+    cursor = db[MIGRATIONS_COLLECTION].find({"_id": {"$regex": f"^{MIGRATION_ID}\\."}, "done": True}, {"_id": 1})
+    migrated = {doc["_id"][len(prefix):] async for doc in cursor}
+    _migrated_collections.clear()
+    _migrated_collections.update(migrated)
+    return migrated
+
+def has_legacy_dates(*collections: str) -> bool:
+    """Whether any of the collections may still hold legacy ISO string dates"""
+    return any(name not in _migrated_collections for name in collections)
+
+def date_to_bson(value: date) -> datetime:
+    """Store a calendar date as a BSON Date at midnight UTC"""
+    return datetime(value.year, value.month, value.day)
+
+def bson_to_date(value: Any) -> date:
+    """Read a calendar date stored as a BSON Date or a legacy ISO string"""
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(value[:10])
+
+def bson_to_datetime(value: Any) -> Optional[datetime]:
+    """Read a timestamp stored as a BSON Date or a legacy ISO string"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
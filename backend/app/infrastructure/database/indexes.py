@@ -0,0 +1,99 @@
+"""
+Declarative index management.
+Repositories declare the indexes they need (INDEXES) and the query shapes
+they issue (query_shapes(), built by the same code as the live queries);
+this module creates the former and can verify with explain() that none of
+the latter falls back to a collection scan.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from pymongo import IndexModel
+from app.infrastructure.database.mongodb import MongoDB
+
+class QueryShape:
+    """A representative query a repository issues, used for plan verification"""
+    def __init__(self, name: str, filter: Dict[str, Any], sort: Optional[List[Tuple[str, int]]] = None):
+        self.name = name
+        self.filter = filter
+        self.sort = sort
+
+class IndexReport:
+    """Outcome of ensuring the indexes of one collection"""
+    def __init__(self, collection: str, created: List[str], existing: List[str]):
+        self.collection = collection
+        self.created = created
+        self.existing = existing
+
+class QueryPlanReport:
+    """Winning plan stages for one query shape"""
+    def __init__(self, collection: str, shape: str, stages: List[str]):
+        self.collection = collection
+        self.shape = shape
+        self.stages = stages
+
+    @property
+    def is_collection_scan(self) -> bool:
+        return "COLLSCAN" in self.stages
+
+async def ensure_collection_indexes(collection, indexes: Sequence[IndexModel]) -> IndexReport:
+    """Create any missing declared indexes on a collection"""
+    existing_names = set((await collection.index_information()).keys())
+    declared_names = [index.document["name"] for index in indexes]
+    missing = [index for index in indexes if index.document["name"] not in existing_names]
+    if missing:
+        # create_indexes is idempotent for identical specs
+        await collection.create_indexes(missing)
+    return IndexReport(
+        collection=collection.name,
+        created=[index.document["name"] for index in missing],
+        existing=[name for name in declared_names if name in existing_names]
+    )
+
+async def ensure_indexes(repositories: Sequence[Any]) -> List[IndexReport]:
+    """Create the declared indexes of every repository"""
+    db = MongoDB.get_database()
+    reports = []
+    for repository in repositories:
+        indexes = getattr(repository, "INDEXES", [])
+        if indexes:
+            reports.append(await ensure_collection_indexes(db[repository.collection_name], indexes))
+        # Secondary collections a repository owns (e.g. an archive)
+        for name, extra_indexes in getattr(repository, "COLLECTION_INDEXES", {}).items():
+            reports.append(await ensure_collection_indexes(db[name], extra_indexes))
+    return reports
+
+def _plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Flatten the stage names of an explain() plan tree"""
+    stages = [plan["stage"]] if "stage" in plan else []
+    if "inputStage" in plan:
+        stages += _plan_stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        stages += _plan_stages(child)
+    # Slot-based engine plans nest the classic plan under queryPlan
+    if "queryPlan" in plan:
+        stages += _plan_stages(plan["queryPlan"])
+    return stages
+
+async def explain_query_shapes(repositories: Sequence[Any]) -> List[QueryPlanReport]:
+    """Run explain() on every declared query shape"""
+    db = MongoDB.get_database()
+    reports = []
+    for repository in repositories:
+        collection = db[repository.collection_name]
+        shapes = repository.query_shapes() if hasattr(repository, "query_shapes") else []
+        for shape in shapes:
+            cursor = collection.find(shape.filter)
+            if shape.sort:
+                cursor = cursor.sort(shape.sort)
+            explanation = await cursor.explain()
+            stages = _plan_stages(explanation["queryPlanner"]["winningPlan"])
+            reports.append(QueryPlanReport(repository.collection_name, shape.name, stages))
+    return reports
+
+async def verify_query_shapes(repositories: Sequence[Any]) -> List[QueryPlanReport]:
+    """Fail if any declared query shape is answered by a collection scan"""
+    reports = await explain_query_shapes(repositories)
+    scans = [report for report in reports if report.is_collection_scan]
+    if scans:
+        names = ", ".join(f"{report.collection}.{report.shape}" for report in scans)
+        raise RuntimeError(f"Query shapes using COLLSCAN: {names}")
+    return reports
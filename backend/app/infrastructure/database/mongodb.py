@@ -1,6 +1,9 @@
+import asyncio
+import time
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from typing import Optional
+from typing import Optional, Dict, Any
 from app.config import settings
+from app.infrastructure.database.pool_metrics import PoolMetricsListener
 
 class MongoDB:
     """
@@ -10,6 +13,7 @@ class MongoDB:
     _instance: Optional['MongoDB'] = None
     _client: Optional[AsyncIOMotorClient] = None
     _database: Optional[AsyncIOMotorDatabase] = None
+    pool_metrics = PoolMetricsListener()
     
     def __new__(cls):
         if cls._instance is None:
@@ -26,9 +30,40 @@ class MongoDB:
         """Create database connection"""
         if cls._client is None:
             print(f"🔗 Connecting to MongoDB: {settings.MONGODB_URL}")
-            cls._client = AsyncIOMotorClient(settings.MONGODB_URL)
+            options: Dict[str, Any] = {
+                "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+                "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+                "maxConnecting": settings.MONGODB_MAX_CONNECTING,
+                "maxIdleTimeMS": settings.MONGODB_MAX_IDLE_TIME_MS,
+                "waitQueueTimeoutMS": settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+                "connectTimeoutMS": settings.MONGODB_CONNECT_TIMEOUT_MS,
+                "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+                "socketTimeoutMS": settings.MONGODB_SOCKET_TIMEOUT_MS,
+                "event_listeners": [cls.pool_metrics]
+            }
+            if settings.MONGODB_COMPRESSORS:
+                options["compressors"] = settings.MONGODB_COMPRESSORS
+            cls._client = AsyncIOMotorClient(settings.MONGODB_URL, **options)
             cls._database = cls._client[settings.DATABASE_NAME]
+            await cls.warm_up()
             print(f"✅ Connected to MongoDB: {settings.DATABASE_NAME}")
+
+    @classmethod
+    async def ping(cls) -> float:
+        """Ping the server and return the round trip time in milliseconds"""
+        start = time.perf_counter()
+        await cls._client.admin.command("ping")
+        return (time.perf_counter() - start) * 1000
+
+    @classmethod
+    async def warm_up(cls):
+        """
+        Verify the server is reachable and open the minimum pool up front,
+        so the first requests do not pay for connection setup.
+        """
+        latency = await cls.ping()
+        await asyncio.gather(*(cls.ping() for _ in range(settings.MONGODB_MIN_POOL_SIZE)))
+        print(f"🏓 MongoDB ping {latency:.1f} ms, pool warmed to {settings.MONGODB_MIN_POOL_SIZE} connections")
     
     @classmethod
     async def close_mongo_connection(cls):
@@ -0,0 +1,38 @@
+"""
+Versioned partial updates.
+Sends only the changed top-level fields of an entity and guards the write
+with the version it was read at (optimistic concurrency).
+"""
+from typing import Any, Dict, Iterable, Optional
+from datetime import datetime
+from bson import ObjectId
+from pymongo import ReturnDocument
+from app.domain.exceptions import ConcurrentModificationError
+
+def version_filter(version: int) -> Any:
+    """Match the expected version; documents written before versioning count as 0"""
+    return {"$in": [0, None]} if version == 0 else version
+
+async def update_changed_fields(
+    collection,
+    doc_id: ObjectId,
+    document: Dict[str, Any],
+    changed_fields: Iterable[str],
+    version: int,
+    entity_name: str
+) -> Optional[Dict[str, Any]]:
+    """
+    $set the changed fields of document and bump its version in one round trip.
+    Returns the updated document, None if it does not exist, and raises
+    ConcurrentModificationError if it was modified since it was read.
+    """
+    changes = {field: document[field] for field in changed_fields if field in document and field != "version"}
+    changes["updated_at"] = datetime.utcnow()
+    updated = await collection.find_one_and_update(
+        {"_id": doc_id, "version": version_filter(version)},
+        {"$set": changes, "$inc": {"version": 1}},
+        return_document=ReturnDocument.AFTER
+    )
+    if updated is None and await collection.count_documents({"_id": doc_id}, limit=1):
+        raise ConcurrentModificationError(entity_name, str(doc_id))
+    return updated
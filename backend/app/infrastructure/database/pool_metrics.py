@@ -0,0 +1,96 @@
+import threading
+from typing import Any, Dict
+from pymongo import monitoring
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """
+    CMAP event listener tracking connection pool pressure.
+    Events arrive on driver threads, so counters are guarded by a lock.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers: Dict[str, Dict[str, Any]] = {}
+
+    def _server(self, address) -> Dict[str, Any]:
+        key = f"{address[0]}:{address[1]}"
+        if key not in self._servers:
+            self._servers[key] = {
+                "open_connections": 0,
+                "in_use": 0,
+                "waiting": 0,
+                "max_waiting": 0,
+                "checkouts": 0,
+                "checkout_failures": 0,
+                "checkout_wait_total_ms": 0.0,
+                "checkout_wait_max_ms": 0.0,
+                "pool_clears": 0
+            }
+        return self._servers[key]
+
+    def _record_wait(self, server: Dict[str, Any], duration: float):
+        wait_ms = duration * 1000
+        server["checkout_wait_total_ms"] += wait_ms
+        server["checkout_wait_max_ms"] = max(server["checkout_wait_max_ms"], wait_ms)
+
+    def pool_created(self, event):
+        with self._lock:
+            self._server(event.address)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self._server(event.address)["pool_clears"] += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self._server(event.address)["open_connections"] += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self._server(event.address)["open_connections"] -= 1
+
+    def connection_check_out_started(self, event):
+        with self._lock:
+            server = self._server(event.address)
+            server["waiting"] += 1
+            server["max_waiting"] = max(server["max_waiting"], server["waiting"])
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            server = self._server(event.address)
+            server["waiting"] -= 1
+            server["checkout_failures"] += 1
+            self._record_wait(server, event.duration)
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            server = self._server(event.address)
+            server["waiting"] -= 1
+            server["in_use"] += 1
+            server["checkouts"] += 1
+            self._record_wait(server, event.duration)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self._server(event.address)["in_use"] -= 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of the per-server pool metrics"""
+        with self._lock:
+            result = {}
+            for address, server in self._servers.items():
+                stats = dict(server)
+                attempts = server["checkouts"] + server["checkout_failures"]
+                stats["checkout_wait_avg_ms"] = (
+                    server["checkout_wait_total_ms"] / attempts if attempts else 0.0
+                )
+                result[address] = stats
+            return result
@@ -1,11 +1,108 @@
-from typing import List, Optional, Dict, Any
+import base64
+import binascii
+import json
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import date, datetime
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ASCENDING, DESCENDING, IndexModel, DeleteOne, ReplaceOne
+from pymongo.errors import BulkWriteError
 
 # Fix imports - use absolute imports from app root
 from app.domain.interfaces.repositories import IBookingRepository
 from app.domain.models.booking import Booking, BookingStatus, PaymentStatus
 from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.indexes import QueryShape
+from app.infrastructure.database.bson_dates import date_to_bson, bson_to_date, bson_to_datetime, has_legacy_dates
+from app.infrastructure.database.partial_update import update_changed_fields, version_filter
+
+# Listing pages leave out free-text fields that summaries never show
+LIST_PROJECTION = {"special_requests": 0}
+
+# Columns of analytics exports
+EXPORT_PROJECTION = {
+    "hotel_id": 1, "user_id": 1, "room_type": 1, "check_in_date": 1, "check_out_date": 1,
+    "guests_count": 1, "total_price": 1, "status": 1, "payment_status": 1,
+    "created_at": 1, "updated_at": 1
+}
+
+# Finished bookings past the retention window move here
+ARCHIVE_COLLECTION = "bookings_archive"
+ARCHIVED_STATUSES = [BookingStatus.CANCELLED, BookingStatus.COMPLETED, BookingStatus.NO_SHOW]
+
+async def _merge_streams(first: AsyncIterator[Dict[str, Any]], second: AsyncIterator[Dict[str, Any]], key, descending: bool):
+    """
+    Merge two document streams sorted on (key, _id) into one sorted stream.
+    A document present in both (mid-archive) is yielded once, from first.
+    Ids are remembered only while the key stays the same, which bounds the
+    memory to the documents sharing one key value.
+    """
+    async def next_doc(stream):
+        try:
+            return await stream.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    def order(doc):
+        return key(doc), doc["_id"]
+
+    a, b = await next_doc(first), await next_doc(second)
+    current_key, seen = None, set()
+    while a is not None or b is not None:
+        take_first = b is None or (a is not None and (order(a) >= order(b) if descending else order(a) <= order(b)))
+        doc = a if take_first else b
+        if take_first:
+            a = await next_doc(first)
+        else:
+            b = await next_doc(second)
+        if key(doc) != current_key:
+            current_key, seen = key(doc), set()
+        if doc["_id"] not in seen:
+            seen.add(doc["_id"])
+            yield doc
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    """
+    Order BSON dates and legacy ISO string dates the way Mongo does:
+    all strings sort before all dates until app.migrate_dates has run.
+    """
+    return (1, value) if isinstance(value, datetime) else (0, value)
+
+def _encode_cursor(sort_value: Any, doc_id: ObjectId) -> str:
+    """Encode the sort key of the last document on a page as an opaque cursor"""
+    # Legacy string dates keep their type so the next page resumes in the right bracket
+    legacy = isinstance(sort_value, str)
+    raw = json.dumps([sort_value if legacy else sort_value.isoformat(), str(doc_id), legacy]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[Any, ObjectId]:
+    """Decode a cursor produced by _encode_cursor"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        sort_value, doc_id = values[0], ObjectId(values[1])
+        if len(values) > 2 and values[2]:
+            if not isinstance(sort_value, str):
+                raise ValueError("Invalid cursor")
+            return sort_value, doc_id
+        return datetime.fromisoformat(sort_value), doc_id
+    except (binascii.Error, ValueError, TypeError, IndexError, KeyError, InvalidId):
+        raise ValueError("Invalid cursor")
+
+def _check_in_range(check_in_from: Optional[date], check_in_to: Optional[date], legacy: bool) -> Dict[str, Any]:
+    """Filter on check-in dates in [check_in_from, check_in_to), also matching legacy string dates if legacy"""
+    native, legacy_range = {}, {}
+    if check_in_from:
+        native["$gte"] = date_to_bson(check_in_from)
+        legacy_range["$gte"] = check_in_from.isoformat()
+    if check_in_to:
+        native["$lt"] = date_to_bson(check_in_to)
+        legacy_range["$lt"] = check_in_to.isoformat()
+    if not native:
+        return {}
+    if not legacy:
+        return {"check_in_date": native}
+    # Legacy ISO string dates, until app.migrate_dates has run
+    return {"$or": [{"check_in_date": native}, {"check_in_date": legacy_range}]}
 
 
 class MongoBookingRepository(IBookingRepository):
@@ -13,14 +110,89 @@ class MongoBookingRepository(IBookingRepository):
     MongoDB implementation of Booking repository.
     Handles booking persistence operations.
     """
-    def __init__(self):
+    # For simplicity, assuming each room type has limited availability
+    # In production, this would check against actual room inventory
+    MAX_ROOMS_PER_TYPE = 5
+
+    INDEXES = [
+        IndexModel(
+            [("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="user_created"
+        ),
+        IndexModel(
+            [("hotel_id", ASCENDING), ("check_in_date", ASCENDING), ("_id", ASCENDING)],
+            name="hotel_check_in"
+        ),
+        IndexModel(
+            [("hotel_id", ASCENDING), ("room_type", ASCENDING), ("status", ASCENDING), ("check_in_date", ASCENDING)],
+            name="availability"
+        ),
+        IndexModel(
+            [("hold_expires_at", ASCENDING)],
+            name="pending_holds",
+            partialFilterExpression={"status": BookingStatus.PENDING.value}
+        ),
+        IndexModel([("created_at", ASCENDING)], name="created_at"),
+        IndexModel([("status", ASCENDING), ("check_out_date", ASCENDING)], name="archive_candidates"),
+        IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+    ]
+
+    # The archive only serves history reads by user and by hotel
+    COLLECTION_INDEXES = {
+        ARCHIVE_COLLECTION: [
+            IndexModel(
+                [("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="user_created"
+            ),
+            IndexModel(
+                [("hotel_id", ASCENDING), ("check_in_date", ASCENDING), ("_id", ASCENDING)],
+                name="hotel_check_in"
+            ),
+        ]
+    }
+
+    def query_shapes(self) -> List[QueryShape]:
+        """The queries this repository issues, built by the same code with fixed values"""
+        day, next_day = date(2030, 1, 1), date(2030, 1, 2)
+        cursor = _encode_cursor(datetime(2030, 1, 1), ObjectId("000000000000000000000000"))
+        statuses = [BookingStatus.CONFIRMED]
+        legacy = self._legacy_dates(include_archived=False)
+        return [
+            QueryShape(
+                "by_user",
+                self._page_query({"user_id": "u"}, "created_at", DESCENDING, statuses, None, None, cursor, legacy),
+                [("created_at", DESCENDING), ("_id", DESCENDING)]
+            ),
+            QueryShape(
+                "by_hotel",
+                self._page_query({"hotel_id": "h"}, "check_in_date", ASCENDING, statuses, day, next_day, cursor, legacy),
+                [("check_in_date", ASCENDING), ("_id", ASCENDING)]
+            ),
+            QueryShape("availability", self._overlap_query("h", "r", day, next_day)),
+            QueryShape("expired_holds", self._expired_holds_query(datetime(2030, 1, 1))),
+            QueryShape("created_since", self._created_since_query(datetime(2030, 1, 1)), [("created_at", ASCENDING)]),
+            QueryShape(
+                "export_incremental",
+                self._export_query(datetime(2030, 1, 1), datetime(2030, 1, 2), None, None, None, legacy)
+            ),
+            QueryShape("archive_candidates", self._archive_candidates_query(day)),
+        ]
+
+    def __init__(self, batch_size: int = 500):
         self.collection_name = "bookings"
+        self.archive_collection_name = ARCHIVE_COLLECTION
+        self.batch_size = batch_size
 
     def _get_collection(self):
         """Get bookings collection"""
         db = MongoDB.get_database()
         return db[self.collection_name]
 
+    def _get_archive_collection(self):
+        """Get archived bookings collection"""
+        db = MongoDB.get_database()
+        return db[self.archive_collection_name]
+
     def _document_to_booking(self, doc: Dict[str, Any]) -> Booking:
         """Convert MongoDB document to Booking domain object"""
         return Booking(
@@ -28,76 +200,287 @@ class MongoBookingRepository(IBookingRepository):
             hotel_id=doc["hotel_id"],
             user_id=doc["user_id"],
             room_type=doc["room_type"],
-            check_in_date=date.fromisoformat(doc["check_in_date"]),
-            check_out_date=date.fromisoformat(doc["check_out_date"]),
+            check_in_date=bson_to_date(doc["check_in_date"]),
+            check_out_date=bson_to_date(doc["check_out_date"]),
             guests_count=doc["guests_count"],
             total_price=doc["total_price"],
             status=BookingStatus(doc["status"]),
             payment_status=PaymentStatus(doc["payment_status"]),
             special_requests=doc.get("special_requests"),
-            created_at=datetime.fromisoformat(doc["created_at"]) if doc.get("created_at") else None,
-            updated_at=datetime.fromisoformat(doc["updated_at"]) if doc.get("updated_at") else None
+            created_at=bson_to_datetime(doc.get("created_at")),
+            updated_at=bson_to_datetime(doc.get("updated_at")),
+            hold_expires_at=bson_to_datetime(doc.get("hold_expires_at")),
+            version=doc.get("version", 0)
         )
 
     def _booking_to_document(self, booking: Booking) -> Dict[str, Any]:
         """Convert Booking domain object to MongoDB document"""
         doc = booking.to_dict()
+        doc["check_in_date"] = date_to_bson(booking.check_in_date)
+        doc["check_out_date"] = date_to_bson(booking.check_out_date)
         if booking.booking_id:
             doc["_id"] = ObjectId(booking.booking_id)
         else:
             doc.pop("_id", None)
         return doc
+
+    def _overlap_query(self, hotel_id: str, room_type: str, check_in: date, check_out: date) -> Dict[str, Any]:
+        """Build the filter for bookings holding inventory between the given dates"""
+        # Pending holds that have lapsed are free even if the sweeper
+        # has not cancelled them yet
+        query = {
+            "hotel_id": hotel_id,
+            "room_type": room_type,
+            "status": {"$in": [BookingStatus.CONFIRMED.value, BookingStatus.PENDING.value]},
+            "hold_expires_at": {"$not": {"$lte": datetime.utcnow()}},
+        }
+        overlap = {
+            "check_in_date": {"$lt": date_to_bson(check_out)},
+            "check_out_date": {"$gt": date_to_bson(check_in)}
+        }
+        if not has_legacy_dates(self.collection_name):
+            return {**query, **overlap}
+        query["$or"] = [
+            overlap,
+            # Legacy ISO string dates, until app.migrate_dates has run
+            {
+                "check_in_date": {"$lt": check_out.isoformat()},
+                "check_out_date": {"$gt": check_in.isoformat()}
+            }
+        ]
+        return query
+
+    def _legacy_dates(self, include_archived: bool) -> bool:
+        """Whether a read may still meet legacy string dates in the collections it covers"""
+        if include_archived:
+            return has_legacy_dates(self.collection_name, self.archive_collection_name)
+        return has_legacy_dates(self.collection_name)
     
     async def create(self, booking: Booking) -> Booking:
         """Create a new booking"""
         collection = self._get_collection()
         doc = self._booking_to_document(booking)
-        doc["created_at"] = datetime.utcnow().isoformat()
-        doc["updated_at"] = datetime.utcnow().isoformat()
+        doc["created_at"] = datetime.utcnow()
+        doc["updated_at"] = datetime.utcnow()
         
         result = await collection.insert_one(doc)
         booking.booking_id = str(result.inserted_id)
+        booking.mark_clean()
         return booking
 
-    async def get_by_id(self, booking_id: str) -> Optional[Booking]:
-        """Get booking by ID"""
+    async def create_many(self, bookings: List[Booking]) -> List[Booking]:
+        """
+        Create several bookings in one ordered insert_many.
+        If the write fails part-way the inserted documents are removed again.
+        """
+        if not bookings:
+            return []
+        collection = self._get_collection()
+        now = datetime.utcnow()
+        docs = []
+        for booking in bookings:
+            doc = self._booking_to_document(booking)
+            doc["_id"] = doc.get("_id") or ObjectId()
+            doc["created_at"] = now
+            doc["updated_at"] = now
+            docs.append(doc)
+
+        try:
+            await collection.insert_many(docs, ordered=True)
+        except BulkWriteError:
+            await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+            raise
+
+        for booking, doc in zip(bookings, docs):
+            booking.booking_id = str(doc["_id"])
+            booking.mark_clean()
+        return bookings
+
+    async def get_by_id(self, booking_id: str, include_archived: bool = False) -> Optional[Booking]:
+        """Get booking by ID, looking in the archive too when include_archived is set"""
         collection = self._get_collection()
         doc = await collection.find_one({"_id": ObjectId(booking_id)})
+        if doc is None and include_archived:
+            doc = await self._get_archive_collection().find_one({"_id": ObjectId(booking_id)})
         return self._document_to_booking(doc) if doc else None
 
-    async def get_by_user_id(self, user_id: str) -> List[Booking]:
+    async def _hydrate(self, docs: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[Booking]:
+        """Hydrate a document stream lazily"""
+        async for doc in docs:
+            yield self._document_to_booking(doc)
+
+    def _stream(self, cursor, batch_size: Optional[int] = None) -> AsyncIterator[Booking]:
+        """Hydrate bookings one Motor batch at a time instead of materializing the result"""
+        return self._hydrate(cursor.batch_size(batch_size or self.batch_size))
+
+    async def get_by_user_id(self, user_id: str, include_archived: bool = False) -> List[Booking]:
         """Get all bookings for a user"""
-        collection = self._get_collection()
-        cursor = collection.find({"user_id": user_id}).sort("created_at", -1)
-        bookings = []
-        async for doc in cursor:
-            bookings.append(self._document_to_booking(doc))
-        return bookings
+        return [booking async for booking in self.iter_by_user_id(user_id, include_archived=include_archived)]
+
+    def iter_by_user_id(
+        self,
+        user_id: str,
+        batch_size: Optional[int] = None,
+        include_archived: bool = False
+    ) -> AsyncIterator[Booking]:
+        """Stream all bookings for a user, newest first"""
+        batch_size = batch_size or self.batch_size
+        sort = [("created_at", DESCENDING), ("_id", DESCENDING)]
+        docs = self._get_collection().find({"user_id": user_id}).sort(sort).batch_size(batch_size)
+        if include_archived:
+            archived = self._get_archive_collection().find({"user_id": user_id}).sort(sort).batch_size(batch_size)
+            docs = _merge_streams(docs, archived, lambda doc: _sort_key(doc["created_at"]), descending=True)
+        return self._hydrate(docs)
 
     async def get_by_hotel_id(self, hotel_id: str) -> List[Booking]:
         """Get all bookings for a hotel"""
+        return [booking async for booking in self.iter_by_hotel_id(hotel_id)]
+
+    def iter_by_hotel_id(self, hotel_id: str, batch_size: Optional[int] = None) -> AsyncIterator[Booking]:
+        """Stream all bookings for a hotel by check-in date"""
+        cursor = self._get_collection().find({"hotel_id": hotel_id}).sort("check_in_date", 1)
+        return self._stream(cursor, batch_size)
+
+    async def get_created_since(self, since: datetime, limit: int = 10000) -> List[Booking]:
+        """Get bookings created at or after the given time, oldest first"""
         collection = self._get_collection()
-        cursor = collection.find({"hotel_id": hotel_id}).sort("check_in_date", 1)
-        bookings = []
-        async for doc in cursor:
-            bookings.append(self._document_to_booking(doc))
-        return bookings
+        cursor = collection.find(
+            self._created_since_query(since), LIST_PROJECTION
+        ).sort("created_at", 1).limit(limit)
+        return [booking async for booking in self._stream(cursor, limit)]
+
+    def iter_created_since(self, since: datetime, batch_size: Optional[int] = None) -> AsyncIterator[Booking]:
+        """Stream bookings created at or after the given time, oldest first"""
+        cursor = self._get_collection().find(
+            self._created_since_query(since), LIST_PROJECTION
+        ).sort("created_at", 1)
+        return self._stream(cursor, batch_size)
+
+    @staticmethod
+    def _created_since_query(since: datetime) -> Dict[str, Any]:
+        return {"created_at": {"$gte": since}}
+
+    def _page_query(
+        self,
+        query: Dict[str, Any],
+        sort_field: str,
+        direction: int,
+        statuses: Optional[List[BookingStatus]],
+        check_in_from: Optional[date],
+        check_in_to: Optional[date],
+        cursor: Optional[str],
+        legacy: bool
+    ) -> Dict[str, Any]:
+        """Build the filter of one keyset page after cursor"""
+        query = dict(query)
+        if statuses:
+            query["status"] = {"$in": [status.value for status in statuses]}
+        query.update(_check_in_range(check_in_from, check_in_to, legacy))
+        if cursor:
+            sort_value, last_id = _decode_cursor(cursor)
+            op = "$gt" if direction == ASCENDING else "$lt"
+            after = [
+                {sort_field: {op: sort_value}},
+                {sort_field: sort_value, "_id": {op: last_id}}
+            ]
+            # Comparisons stay within one BSON type, so a page that ended on
+            # one kind of date continues into the kind Mongo sorts after it
+            if isinstance(sort_value, str) and direction == ASCENDING:
+                after.append({sort_field: {"$type": "date"}})
+            elif legacy and isinstance(sort_value, datetime) and direction == DESCENDING:
+                after.append({sort_field: {"$type": "string"}})
+            query = {"$and": [query, {"$or": after}]}
+        return query
+
+    async def _list_page(
+        self,
+        query: Dict[str, Any],
+        sort_field: str,
+        direction: int,
+        statuses: Optional[List[BookingStatus]],
+        check_in_from: Optional[date],
+        check_in_to: Optional[date],
+        cursor: Optional[str],
+        limit: int,
+        include_archived: bool = False
+    ) -> Tuple[List[Booking], Optional[str]]:
+        """
+        Fetch one keyset page ordered by (sort_field, _id).
+        With include_archived, the same page is read from the archive and merged.
+        """
+        query = self._page_query(
+            query, sort_field, direction, statuses, check_in_from, check_in_to, cursor,
+            self._legacy_dates(include_archived)
+        )
+
+        collections = [self._get_collection()]
+        if include_archived:
+            collections.append(self._get_archive_collection())
+        docs = []
+        for collection in collections:
+            docs += await collection.find(query, LIST_PROJECTION).sort(
+                [(sort_field, direction), ("_id", direction)]
+            ).limit(limit + 1).to_list(length=limit + 1)
+        if include_archived:
+            unique = {doc["_id"]: doc for doc in reversed(docs)}
+            docs = sorted(
+                unique.values(),
+                key=lambda doc: (_sort_key(doc[sort_field]), doc["_id"]),
+                reverse=direction == DESCENDING
+            )[:limit + 1]
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_cursor = _encode_cursor(docs[-1][sort_field], docs[-1]["_id"])
+        return [self._document_to_booking(doc) for doc in docs], next_cursor
+
+    async def list_by_user(
+        self,
+        user_id: str,
+        statuses: Optional[List[BookingStatus]] = None,
+        check_in_from: Optional[date] = None,
+        check_in_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        include_archived: bool = False
+    ) -> Tuple[List[Booking], Optional[str]]:
+        """Get one page of a user's bookings, newest first"""
+        return await self._list_page(
+            {"user_id": user_id}, "created_at", DESCENDING,
+            statuses, check_in_from, check_in_to, cursor, limit, include_archived
+        )
+
+    async def list_by_hotel(
+        self,
+        hotel_id: str,
+        statuses: Optional[List[BookingStatus]] = None,
+        check_in_from: Optional[date] = None,
+        check_in_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        include_archived: bool = False
+    ) -> Tuple[List[Booking], Optional[str]]:
+        """Get one page of a hotel's bookings by check-in date"""
+        return await self._list_page(
+            {"hotel_id": hotel_id}, "check_in_date", ASCENDING,
+            statuses, check_in_from, check_in_to, cursor, limit, include_archived
+        )
 
     async def update(self, booking_id: str, booking: Booking) -> Optional[Booking]:
-        """Update booking"""
-        collection = self._get_collection()
-        doc = self._booking_to_document(booking)
-        doc["updated_at"] = datetime.utcnow().isoformat()
-        doc.pop("_id", None)
-        
-        result = await collection.update_one(
-            {"_id": ObjectId(booking_id)},
-            {"$set": doc}
+        """Update the changed fields of a booking, guarded by its version"""
+        changed = booking.get_dirty_fields()
+        if not changed:
+            return booking
+        doc = await update_changed_fields(
+            self._get_collection(),
+            ObjectId(booking_id),
+            self._booking_to_document(booking),
+            changed,
+            booking.version,
+            "Booking"
         )
-        
-        if result.modified_count > 0:
-            return await self.get_by_id(booking_id)
-        return None
+        return self._document_to_booking(doc) if doc else None
 
     async def delete(self, booking_id: str) -> bool:
         """Delete booking"""
@@ -114,20 +497,209 @@ class MongoBookingRepository(IBookingRepository):
     ) -> bool:
         """Check room availability for dates"""
         collection = self._get_collection()
-        
-        # Find overlapping bookings
-        overlapping = await collection.count_documents({
-            "hotel_id": hotel_id,
-            "room_type": room_type,
-            "status": {"$in": [BookingStatus.CONFIRMED.value, BookingStatus.PENDING.value]},
-            "$or": [
-                {
-                    "check_in_date": {"$lt": check_out.isoformat()},
-                    "check_out_date": {"$gt": check_in.isoformat()}
-                }
-            ]
-        })
-        
-        # For simplicity, assuming each room type has limited availability
-        # In production, this would check against actual room inventory
-        return overlapping < 5  # Max 5 rooms of each type
\ No newline at end of file
+        overlapping = await collection.count_documents(
+            self._overlap_query(hotel_id, room_type, check_in, check_out)
+        )
+        return overlapping < self.MAX_ROOMS_PER_TYPE
+
+    async def check_availability_bulk(
+        self,
+        hotel_id: str,
+        room_type: str,
+        stays: List[Tuple[date, date]]
+    ) -> List[bool]:
+        """
+        Check availability for several stays of one room type.
+        Loads the overlapping bookings for the whole date span once and
+        evaluates every stay in memory; accepted stays count against later ones.
+        """
+        if not stays:
+            return []
+        collection = self._get_collection()
+        span_start = min(check_in for check_in, _ in stays)
+        span_end = max(check_out for _, check_out in stays)
+        cursor = collection.find(
+            self._overlap_query(hotel_id, room_type, span_start, span_end),
+            {"check_in_date": 1, "check_out_date": 1}
+        )
+        held = [
+            (bson_to_date(doc["check_in_date"]), bson_to_date(doc["check_out_date"]))
+            async for doc in cursor
+        ]
+
+        results = []
+        for check_in, check_out in stays:
+            overlapping = sum(1 for start, end in held if start < check_out and end > check_in)
+            available = overlapping < self.MAX_ROOMS_PER_TYPE
+            if available:
+                held.append((check_in, check_out))
+            results.append(available)
+        return results
+
+    @staticmethod
+    def _expired_holds_query(now: datetime) -> Dict[str, Any]:
+        return {"status": BookingStatus.PENDING.value, "hold_expires_at": {"$lte": now}}
+
+    async def expire_holds(self, now: datetime, batch_size: int) -> List[Booking]:
+        """Cancel one batch of pending bookings whose hold has expired"""
+        collection = self._get_collection()
+        cursor = collection.find(self._expired_holds_query(now)).limit(batch_size)
+        docs = [doc async for doc in cursor]
+        if not docs:
+            return []
+
+        # The status/expiry guard is repeated so that bookings confirmed
+        # between the read and the write are left untouched
+        # BSON dates have millisecond precision; truncate so the
+        # read-back below matches the stored stamp exactly
+        stamp = datetime.utcnow()
+        stamp = stamp.replace(microsecond=stamp.microsecond // 1000 * 1000)
+        ids = [doc["_id"] for doc in docs]
+        result = await collection.update_many(
+            {"_id": {"$in": ids}, **self._expired_holds_query(now)},
+            {
+                "$set": {
+                    "status": BookingStatus.CANCELLED.value,
+                    "hold_expires_at": None,
+                    "updated_at": stamp
+                },
+                "$inc": {"version": 1}
+            }
+        )
+
+        if result.modified_count != len(ids):
+            cursor = collection.find({
+                "_id": {"$in": ids},
+                "status": BookingStatus.CANCELLED.value,
+                "updated_at": stamp
+            })
+            docs = [doc async for doc in cursor]
+        else:
+            for doc in docs:
+                doc.update(
+                    status=BookingStatus.CANCELLED.value,
+                    hold_expires_at=None,
+                    updated_at=stamp,
+                    version=doc.get("version", 0) + 1
+                )
+
+        return [self._document_to_booking(doc) for doc in docs]
+
+    def _export_row(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a stored booking into an export row"""
+        check_in = bson_to_date(doc["check_in_date"])
+        check_out = bson_to_date(doc["check_out_date"])
+        return {
+            "booking_id": str(doc["_id"]),
+            "hotel_id": doc["hotel_id"],
+            "user_id": doc["user_id"],
+            "room_type": doc["room_type"],
+            "check_in_date": check_in,
+            "check_out_date": check_out,
+            "nights": (check_out - check_in).days,
+            "guests_count": doc["guests_count"],
+            "total_price": doc["total_price"],
+            "status": doc["status"],
+            "payment_status": doc["payment_status"],
+            "created_at": bson_to_datetime(doc.get("created_at")),
+            "updated_at": bson_to_datetime(doc.get("updated_at"))
+        }
+
+    @staticmethod
+    def _export_query(
+        updated_since: Optional[datetime],
+        updated_before: Optional[datetime],
+        hotel_id: Optional[str],
+        check_in_from: Optional[date],
+        check_in_to: Optional[date],
+        legacy: bool
+    ) -> Dict[str, Any]:
+        query: Dict[str, Any] = {}
+        updated_query = {}
+        if updated_since:
+            updated_query["$gte"] = updated_since
+        if updated_before:
+            updated_query["$lt"] = updated_before
+        if updated_query:
+            query["updated_at"] = updated_query
+        if hotel_id:
+            query["hotel_id"] = hotel_id
+        query.update(_check_in_range(check_in_from, check_in_to, legacy))
+        return query
+
+    async def iter_export_rows(
+        self,
+        updated_since: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+        hotel_id: Optional[str] = None,
+        check_in_from: Optional[date] = None,
+        check_in_to: Optional[date] = None,
+        include_archived: bool = False,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream flat booking rows for analytics exports"""
+        query = self._export_query(
+            updated_since, updated_before, hotel_id, check_in_from, check_in_to,
+            self._legacy_dates(include_archived)
+        )
+
+        batch_size = batch_size or self.batch_size
+        hot = self._get_collection()
+        async for doc in hot.find(query, EXPORT_PROJECTION).batch_size(batch_size):
+            yield self._export_row(doc)
+        if not include_archived:
+            return
+        archived = self._get_archive_collection().find(query, EXPORT_PROJECTION).batch_size(batch_size)
+        batch: List[Dict[str, Any]] = []
+        async for doc in archived:
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                for row in await self._archived_only(hot, batch):
+                    yield row
+                batch = []
+        for row in await self._archived_only(hot, batch):
+            yield row
+
+    async def _archived_only(self, hot, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Export rows for archived documents, skipping those still in the hot collection (mid-archive)"""
+        if not docs:
+            return []
+        ids = [doc["_id"] for doc in docs]
+        still_hot = {doc["_id"] async for doc in hot.find({"_id": {"$in": ids}}, {"_id": 1})}
+        return [self._export_row(doc) for doc in docs if doc["_id"] not in still_hot]
+
+    @staticmethod
+    def _archive_candidates_query(checked_out_before: date) -> Dict[str, Any]:
+        return {
+            "status": {"$in": [status.value for status in ARCHIVED_STATUSES]},
+            "check_out_date": {"$lt": date_to_bson(checked_out_before)}
+        }
+
+    async def archive_finished(self, checked_out_before: date, batch_size: int) -> int:
+        """
+        Move one batch of finished bookings that checked out before the given
+        date into the archive; returns how many were moved.
+        Copies are idempotent upserts and each delete is guarded on the version
+        that was copied, so an interrupted or concurrent run never loses a
+        booking and a booking changed mid-move stays hot until the next run.
+        """
+        hot = self._get_collection()
+        archive = self._get_archive_collection()
+        docs = await hot.find(self._archive_candidates_query(checked_out_before)).limit(batch_size).to_list(length=batch_size)
+        if not docs:
+            return 0
+
+        await archive.bulk_write(
+            [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs],
+            ordered=False
+        )
+        result = await hot.bulk_write(
+            [DeleteOne({"_id": doc["_id"], "version": version_filter(doc.get("version", 0))}) for doc in docs],
+            ordered=False
+        )
+        if result.deleted_count < len(docs):
+            # Modified while being copied: drop the stale copies
+            ids = [doc["_id"] for doc in docs]
+            still_hot = [doc["_id"] async for doc in hot.find({"_id": {"$in": ids}}, {"_id": 1})]
+            await archive.delete_many({"_id": {"$in": still_hot}})
+        return result.deleted_count
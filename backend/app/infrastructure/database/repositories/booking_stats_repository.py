@@ -0,0 +1,298 @@
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date, datetime, timedelta
+from pymongo import ASCENDING, IndexModel, ReplaceOne, UpdateOne
+from app.domain.interfaces.repositories import IBookingStatsRepository
+from app.domain.models.analytics import DailyRoomStats
+from app.domain.models.booking import Booking, BookingStatus
+from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.indexes import QueryShape, ensure_collection_indexes
+from app.infrastructure.database.bson_dates import bson_to_date
+
+# Statuses that hold inventory, and the counter each one feeds
+PENDING_STATUSES = {BookingStatus.PENDING}
+CONFIRMED_STATUSES = {BookingStatus.CONFIRMED, BookingStatus.COMPLETED}
+
+# Booking fields a rebuild snapshots and derives rollup rows from
+SNAPSHOT_PROJECTION = {
+    "hotel_id": 1, "room_type": 1, "check_in_date": 1, "check_out_date": 1, "total_price": 1, "status": 1
+}
+DAY_MS = 24 * 60 * 60 * 1000
+# Rebuild catch-up: how far to look back before each pass, and how many passes to run
+CATCH_UP_LAG = timedelta(seconds=30)
+CATCH_UP_PASSES = 5
+
+class MongoBookingStatsRepository(IBookingStatsRepository):
+    """
+    MongoDB implementation of the booking analytics rollup.
+    One document per (hotel_id, room_type, date), kept separate from
+    the bookings collection so reporting never competes with booking traffic.
+    """
+    INDEXES = [
+        IndexModel(
+            [("hotel_id", ASCENDING), ("room_type", ASCENDING), ("date", ASCENDING)],
+            name="hotel_room_date",
+            unique=True
+        ),
+        IndexModel([("hotel_id", ASCENDING), ("date", ASCENDING)], name="hotel_date"),
+    ]
+
+    def query_shapes(self) -> List[QueryShape]:
+        """The queries this repository issues, built by the same code with fixed values"""
+        return [
+            QueryShape(
+                "hotel_range",
+                self._range_query("h", date(2030, 1, 1), date(2030, 2, 1), None),
+                [("date", ASCENDING)]
+            ),
+            QueryShape("room_key", self._row_key("h", "r", date(2030, 1, 1))),
+        ]
+
+    def __init__(self, batch_size: int = 1000):
+        self.collection_name = "booking_daily_stats"
+        self.failures_collection_name = "booking_daily_stats_failures"
+        self.bookings_collection_name = "bookings"
+        self.archive_collection_name = "bookings_archive"
+        self.batch_size = batch_size
+
+    def _get_collection(self, name: Optional[str] = None):
+        """Get rollup collection"""
+        db = MongoDB.get_database()
+        return db[name or self.collection_name]
+
+    def _document_to_stats(self, doc: Dict[str, Any]) -> DailyRoomStats:
+        """Convert MongoDB document to DailyRoomStats"""
+        return DailyRoomStats(
+            hotel_id=doc["hotel_id"],
+            room_type=doc["room_type"],
+            day=date.fromisoformat(doc["date"]),
+            pending_rooms=doc.get("pending_rooms", 0),
+            confirmed_rooms=doc.get("confirmed_rooms", 0),
+            revenue=doc.get("revenue", 0.0)
+        )
+
+    @staticmethod
+    def _status_increments(nightly_rate: float, status: Optional[BookingStatus], sign: int) -> Dict[str, float]:
+        """Counter increments contributed by one night of a booking in the given status"""
+        if status in PENDING_STATUSES:
+            return {"pending_rooms": sign}
+        if status in CONFIRMED_STATUSES:
+            return {"confirmed_rooms": sign, "revenue": sign * nightly_rate}
+        return {}
+
+    @staticmethod
+    def _row_key(hotel_id: str, room_type: str, day: date) -> Dict[str, Any]:
+        return {"hotel_id": hotel_id, "room_type": room_type, "date": day.isoformat()}
+
+    async def record_transitions(
+        self,
+        transitions: List[Tuple[Booking, Optional[BookingStatus], Optional[BookingStatus]]]
+    ) -> None:
+        """Apply booking status changes (booking, old status, new status) to the rollup"""
+        operations = []
+        for booking, old_status, new_status in transitions:
+            rate = booking.get_nightly_rate()
+            increments: Dict[str, float] = {}
+            for field, value in self._status_increments(rate, old_status, -1).items():
+                increments[field] = increments.get(field, 0) + value
+            for field, value in self._status_increments(rate, new_status, 1).items():
+                increments[field] = increments.get(field, 0) + value
+            increments = {field: value for field, value in increments.items() if value}
+            if not increments:
+                continue
+            for night in booking.get_stay_nights():
+                operations.append(UpdateOne(
+                    self._row_key(booking.hotel_id, booking.room_type, night),
+                    {"$inc": increments},
+                    upsert=True
+                ))
+
+        if operations:
+            await self._get_collection().bulk_write(operations, ordered=False)
+
+    async def record_failure(self, booking_ids: List[str], error: str) -> None:
+        """Note transitions that could not be applied, for the next rebuild to reconcile"""
+        await self._get_collection(self.failures_collection_name).insert_one({
+            "booking_ids": booking_ids,
+            "error": error,
+            "failed_at": datetime.utcnow()
+        })
+
+    async def count_failures(self) -> int:
+        """Number of failed transition batches no rebuild has reconciled yet"""
+        return await self._get_collection(self.failures_collection_name).count_documents({})
+
+    @staticmethod
+    def _range_query(hotel_id: str, start_date: date, end_date: date, room_type: Optional[str]) -> Dict[str, Any]:
+        query: Dict[str, Any] = {
+            "hotel_id": hotel_id,
+            "date": {"$gte": start_date.isoformat(), "$lt": end_date.isoformat()}
+        }
+        if room_type:
+            query["room_type"] = room_type
+        return query
+
+    async def get_daily_stats(
+        self,
+        hotel_id: str,
+        start_date: date,
+        end_date: date,
+        room_type: Optional[str] = None
+    ) -> List[DailyRoomStats]:
+        """Get rollup rows for a hotel between start_date and end_date (exclusive)"""
+        collection = self._get_collection()
+        cursor = collection.find(self._range_query(hotel_id, start_date, end_date, room_type)).sort("date", ASCENDING)
+        return [self._document_to_stats(doc) async for doc in cursor]
+
+    def _rollup_pipeline(self, out: str) -> List[Dict[str, Any]]:
+        """Aggregation that expands snapshot bookings into nights and sums them per row"""
+        check_in = {"$toDate": "$check_in_date"}
+        nights = {"$toInt": {"$divide": [{"$subtract": [{"$toDate": "$check_out_date"}, check_in]}, DAY_MS]}}
+        pending = [s.value for s in PENDING_STATUSES]
+        confirmed = [s.value for s in CONFIRMED_STATUSES]
+        return [
+            {"$match": {"status": {"$in": pending + confirmed}}},
+            {"$project": {"hotel_id": 1, "room_type": 1, "status": 1, "check_in": check_in, "nights": nights,
+                          "total_price": 1}},
+            {"$match": {"nights": {"$gt": 0}}},
+            {"$project": {"hotel_id": 1, "room_type": 1, "status": 1, "check_in": 1,
+                          "rate": {"$divide": ["$total_price", "$nights"]},
+                          "night": {"$range": [0, "$nights"]}}},
+            {"$unwind": "$night"},
+            {"$group": {
+                "_id": {
+                    "hotel_id": "$hotel_id",
+                    "room_type": "$room_type",
+                    "date": {"$dateToString": {
+                        "format": "%Y-%m-%d",
+                        "date": {"$add": ["$check_in", {"$multiply": ["$night", DAY_MS]}]}
+                    }}
+                },
+                "pending_rooms": {"$sum": {"$cond": [{"$in": ["$status", pending]}, 1, 0]}},
+                "confirmed_rooms": {"$sum": {"$cond": [{"$in": ["$status", confirmed]}, 1, 0]}},
+                "revenue": {"$sum": {"$cond": [{"$in": ["$status", confirmed]}, "$rate", 0]}}
+            }},
+            {"$project": {"_id": 0, "hotel_id": "$_id.hotel_id", "room_type": "$_id.room_type", "date": "$_id.date",
+                          "pending_rooms": 1, "confirmed_rooms": 1, "revenue": 1}},
+            {"$out": out}
+        ]
+
+    def _night_increments(self, doc: Optional[Dict[str, Any]], sign: int, rows: Dict[Tuple[str, str, str], Dict[str, float]]):
+        """Add the nights of one snapshot booking to rows, with sign -1 to take them back out"""
+        if not doc:
+            return
+        check_in = bson_to_date(doc["check_in_date"])
+        nights = (bson_to_date(doc["check_out_date"]) - check_in).days
+        if nights <= 0:
+            return
+        try:
+            status = BookingStatus(doc["status"])
+        except ValueError:
+            return
+        increments = self._status_increments(doc["total_price"] / nights, status, sign)
+        for i in range(nights):
+            row = rows.setdefault((doc["hotel_id"], doc["room_type"], (check_in + timedelta(days=i)).isoformat()), {})
+            for field, value in increments.items():
+                row[field] = row.get(field, 0) + value
+
+    async def _catch_up(self, since: datetime, snapshot, scratch) -> int:
+        """
+        Apply bookings updated since the given time to the scratch rollup as the
+        difference from their snapshot state; returns how many had changed.
+        Bookings already current in the snapshot contribute nothing, so
+        overlapping passes are harmless.
+        """
+        changed = 0
+        for name in (self.bookings_collection_name, self.archive_collection_name):
+            cursor = self._get_collection(name).find(
+                {"updated_at": {"$gte": since}}, SNAPSHOT_PROJECTION
+            ).batch_size(self.batch_size)
+            batch = []
+            async for doc in cursor:
+                batch.append(doc)
+                if len(batch) >= self.batch_size:
+                    changed += await self._apply_changes(batch, snapshot, scratch)
+                    batch = []
+            if batch:
+                changed += await self._apply_changes(batch, snapshot, scratch)
+        return changed
+
+    async def _apply_changes(self, docs: List[Dict[str, Any]], snapshot, scratch) -> int:
+        """Move one batch of changed bookings from their snapshot state to their current state"""
+        previous = {
+            doc["_id"]: doc
+            async for doc in snapshot.find({"_id": {"$in": [doc["_id"] for doc in docs]}})
+        }
+        docs = [doc for doc in docs if doc != previous.get(doc["_id"])]
+        if not docs:
+            return 0
+        rows: Dict[Tuple[str, str, str], Dict[str, float]] = {}
+        for doc in docs:
+            self._night_increments(previous.get(doc["_id"]), -1, rows)
+            self._night_increments(doc, 1, rows)
+        operations = [
+            UpdateOne(
+                {"hotel_id": hotel_id, "room_type": room_type, "date": day},
+                {"$inc": {field: value for field, value in increments.items() if value}},
+                upsert=True
+            )
+            for (hotel_id, room_type, day), increments in rows.items()
+            if any(increments.values())
+        ]
+        if operations:
+            await scratch.bulk_write(operations, ordered=False)
+        await snapshot.bulk_write(
+            [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs],
+            ordered=False
+        )
+        return len(docs)
+
+    async def rebuild(self) -> int:
+        """
+        Recompute the whole rollup from bookings.
+        Everything is computed server-side: hot and archived bookings are
+        copied into a snapshot keyed by _id (so a booking archived mid-rebuild
+        counts once), and an aggregation expands the snapshot into a scratch
+        rollup. Bookings updated after the rebuild started are then applied
+        to the scratch rollup as catch-up passes, and the scratch collection
+        atomically replaces the live one, so readers never see a half-built
+        rollup. A write landing between the last catch-up pass and the swap,
+        or a booking hard-deleted during the rebuild, is only corrected by
+        the next rebuild. Failed transitions recorded before the rebuild
+        started are cleared once it has replaced the rollup.
+        """
+        db = MongoDB.get_database()
+        started = datetime.utcnow()
+        # updated_at is stamped before the write commits, so look back a little
+        since = datetime.utcnow() - CATCH_UP_LAG
+        snapshot = self._get_collection(f"{self.collection_name}_snapshot")
+        scratch_name = f"{self.collection_name}_rebuild"
+        scratch = self._get_collection(scratch_name)
+        await snapshot.drop()
+        await scratch.drop()
+        try:
+            statuses = [s.value for s in PENDING_STATUSES | CONFIRMED_STATUSES]
+            for name in (self.bookings_collection_name, self.archive_collection_name):
+                await db[name].aggregate([
+                    {"$match": {"status": {"$in": statuses}}},
+                    {"$project": SNAPSHOT_PROJECTION},
+                    {"$merge": {"into": snapshot.name, "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}}
+                ], allowDiskUse=True).to_list(length=None)
+
+            # $out keeps the indexes of an existing target collection
+            await ensure_collection_indexes(scratch, self.INDEXES)
+            await snapshot.aggregate(self._rollup_pipeline(scratch_name), allowDiskUse=True).to_list(length=None)
+
+            for _ in range(CATCH_UP_PASSES):
+                mark = datetime.utcnow() - CATCH_UP_LAG
+                changed = await self._catch_up(since, snapshot, scratch)
+                since = mark
+                if not changed:
+                    break
+
+            rows = await scratch.count_documents({})
+            await scratch.rename(self.collection_name, dropTarget=True)
+            await self._get_collection(self.failures_collection_name).delete_many({"failed_at": {"$lt": started}})
+            return rows
+        finally:
+            await snapshot.drop()
+            await scratch.drop()
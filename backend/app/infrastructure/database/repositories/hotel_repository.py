@@ -1,23 +1,90 @@
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, Tuple
 from datetime import date, datetime
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError
 from app.domain.interfaces.repositories import IHotelRepository
 from app.domain.models.hotel import Hotel, HotelCategory, Amenity, Room, Location
 from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.indexes import QueryShape
+from app.infrastructure.database.bson_dates import bson_to_datetime
+from app.infrastructure.database.partial_update import update_changed_fields
+
+# Read documents carry only what responses show
+READ_PROJECTION = {"version": 0}
+
+# Response field -> stored paths it is built from, where they differ
+FIELD_PATHS: Dict[str, Tuple[str, ...]] = {
+    "id": (),
+    "minimum_price": ("rooms.price_per_night",),
+    "available_rooms": ("rooms.available_count",),
+    "primary_image": (),
+}
+
+def read_projection(fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """Mongo projection for the given response fields (None for the full read document)"""
+    if fields is None:
+        return READ_PROJECTION
+    paths = set()
+    for field in fields:
+        paths.update(FIELD_PATHS.get(field, (field,)))
+    # A parent path covers its sub-paths, and Mongo rejects the collision
+    projection: Dict[str, Any] = {
+        path: 1 for path in paths
+        if not any(path.startswith(parent + ".") for parent in paths)
+    }
+    if "primary_image" in fields and "images" not in projection:
+        projection["images"] = {"$slice": 1}
+    return projection
 
 class MongoHotelRepository(IHotelRepository):
     """
     MongoDB implementation of Hotel repository.
     Follows SRP: Only handles hotel data persistence.
     """
-    def __init__(self):
+    INDEXES = [
+        IndexModel([("location.city", ASCENDING), ("star_rating", DESCENDING)], name="city_rating"),
+        IndexModel([("rooms.capacity", ASCENDING), ("rooms.price_per_night", ASCENDING)], name="room_capacity_price"),
+        IndexModel([("star_rating", DESCENDING)], name="star_rating"),
+        IndexModel([("amenities", ASCENDING)], name="amenities"),
+        IndexModel(
+            [("external_id", ASCENDING)],
+            name="external_id",
+            unique=True,
+            partialFilterExpression={"external_id": {"$type": "string"}}
+        ),
+    ]
+
+    def query_shapes(self) -> List[QueryShape]:
+        """
+        The queries this repository issues, built by the same code with fixed values.
+        City search is not declared: its unanchored case-insensitive regex
+        cannot bound an index scan, so a passing plan would still read
+        every key of city_rating.
+        """
+        return [
+            QueryShape("search_default", self._search_query(None, 1, None, None, None, None)),
+            QueryShape("search_filters", self._search_query(None, 2, 50, 300, ["wifi"], 4)),
+            QueryShape("city_counts", self._city_match(["Paris"])),
+            QueryShape("external_id", self._external_id_filter("supplier-1")),
+        ]
+
+    SEARCH_LIMIT = 50
+
+    def __init__(self, batch_size: int = 500):
         self.collection_name = "hotels"
+        self.batch_size = batch_size
 
     def _get_collection(self):
         """Get hotels collection"""
         db = MongoDB.get_database()
         return db[self.collection_name]
 
+    async def _stream(self, cursor, batch_size: Optional[int] = None) -> AsyncIterator[Hotel]:
+        """Hydrate hotels one Motor batch at a time instead of materializing the result"""
+        async for doc in cursor.batch_size(batch_size or self.batch_size):
+            yield self._document_to_hotel(doc)
+
     def _document_to_hotel(self, doc: Dict[str, Any]) -> Hotel:
         """Convert MongoDB document to Hotel domain object"""
         location = Location(
@@ -53,10 +120,19 @@ class MongoHotelRepository(IHotelRepository):
             check_in_time=doc.get("check_in_time", "14:00"),
             check_out_time=doc.get("check_out_time", "11:00"),
             policies=doc.get("policies", {}),
-            created_at=datetime.fromisoformat(doc["created_at"]) if doc.get("created_at") else None,
-            updated_at=datetime.fromisoformat(doc["updated_at"]) if doc.get("updated_at") else None
+            created_at=bson_to_datetime(doc.get("created_at")),
+            updated_at=bson_to_datetime(doc.get("updated_at")),
+            version=doc.get("version", 0),
+            external_id=doc.get("external_id")
         )
 
+    def _to_read_document(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a stored document for the read path (string id, datetime stamps)"""
+        doc["id"] = str(doc.pop("_id"))
+        doc["created_at"] = bson_to_datetime(doc.get("created_at"))
+        doc["updated_at"] = bson_to_datetime(doc.get("updated_at"))
+        return doc
+
     def _hotel_to_document(self, hotel: Hotel) -> Dict[str, Any]:
         """Convert Hotel domain object to MongoDB document"""
         doc = hotel.to_dict()
@@ -70,11 +146,12 @@ class MongoHotelRepository(IHotelRepository):
         """Create a new hotel"""
         collection = self._get_collection()
         doc = self._hotel_to_document(hotel)
-        doc["created_at"] = datetime.utcnow().isoformat()
-        doc["updated_at"] = datetime.utcnow().isoformat()
+        doc["created_at"] = datetime.utcnow()
+        doc["updated_at"] = datetime.utcnow()
         
         result = await collection.insert_one(doc)
         hotel.hotel_id = str(result.inserted_id)
+        hotel.mark_clean()
         return hotel
 
     async def get_by_id(self, hotel_id: str) -> Optional[Hotel]:
@@ -83,30 +160,74 @@ class MongoHotelRepository(IHotelRepository):
         doc = await collection.find_one({"_id": ObjectId(hotel_id)})
         return self._document_to_hotel(doc) if doc else None
 
+    async def get_by_ids(self, hotel_ids: List[str]) -> List[Hotel]:
+        """Get hotels by IDs in a single query; unknown IDs are skipped"""
+        collection = self._get_collection()
+        object_ids = [ObjectId(hotel_id) for hotel_id in set(hotel_ids) if ObjectId.is_valid(hotel_id)]
+        if not object_ids:
+            return []
+        cursor = collection.find({"_id": {"$in": object_ids}})
+        return [hotel async for hotel in self._stream(cursor)]
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Hotel]:
         """Get all hotels with pagination"""
         collection = self._get_collection()
         cursor = collection.find().skip(skip).limit(limit)
-        hotels = []
-        async for doc in cursor:
-            hotels.append(self._document_to_hotel(doc))
-        return hotels
+        return [hotel async for hotel in self._stream(cursor, limit)]
 
-    async def update(self, hotel_id: str, hotel: Hotel) -> Optional[Hotel]:
-        """Update hotel"""
+    async def get_document_by_id(
+        self,
+        hotel_id: str,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the read document of a hotel (no domain hydration), limited to the response fields given"""
         collection = self._get_collection()
-        doc = self._hotel_to_document(hotel)
-        doc["updated_at"] = datetime.utcnow().isoformat()
-        doc.pop("_id", None)  # Remove _id from update
-        
-        result = await collection.update_one(
-            {"_id": ObjectId(hotel_id)},
-            {"$set": doc}
+        doc = await collection.find_one({"_id": ObjectId(hotel_id)}, read_projection(fields))
+        return self._to_read_document(doc) if doc else None
+
+    async def get_documents_by_ids(
+        self,
+        hotel_ids: List[str],
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get read documents of hotels by IDs in a single query; unknown IDs are skipped"""
+        collection = self._get_collection()
+        object_ids = [ObjectId(hotel_id) for hotel_id in set(hotel_ids) if ObjectId.is_valid(hotel_id)]
+        if not object_ids:
+            return []
+        cursor = collection.find({"_id": {"$in": object_ids}}, read_projection(fields))
+        return [self._to_read_document(doc) async for doc in cursor.batch_size(len(object_ids))]
+
+    async def get_all_documents(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get a page of hotel read documents (no domain hydration), limited to the response fields given"""
+        collection = self._get_collection()
+        cursor = collection.find({}, read_projection(fields)).skip(skip).limit(limit)
+        return [self._to_read_document(doc) async for doc in cursor]
+
+    def iter_all(self, batch_size: Optional[int] = None) -> AsyncIterator[Hotel]:
+        """Stream every hotel, fetching batch_size documents per round trip"""
+        cursor = self._get_collection().find().sort("_id", ASCENDING)
+        return self._stream(cursor, batch_size)
+
+    async def update(self, hotel_id: str, hotel: Hotel) -> Optional[Hotel]:
+        """Update the changed fields of a hotel, guarded by its version"""
+        changed = hotel.get_dirty_fields()
+        if not changed:
+            return hotel
+        doc = await update_changed_fields(
+            self._get_collection(),
+            ObjectId(hotel_id),
+            self._hotel_to_document(hotel),
+            changed,
+            hotel.version,
+            "Hotel"
         )
-        
-        if result.modified_count > 0:
-            return await self.get_by_id(hotel_id)
-        return None
+        return self._document_to_hotel(doc) if doc else None
 
     async def delete(self, hotel_id: str) -> bool:
         """Delete hotel"""
@@ -126,7 +247,23 @@ class MongoHotelRepository(IHotelRepository):
         min_rating: Optional[int] = None
     ) -> List[Hotel]:
         """Search hotels with filters"""
-        collection = self._get_collection()
+        return [
+            hotel async for hotel in self.iter_search(
+                city, check_in, check_out, guests, min_price, max_price,
+                amenities, min_rating, limit=self.SEARCH_LIMIT
+            )
+        ]
+
+    def _search_query(
+        self,
+        city: Optional[str],
+        guests: int,
+        min_price: Optional[float],
+        max_price: Optional[float],
+        amenities: Optional[List[str]],
+        min_rating: Optional[int]
+    ) -> Dict[str, Any]:
+        """Build the Mongo filter for a hotel search"""
         query = {}
         
         # City filter
@@ -152,10 +289,105 @@ class MongoHotelRepository(IHotelRepository):
         
         # Guest capacity filter
         query["rooms.capacity"] = {"$gte": guests}
-        
-        cursor = collection.find(query).limit(50)
-        hotels = []
-        async for doc in cursor:
-            hotels.append(self._document_to_hotel(doc))
-        
-        return hotels
\ No newline at end of file
+        return query
+
+    def iter_search(
+        self,
+        city: Optional[str] = None,
+        check_in: Optional[date] = None,
+        check_out: Optional[date] = None,
+        guests: int = 1,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        amenities: Optional[List[str]] = None,
+        min_rating: Optional[int] = None,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[Hotel]:
+        """Stream hotels matching the search filters"""
+        query = self._search_query(city, guests, min_price, max_price, amenities, min_rating)
+        cursor = self._get_collection().find(query)
+        if limit:
+            cursor = cursor.limit(limit)
+        return self._stream(cursor, batch_size)
+
+    async def iter_search_documents(
+        self,
+        city: Optional[str] = None,
+        check_in: Optional[date] = None,
+        check_out: Optional[date] = None,
+        guests: int = 1,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        amenities: Optional[List[str]] = None,
+        min_rating: Optional[int] = None,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream read documents of hotels matching the search filters, limited to the response fields given"""
+        query = self._search_query(city, guests, min_price, max_price, amenities, min_rating)
+        cursor = self._get_collection().find(query, read_projection(fields))
+        if limit:
+            cursor = cursor.limit(limit)
+        async for doc in cursor.batch_size(batch_size or self.batch_size):
+            yield self._to_read_document(doc)
+
+    @staticmethod
+    def _city_match(cities: List[str]) -> Dict[str, Any]:
+        return {"location.city": {"$in": cities}}
+
+    async def get_city_hotel_counts(
+        self,
+        cities: Optional[List[str]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Count hotels per city (optionally only the given cities), largest first"""
+        collection = self._get_collection()
+        pipeline: List[Dict[str, Any]] = []
+        if cities is not None:
+            pipeline.append({"$match": self._city_match(cities)})
+        pipeline += [
+            {"$group": {
+                "_id": {"city": "$location.city", "country": "$location.country"},
+                "hotels_count": {"$sum": 1}
+            }},
+            {"$sort": {"hotels_count": -1}},
+            {"$limit": limit}
+        ]
+        return [
+            {"city": doc["_id"]["city"], "country": doc["_id"]["country"], "hotels_count": doc["hotels_count"]}
+            async for doc in collection.aggregate(pipeline)
+        ]
+
+    @staticmethod
+    def _external_id_filter(external_id: str) -> Dict[str, Any]:
+        return {"external_id": external_id}
+
+    async def upsert_many_by_external_id(self, hotels: List[Hotel]) -> Tuple[int, int, List[Tuple[int, str]]]:
+        """
+        Insert or replace hotels keyed by their supplier external_id in one unordered write.
+        Returns (inserted, updated, [(index in hotels, error message)]).
+        """
+        if not hotels:
+            return 0, 0, []
+        now = datetime.utcnow()
+        operations = []
+        for hotel in hotels:
+            doc = self._hotel_to_document(hotel)
+            for field in ("_id", "created_at", "version"):
+                doc.pop(field, None)
+            doc["updated_at"] = now
+            operations.append(UpdateOne(
+                self._external_id_filter(hotel.external_id),
+                {"$set": doc, "$setOnInsert": {"created_at": now}, "$inc": {"version": 1}},
+                upsert=True
+            ))
+
+        try:
+            result = await self._get_collection().bulk_write(operations, ordered=False)
+            details = result.bulk_api_result
+        except BulkWriteError as e:
+            details = e.details
+        errors = [(error["index"], error.get("errmsg", "write failed")) for error in details.get("writeErrors", [])]
+        return details.get("nUpserted", 0), details.get("nMatched", 0), errors
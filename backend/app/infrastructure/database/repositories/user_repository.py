@@ -1,15 +1,31 @@
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 from datetime import datetime
 from bson import ObjectId
+from pymongo import ASCENDING, IndexModel
 from app.domain.interfaces.repositories import IUserRepository
 from app.domain.models.user import User, UserRole
 from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.indexes import QueryShape
+from app.infrastructure.database.bson_dates import bson_to_datetime
+from app.infrastructure.database.partial_update import update_changed_fields
 
 class MongoUserRepository(IUserRepository):
     """
     MongoDB implementation of User repository.
     Manages user data persistence.
     """
+    INDEXES = [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+    ]
+
+    def query_shapes(self) -> List[QueryShape]:
+        """The queries this repository issues, built by the same code with fixed values"""
+        return [QueryShape("by_email", self._email_filter("user@example.com"))]
+
+    @staticmethod
+    def _email_filter(email: str) -> Dict[str, Any]:
+        return {"email": email}
+
     def __init__(self):
         self.collection_name = "users"
 
@@ -29,8 +45,9 @@ class MongoUserRepository(IUserRepository):
             is_active=doc.get("is_active", True),
             is_verified=doc.get("is_verified", False),
             preferences=doc.get("preferences", {}),
-            created_at=datetime.fromisoformat(doc["created_at"]) if doc.get("created_at") else None,
-            updated_at=datetime.fromisoformat(doc["updated_at"]) if doc.get("updated_at") else None
+            created_at=bson_to_datetime(doc.get("created_at")),
+            updated_at=bson_to_datetime(doc.get("updated_at")),
+            version=doc.get("version", 0)
         )
 
     def _user_to_document(self, user: User) -> Dict[str, Any]:
@@ -46,11 +63,12 @@ class MongoUserRepository(IUserRepository):
         """Create a new user"""
         collection = self._get_collection()
         doc = self._user_to_document(user)
-        doc["created_at"] = datetime.utcnow().isoformat()
-        doc["updated_at"] = datetime.utcnow().isoformat()
+        doc["created_at"] = datetime.utcnow()
+        doc["updated_at"] = datetime.utcnow()
         
         result = await collection.insert_one(doc)
         user.user_id = str(result.inserted_id)
+        user.mark_clean()
         return user
 
     async def get_by_id(self, user_id: str) -> Optional[User]:
@@ -62,24 +80,23 @@ class MongoUserRepository(IUserRepository):
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
         collection = self._get_collection()
-        doc = await collection.find_one({"email": email})
+        doc = await collection.find_one(self._email_filter(email))
         return self._document_to_user(doc) if doc else None
 
     async def update(self, user_id: str, user: User) -> Optional[User]:
-        """Update user"""
-        collection = self._get_collection()
-        doc = self._user_to_document(user)
-        doc["updated_at"] = datetime.utcnow().isoformat()
-        doc.pop("_id", None)
-        
-        result = await collection.update_one(
-            {"_id": ObjectId(user_id)},
-            {"$set": doc}
+        """Update the changed fields of a user, guarded by its version"""
+        changed = user.get_dirty_fields()
+        if not changed:
+            return user
+        doc = await update_changed_fields(
+            self._get_collection(),
+            ObjectId(user_id),
+            self._user_to_document(user),
+            changed,
+            user.version,
+            "User"
         )
-        
-        if result.modified_count > 0:
-            return await self.get_by_id(user_id)
-        return None
+        return self._document_to_user(doc) if doc else None
 
     async def delete(self, user_id: str) -> bool:
         """Delete user"""
@@ -0,0 +1,38 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+class PeriodicTask:
+    """
+    Runs an async job on a fixed interval in the background.
+    Failures are logged and the job is retried on the next tick.
+    """
+    def __init__(self, name: str, interval_seconds: float, job: Callable[[], Awaitable[object]]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.job = job
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Schedule the job loop on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self):
+        """Cancel the job loop and wait for it to finish"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.job()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Background task {self.name} failed: {e}")
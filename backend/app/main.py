@@ -2,34 +2,108 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
+from datetime import timedelta
 
 from app.config import settings
 from app.infrastructure.database.mongodb import MongoDB
-from app.presentation.api.v1 import hotels, bookings, search, auth
+from app.infrastructure.database.indexes import ensure_indexes, verify_query_shapes
+from app.infrastructure.database.bson_dates import load_migration_state
+from app.infrastructure.tasks.periodic import PeriodicTask
+from app.dependencies import (
+    get_booking_service,
+    get_popularity_tracker,
+    get_repositories
+)
+from app.presentation.api.v1 import hotels, bookings, search, auth, analytics
 from app.presentation.middleware.cors import setup_cors
+from app.presentation.middleware.compression import setup_compression
+from app.presentation.middleware.msgpack import setup_msgpack
+from app.presentation.responses import ORJSONResponse
 from app.presentation.middleware.error_handler import (
     http_exception_handler,
     validation_exception_handler,
     general_exception_handler
 )
 
+async def sweep_expired_holds():
+    """Release inventory held by pending bookings that were never confirmed"""
+    expired = await get_booking_service().expire_stale_holds(settings.BOOKING_HOLD_SWEEP_BATCH_SIZE)
+    if expired:
+        print(f"🧹 Expired {expired} pending booking holds")
+
+async def archive_old_bookings():
+    """Move finished bookings past the retention window to the archive"""
+    archived = await get_booking_service().archive_old_bookings(
+        timedelta(days=settings.BOOKING_ARCHIVE_RETENTION_DAYS),
+        settings.BOOKING_ARCHIVE_BATCH_SIZE
+    )
+    if archived:
+        print(f"🗄️ Archived {archived} finished bookings")
+
+async def refresh_date_migration_state():
+    """Stop matching legacy string dates once app.migrate_dates finishes a collection"""
+    await load_migration_state(MongoDB.get_database())
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     await MongoDB.connect_to_mongo()
+    for report in await ensure_indexes(get_repositories()):
+        print(f"📇 Indexes on {report.collection}: "
+              f"{len(report.created)} created, {len(report.existing)} already present")
+    migrated = await load_migration_state(MongoDB.get_database())
+    print(f"📅 BSON date migration finished for: {', '.join(sorted(migrated)) or 'no collections'}")
+    date_migration_checker = PeriodicTask(
+        "date-migration-checker",
+        settings.DATE_MIGRATION_CHECK_INTERVAL_SECONDS,
+        refresh_date_migration_state
+    )
+    date_migration_checker.start()
+    if settings.VERIFY_QUERY_SHAPES:
+        await verify_query_shapes(get_repositories())
+        print("✅ All repository query shapes use an index")
+    hold_sweeper = PeriodicTask(
+        "booking-hold-sweeper",
+        settings.BOOKING_HOLD_SWEEP_INTERVAL_SECONDS,
+        sweep_expired_holds
+    )
+    hold_sweeper.start()
+    popularity_tracker = get_popularity_tracker()
+    await popularity_tracker.warm_up(timedelta(days=settings.POPULARITY_WARMUP_DAYS))
+    popularity_refresher = PeriodicTask(
+        "popularity-refresher",
+        settings.POPULARITY_REFRESH_INTERVAL_SECONDS,
+        popularity_tracker.refresh
+    )
+    popularity_refresher.start()
+    booking_archiver = PeriodicTask(
+        "booking-archiver",
+        settings.BOOKING_ARCHIVE_INTERVAL_SECONDS,
+        archive_old_bookings
+    )
+    if settings.BOOKING_ARCHIVE_ENABLED:
+        booking_archiver.start()
     yield
     # Shutdown
+    await booking_archiver.stop()
+    await popularity_refresher.stop()
+    await hold_sweeper.stop()
+    await date_migration_checker.stop()
     await MongoDB.close_mongo_connection()
 
 app = FastAPI(
     title="Trivago Clone API",
     description="Hotel booking platform with clean architecture",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 setup_cors(app)
+# Registered before compression so compression wraps it
+setup_msgpack(app)
+setup_compression(app)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
@@ -39,6 +113,7 @@ app.include_router(auth.router, prefix="/api/v1")
 app.include_router(hotels.router, prefix="/api/v1")
 app.include_router(bookings.router, prefix="/api/v1")
 app.include_router(search.router, prefix="/api/v1")
+app.include_router(analytics.router, prefix="/api/v1")
 
 @app.get("/")
 async def root():
@@ -52,4 +127,12 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/health/db")
+async def database_health_check():
+    """Database round trip time and connection pool metrics"""
+    return {
+        "ping_ms": round(await MongoDB.ping(), 2),
+        "pools": MongoDB.pool_metrics.snapshot()
+    }
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Online migration of ISO string dates to native BSON Dates.
+
+Walks each collection in _id order in small batches and rewrites string
+date fields with bulk_write. Every update is conditional on the field
+still holding the original string, so documents rewritten by the running
+application in the meantime are left alone. Progress is checkpointed in
+the `migrations` collection, so an interrupted run resumes where it stopped.
+Once a collection is marked done, the application stops matching legacy
+string dates in its queries (picked up at startup and every
+DATE_MIGRATION_CHECK_INTERVAL_SECONDS).
+
+Usage (from the backend directory):
+    python -m app.migrate_dates [--batch-size 500] [--pause-ms 50] [--restart]
+"""
+import argparse
+import asyncio
+from datetime import datetime
+from typing import Any, Dict
+from pymongo import UpdateOne
+from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.bson_dates import date_to_bson, bson_to_date, MIGRATION_ID, MIGRATIONS_COLLECTION
+from app.infrastructure.database.repositories.booking_repository import ARCHIVE_COLLECTION
+
+BOOKING_DATE_FIELDS: Dict[str, str] = {
+    "check_in_date": "date",
+    "check_out_date": "date",
+    "created_at": "datetime",
+    "updated_at": "datetime",
+    "hold_expires_at": "datetime"
+}
+
+# collection -> {field: "date" | "datetime"}
+DATE_FIELDS: Dict[str, Dict[str, str]] = {
+    "bookings": BOOKING_DATE_FIELDS,
+    # Archived bookings are copied verbatim, legacy strings included
+    ARCHIVE_COLLECTION: BOOKING_DATE_FIELDS,
+    "hotels": {"created_at": "datetime", "updated_at": "datetime"},
+    "users": {"created_at": "datetime", "updated_at": "datetime"},
+}
+
+def _convert(value: str, kind: str) -> datetime:
+    """Convert a legacy ISO string to the value stored from now on"""
+    if kind == "date":
+        return date_to_bson(bson_to_date(value))
+    return datetime.fromisoformat(value)
+
+async def migrate_collection(name: str, fields: Dict[str, str], batch_size: int, pause_ms: int, restart: bool) -> int:
+    """Convert one collection, resuming from its checkpoint; returns documents updated"""
+    db = MongoDB.get_database()
+    collection = db[name]
+    checkpoints = db[MIGRATIONS_COLLECTION]
+    checkpoint_id = f"{MIGRATION_ID}.{name}"
+
+    checkpoint = None if restart else await checkpoints.find_one({"_id": checkpoint_id})
+    if checkpoint and checkpoint.get("done"):
+        print(f"⏭️  {name}: already migrated")
+        return 0
+    last_id = checkpoint.get("last_id") if checkpoint else None
+    updated = checkpoint.get("updated", 0) if checkpoint else 0
+    skipped = 0
+
+    string_fields = {"$or": [{field: {"$type": "string"}} for field in fields]}
+    while True:
+        query: Dict[str, Any] = dict(string_fields)
+        if last_id is not None:
+            query = {"$and": [{"_id": {"$gt": last_id}}, string_fields]}
+        docs = await collection.find(query, {field: 1 for field in fields}) \
+            .sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+        if not docs:
+            break
+
+        operations = []
+        for doc in docs:
+            original = {f: v for f, v in doc.items() if f in fields and isinstance(v, str)}
+            try:
+                converted = {f: _convert(v, fields[f]) for f, v in original.items()}
+            except ValueError:
+                skipped += 1
+                continue
+            operations.append(UpdateOne({"_id": doc["_id"], **original}, {"$set": converted}))
+
+        if operations:
+            result = await collection.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+        last_id = docs[-1]["_id"]
+        await checkpoints.update_one(
+            {"_id": checkpoint_id},
+            {"$set": {"last_id": last_id, "updated": updated, "done": False}},
+            upsert=True
+        )
+        print(f"  {name}: {updated} documents converted")
+        if pause_ms:
+            await asyncio.sleep(pause_ms / 1000)
+
+    await checkpoints.update_one(
+        {"_id": checkpoint_id},
+        {"$set": {"updated": updated, "done": True, "finished_at": datetime.utcnow()}},
+        upsert=True
+    )
+    if skipped:
+        print(f"⚠️ {name}: {skipped} documents with unparseable dates left unchanged")
+    print(f"✅ {name}: migration complete ({updated} documents converted)")
+    return updated
+
+async def main():
+    """Run the date migration over all collections"""
+    parser = argparse.ArgumentParser(description="Convert ISO string dates to BSON Dates")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause-ms", type=int, default=50, help="Pause between batches to limit load")
+    parser.add_argument("--restart", action="store_true", help="Ignore saved checkpoints")
+    args = parser.parse_args()
+
+    await MongoDB.connect_to_mongo()
+    try:
+        for name, fields in DATE_FIELDS.items():
+            await migrate_collection(name, fields, args.batch_size, args.pause_ms, args.restart)
+    finally:
+        await MongoDB.close_mongo_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""
+Analytics API endpoints.
+Serves hotel reports from precomputed rollups.
+"""
+from typing import Optional
+from datetime import date, datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.application.services.analytics_service import AnalyticsService
+from app.application.services.booking_export_service import (
+    BookingExportService,
+    ExportFormat,
+    EXPORT_MEDIA_TYPES,
+    EXPORT_EXTENSIONS,
+    export_watermark
+)
+from app.application.dto.analytics_dto import HotelOccupancyReportDTO
+from app.dependencies import get_analytics_service, get_booking_export_service
+from app.presentation.negotiation import MessagePackRoute
+
+router = APIRouter(prefix="/analytics", tags=["analytics"], route_class=MessagePackRoute)
+
+@router.get("/hotels/{hotel_id}/daily", response_model=HotelOccupancyReportDTO)
+async def get_hotel_daily_report(
+hotel_id: str,
+start_date: date = Query(...),
+end_date: date = Query(...),
+room_type: Optional[str] = Query(None),
+service: AnalyticsService = Depends(get_analytics_service)
+):
+    """Get daily occupancy rate, ADR and revenue for a hotel"""
+    try:
+        report = await service.get_hotel_daily_report(hotel_id, start_date, end_date, room_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not report:
+        raise HTTPException(status_code=404, detail="Hotel not found")
+    return report
+
+@router.get("/bookings/export")
+async def export_bookings(
+format: ExportFormat = Query(ExportFormat.CSV),
+updated_since: Optional[datetime] = Query(None, description="Watermark of the previous export"),
+hotel_id: Optional[str] = Query(None),
+check_in_from: Optional[date] = Query(None),
+check_in_to: Optional[date] = Query(None),
+include_archived: bool = Query(False),
+service: BookingExportService = Depends(get_booking_export_service)
+):
+    """
+    Stream bookings as gzipped CSV, Parquet or Arrow.
+    The X-Export-Watermark header is the updated_since of the next incremental export.
+    """
+    watermark = export_watermark()
+    try:
+        stream = service.open_export(
+            format, updated_since, watermark, hotel_id, check_in_from, check_in_to, include_archived
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    filename = f"bookings-{watermark:%Y%m%dT%H%M%S}.{EXPORT_EXTENSIONS[format]}"
+    return StreamingResponse(
+        stream,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Export-Watermark": watermark.isoformat()
+        }
+    )
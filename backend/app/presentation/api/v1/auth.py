@@ -5,8 +5,10 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr
 from app.infrastructure.security.auth import AuthService
 from app.dependencies import get_user_repository
+from app.presentation.cache_policy import no_store
+from app.presentation.negotiation import MessagePackRoute
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter(prefix="/auth", tags=["authentication"], dependencies=[Depends(no_store)], route_class=MessagePackRoute)
 security = HTTPBearer()
 
 class LoginRequest(BaseModel):
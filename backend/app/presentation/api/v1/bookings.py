@@ -2,13 +2,25 @@
 Booking API endpoints.
 Manages booking-related HTTP operations.
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.domain.models.booking import BookingStatus
+from app.domain.exceptions import ConcurrentModificationError
 from app.application.services.booking_service import BookingService
-from app.application.dto.booking_dto import CreateBookingDTO, BookingResponseDTO
+from app.application.dto.booking_dto import (
+    CreateBookingDTO,
+    BookingResponseDTO,
+    BookingPageDTO,
+    BulkCreateBookingDTO,
+    BulkBookingMode,
+    BulkBookingResultDTO
+)
 from ....dependencies import get_booking_service
+from app.presentation.cache_policy import no_store
+from app.presentation.negotiation import MessagePackRoute
 
-router = APIRouter(prefix="/bookings", tags=["bookings"])
+router = APIRouter(prefix="/bookings", tags=["bookings"], dependencies=[Depends(no_store)], route_class=MessagePackRoute)
 
 @router.post("/", response_model=BookingResponseDTO, status_code=201)
 async def create_booking(booking_dto: CreateBookingDTO,
@@ -22,13 +34,26 @@ service: BookingService = Depends(get_booking_service)):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     
+@router.post("/bulk", response_model=BulkBookingResultDTO, status_code=201)
+async def create_bookings_bulk(bulk_dto: BulkCreateBookingDTO,
+service: BookingService = Depends(get_booking_service)):
+    """Create several bookings in one request"""
+    result = await service.create_bookings_bulk(bulk_dto)
+    if result.failed and bulk_dto.mode == BulkBookingMode.ALL_OR_NOTHING:
+        raise HTTPException(
+            status_code=400,
+            detail=[failure.model_dump() for failure in result.failed]
+        )
+    return result
+
 @router.get("/{booking_id}", response_model=BookingResponseDTO)
 async def get_booking(
 booking_id: str,
+include_history: bool = Query(False, description="Also look in archived bookings"),
 service: BookingService = Depends(get_booking_service)
 ):
     """Get booking by ID"""
-    booking = await service.get_booking(booking_id)
+    booking = await service.get_booking(booking_id, include_history)
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     return booking
@@ -36,10 +61,49 @@ service: BookingService = Depends(get_booking_service)
 @router.get("/user/{user_id}", response_model=List[BookingResponseDTO])
 async def get_user_bookings(
 user_id: str,
+include_history: bool = Query(False, description="Also include archived bookings"),
 service: BookingService = Depends(get_booking_service)
 ):
     """Get all bookings for a user"""
-    return await service.get_user_bookings(user_id)
+    return await service.get_user_bookings(user_id, include_history)
+
+@router.get("/user/{user_id}/page", response_model=BookingPageDTO)
+async def list_user_bookings(
+user_id: str,
+status: Optional[List[BookingStatus]] = Query(None),
+check_in_from: Optional[date] = Query(None),
+check_in_to: Optional[date] = Query(None),
+cursor: Optional[str] = Query(None),
+limit: int = Query(20, ge=1, le=100),
+include_history: bool = Query(False, description="Also include archived bookings"),
+service: BookingService = Depends(get_booking_service)
+):
+    """Get a page of a user's bookings, newest first"""
+    try:
+        return await service.list_user_bookings(
+            user_id, status, check_in_from, check_in_to, cursor, limit, include_history
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/hotel/{hotel_id}", response_model=BookingPageDTO)
+async def list_hotel_bookings(
+hotel_id: str,
+status: Optional[List[BookingStatus]] = Query(None),
+check_in_from: Optional[date] = Query(None),
+check_in_to: Optional[date] = Query(None),
+cursor: Optional[str] = Query(None),
+limit: int = Query(20, ge=1, le=100),
+include_history: bool = Query(False, description="Also include archived bookings"),
+service: BookingService = Depends(get_booking_service)
+):
+    """Get a page of a hotel's bookings ordered by check-in date"""
+    try:
+        return await service.list_hotel_bookings(
+            hotel_id, status, check_in_from, check_in_to, cursor, limit, include_history
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/{booking_id}/cancel", response_model=BookingResponseDTO)
 async def cancel_booking(
@@ -52,6 +116,8 @@ service: BookingService = Depends(get_booking_service)
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found")
         return booking
+    except ConcurrentModificationError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     
@@ -66,6 +132,8 @@ service: BookingService = Depends(get_booking_service)
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found")
         return booking
+    except ConcurrentModificationError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -3,12 +3,41 @@ Hotel API endpoints.
 Handles HTTP requests and responses for hotel operations.
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from app.domain.exceptions import ConcurrentModificationError, PreconditionFailedError
 from app.application.services.hotel_service import HotelService
-from app.application.dto.hotel_dto import CreateHotelDTO, UpdateHotelDTO, HotelResponseDTO
-from app.dependencies import get_hotel_service
+from app.application.services.hotel_import_service import HotelImportService, iter_text_lines, iter_msgpack_records
+from app.application.dto.hotel_dto import (
+    CreateHotelDTO,
+    UpdateHotelDTO,
+    HotelResponseDTO,
+    HotelBatchRequestDTO,
+    HotelBatchResponseDTO,
+    MAX_BATCH_HOTELS,
+    VERSION_FIELDS,
+    parse_hotel_fields
+)
+from app.application.dto.import_dto import ImportFormat, HotelImportResultDTO
+from app.application.services.availability_feed import AvailabilityFeed
+from app.dependencies import get_hotel_service, get_hotel_import_service, get_availability_feed
+from app.config import settings
+from app.presentation.responses import ORJSONResponse, encoded_response
+from app.application.services.surrogate_keys import CATALOG_KEY, HOTEL_LIST_KEY, hotel_key
+from app.presentation.etags import hotel_etag, hotels_etag, none_match, if_match, not_modified
+from app.presentation.cache_policy import HOTEL_POLICY
+from app.presentation.events import event_stream_response
+from app.presentation.negotiation import MessagePackRoute
 
-router = APIRouter(prefix="/hotels", tags=["hotels"])
+router = APIRouter(prefix="/hotels", tags=["hotels"], route_class=MessagePackRoute)
+
+FIELDS_DESCRIPTION = "Comma-separated response fields, or a preset: card, detail"
+
+def _fields(fields: Optional[str]):
+    """Parse a fields= parameter, mapping unknown fields to 400"""
+    try:
+        return parse_hotel_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/", response_model=HotelResponseDTO, status_code=201)
 async def create_hotel(
@@ -20,37 +49,144 @@ async def create_hotel(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/import", response_model=HotelImportResultDTO)
+async def import_hotels(
+request: Request,
+format: ImportFormat = Query(ImportFormat.NDJSON),
+service: HotelImportService = Depends(get_hotel_import_service)
+):
+    """Bulk import a catalog streamed as the raw request body (NDJSON, CSV or MessagePack records)"""
+    if format == ImportFormat.MSGPACK:
+        records = iter_msgpack_records(request.stream())
+    else:
+        records = iter_text_lines(request.stream())
+    try:
+        return await service.import_lines(records, format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _batch_ids(ids: List[str]) -> List[str]:
+    """Flatten repeated and comma-separated ids, enforcing the batch limit"""
+    hotel_ids = [hotel_id.strip() for value in ids for hotel_id in value.split(",") if hotel_id.strip()]
+    if not hotel_ids:
+        raise HTTPException(status_code=400, detail="At least one hotel id is required")
+    if len(hotel_ids) > MAX_BATCH_HOTELS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_HOTELS} hotels per batch")
+    return hotel_ids
+
+@router.get("/batch", response_model=HotelBatchResponseDTO)
+async def get_hotels_batch(
+request: Request,
+ids: List[str] = Query(..., description="Hotel ids, comma-separated or repeated"),
+fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+service: HotelService = Depends(get_hotel_service)
+):
+    """Get several hotels in one request, in the order requested"""
+    selected = _fields(fields)
+    hotel_ids = _batch_ids(ids)
+    batch = await service.get_hotels_batch(hotel_ids, selected)
+    etag = hotels_etag(batch.hotels, *batch.missing, *(selected or ()))
+    cache_headers = HOTEL_POLICY.headers([CATALOG_KEY, *(hotel_key(hotel_id) for hotel_id in hotel_ids)])
+    if none_match(request, etag):
+        return not_modified(etag, cache_headers)
+    return ORJSONResponse(batch, headers={"ETag": etag, **cache_headers})
+
+@router.post("/batch", response_model=HotelBatchResponseDTO)
+async def post_hotels_batch(
+batch_dto: HotelBatchRequestDTO,
+fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+service: HotelService = Depends(get_hotel_service)
+):
+    """Get several hotels in one request (for id lists too long for a query string)"""
+    return ORJSONResponse(await service.get_hotels_batch(batch_dto.ids, _fields(fields)))
+
 @router.get("/{hotel_id}", response_model=HotelResponseDTO)
 async def get_hotel(
     hotel_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     service: HotelService = Depends(get_hotel_service)
 ):
     """Get hotel by ID"""
-    hotel = await service.get_hotel(hotel_id)
+    selected = _fields(fields)
+    cache_headers = HOTEL_POLICY.headers([hotel_key(hotel_id), CATALOG_KEY])
+    # The encoded response cache only holds full representations
+    if selected is None and service.caches_details:
+        payload = await service.get_hotel_payload(hotel_id)
+        if not payload:
+            raise HTTPException(status_code=404, detail="Hotel not found")
+        if payload.etag and none_match(request, payload.etag):
+            return not_modified(payload.etag, cache_headers)
+        return encoded_response(payload, request, cache_headers)
+    if request.headers.get("if-none-match"):
+        # Revalidate from id and updated_at before reading the whole hotel
+        stamp = await service.get_hotel(hotel_id, VERSION_FIELDS)
+        if not stamp:
+            raise HTTPException(status_code=404, detail="Hotel not found")
+        etag = hotel_etag(stamp) if selected is None else hotels_etag([stamp], *selected)
+        if none_match(request, etag):
+            return not_modified(etag, cache_headers)
+    hotel = await service.get_hotel(hotel_id, selected)
     if not hotel:
         raise HTTPException(status_code=404, detail="Hotel not found")
-    return hotel
+    etag = hotel_etag(hotel) if selected is None else hotels_etag([hotel], *selected)
+    return ORJSONResponse(hotel, headers={"ETag": etag, **cache_headers})
+
+@router.get("/{hotel_id}/events")
+async def hotel_events(
+    hotel_id: str,
+    service: HotelService = Depends(get_hotel_service),
+    feed: AvailabilityFeed = Depends(get_availability_feed)
+):
+    """Stream a hotel's availability and price changes as server-sent events"""
+    if not await service.get_hotel(hotel_id, VERSION_FIELDS):
+        raise HTTPException(status_code=404, detail="Hotel not found")
+    return event_stream_response(feed, [hotel_key(hotel_id)], settings.FEED_HEARTBEAT_SECONDS)
 
 @router.get("/", response_model=List[HotelResponseDTO])
 async def list_hotels(
+request: Request,
 skip: int = Query(0, ge=0),
 limit: int = Query(100, ge=1, le=100),
+fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
 service: HotelService = Depends(get_hotel_service)
 ):
     """List all hotels with pagination"""
-    return await service.list_hotels(skip, limit)
+    selected = _fields(fields)
+    if request.headers.get("if-none-match"):
+        # Revalidate from a page of ids and updated_at before reading whole hotels
+        stamps = await service.list_hotels(skip, limit, VERSION_FIELDS)
+        etag = hotels_etag(stamps, skip, limit, *(selected or ()))
+        if none_match(request, etag):
+            keys = [hotel_key(h["id"]) for h in stamps]
+            return not_modified(etag, HOTEL_POLICY.headers([HOTEL_LIST_KEY, CATALOG_KEY, *keys]))
+    hotels = await service.list_hotels(skip, limit, selected)
+    etag = hotels_etag(hotels, skip, limit, *(selected or ()))
+    keys = [hotel_key(h["id"] if selected else h.id) for h in hotels]
+    cache_headers = HOTEL_POLICY.headers([HOTEL_LIST_KEY, CATALOG_KEY, *keys])
+    return ORJSONResponse(hotels, headers={"ETag": etag, **cache_headers})
 
 @router.put("/{hotel_id}", response_model=HotelResponseDTO)
 async def update_hotel(
 hotel_id: str,
 hotel_dto: UpdateHotelDTO,
+if_match_header: Optional[str] = Header(None, alias="If-Match"),
 service: HotelService = Depends(get_hotel_service)
 ):
-    """Update hotel information"""
-    hotel = await service.update_hotel(hotel_id, hotel_dto)
+    """Update hotel information; honours If-Match with the hotel's ETag"""
+    precondition = None
+    if if_match_header is not None:
+        precondition = lambda current: if_match(if_match_header, hotel_etag(current))
+    try:
+        hotel = await service.update_hotel(hotel_id, hotel_dto, precondition)
+    except PreconditionFailedError as e:
+        raise HTTPException(status_code=412, detail=str(e))
+    except ConcurrentModificationError as e:
+        # The hotel changed after the precondition was checked
+        raise HTTPException(status_code=412 if precondition else 409, detail=str(e))
     if not hotel:
         raise HTTPException(status_code=404, detail="Hotel not found")
-    return hotel
+    return ORJSONResponse(hotel, headers={"ETag": hotel_etag(hotel)})
 
 @router.delete("/{hotel_id}", status_code=204)
 async def delete_hotel(
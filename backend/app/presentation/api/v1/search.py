@@ -3,19 +3,35 @@ Search API endpoints.
 Handles advanced hotel search operations.
 """
 from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from datetime import date
 from app.application.services.search_service import SearchService
 from app.application.dto.search_dto import SearchQueryDTO, SearchResultDTO
-from app.application.dto.hotel_dto import HotelResponseDTO
-from app.dependencies import get_search_service
+from app.application.dto.hotel_dto import HotelResponseDTO, parse_hotel_fields
+from app.application.services.availability_feed import AvailabilityFeed
+from app.dependencies import get_search_service, get_availability_feed
+from app.config import settings
+from app.presentation.responses import ORJSONResponse
+from app.application.services.surrogate_keys import (
+    CATALOG_KEY,
+    SEARCH_KEY,
+    DESTINATIONS_KEY,
+    TRENDING_KEY,
+    hotel_key,
+    city_key
+)
+from app.presentation.etags import hotels_etag, none_match, not_modified
+from app.presentation.cache_policy import SEARCH_POLICY, POPULAR_POLICY
+from app.presentation.events import event_stream_response
 from typing import Optional
+from app.presentation.negotiation import MessagePackRoute
 
 
-router = APIRouter(prefix="/search", tags=["search"])
+router = APIRouter(prefix="/search", tags=["search"], route_class=MessagePackRoute)
 
 @router.get("/hotels", response_model=SearchResultDTO)
 async def search_hotels(
+request: Request,
 destination: Optional[str] = Query(None),
 check_in: Optional[date] = Query(None),
 check_out: Optional[date] = Query(None),
@@ -27,9 +43,14 @@ min_rating: Optional[int] = Query(None, ge=1, le=5),
 sort_by: str = Query("relevance"),
 page: int = Query(0, ge=0),
 page_size: int = Query(20, ge=1, le=100),
+fields: Optional[str] = Query(None, description="Comma-separated hotel fields, or a preset: card, detail"),
 service: SearchService = Depends(get_search_service)
 ):
     """Advanced hotel search with filters and sorting"""
+    try:
+        selected = parse_hotel_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     query = SearchQueryDTO(
     destination=destination,
     check_in_date=check_in,
@@ -43,14 +64,42 @@ service: SearchService = Depends(get_search_service)
     page=page,
     page_size=page_size
     )
-    return await service.search(query)
+    result = await service.search(query, selected)
+    # Weak: equal tags mean the same hotels in the same order, not identical bytes
+    etag = hotels_etag(result.hotels, result.total_count, page, page_size, *(selected or ()), weak=True)
+    keys = [SEARCH_KEY, CATALOG_KEY]
+    if destination:
+        keys.append(city_key(destination))
+    keys.extend(hotel_key(hotel["id"] if selected else hotel.id) for hotel in result.hotels)
+    cache_headers = SEARCH_POLICY.headers(keys)
+    if none_match(request, etag):
+        return not_modified(etag, cache_headers)
+    return ORJSONResponse(result, headers={"ETag": etag, **cache_headers})
+
+@router.get("/hotels/events")
+async def search_events(
+destination: Optional[str] = Query(None, description="Exact city name (case-insensitive)"),
+feed: AvailabilityFeed = Depends(get_availability_feed)
+):
+    """
+    Stream availability and price changes for hotels in a destination as server-sent events.
+    Unlike search, destination is not a partial match: events are routed by
+    city, so it must name a whole city ("Paris", not "Par").
+    """
+    if not destination or not destination.strip():
+        raise HTTPException(status_code=400, detail="destination is required")
+    return event_stream_response(feed, [city_key(destination)], settings.FEED_HEARTBEAT_SECONDS)
 
 @router.get("/destinations/popular", response_model=List[Dict[str, Any]])
 async def get_popular_destinations(
+limit: int = Query(5, ge=1, le=50),
 service: SearchService = Depends(get_search_service)
 ):
     """Get list of popular destinations"""
-    return await service.get_popular_destinations()
+    return ORJSONResponse(
+        await service.get_popular_destinations(limit),
+        headers=POPULAR_POLICY.headers([DESTINATIONS_KEY])
+    )
 
 @router.get("/hotels/trending", response_model=List[HotelResponseDTO])
 async def get_trending_hotels(
@@ -58,4 +107,8 @@ limit: int = Query(10, ge=1, le=50),
 service: SearchService = Depends(get_search_service)
 ):
     """Get trending hotels"""
-    return await service.get_trending_hotels(limit)
\ No newline at end of file
+    hotels = await service.get_trending_hotels(limit)
+    return ORJSONResponse(
+        hotels,
+        headers=POPULAR_POLICY.headers([TRENDING_KEY, CATALOG_KEY, *(hotel_key(h.id) for h in hotels)])
+    )
\ No newline at end of file
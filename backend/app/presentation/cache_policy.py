@@ -0,0 +1,55 @@
+"""
+HTTP caching policies.
+Cache-Control and Surrogate-Key headers that let a CDN or reverse proxy
+serve anonymous reads without reaching the API workers.
+"""
+from typing import Dict, Iterable, Optional
+from fastapi import Response
+from app.config import settings
+
+class CachePolicy:
+    """Cache-Control directives for one kind of response"""
+    def __init__(
+        self,
+        max_age: int = 0,
+        shared_max_age: Optional[int] = None,
+        stale_while_revalidate: int = 0,
+        no_store: bool = False
+    ):
+        if no_store:
+            self.cache_control = "no-store"
+        else:
+            directives = ["public", f"max-age={max_age}"]
+            if shared_max_age is not None:
+                directives.append(f"s-maxage={shared_max_age}")
+            if stale_while_revalidate:
+                directives.append(f"stale-while-revalidate={stale_while_revalidate}")
+            self.cache_control = ", ".join(directives)
+
+    def headers(self, surrogate_keys: Iterable[str] = ()) -> Dict[str, str]:
+        """Caching headers for a response tagged with the given surrogate keys"""
+        headers = {"Cache-Control": self.cache_control}
+        keys = " ".join(dict.fromkeys(surrogate_keys))
+        if keys:
+            headers["Surrogate-Key"] = keys
+        return headers
+
+# Hotel pages only change through HotelService writes, which purge them
+HOTEL_POLICY = CachePolicy(
+    max_age=settings.CACHE_HOTEL_MAX_AGE_SECONDS,
+    shared_max_age=settings.CACHE_HOTEL_SHARED_MAX_AGE_SECONDS,
+    stale_while_revalidate=60
+)
+SEARCH_POLICY = CachePolicy(
+    max_age=settings.CACHE_SEARCH_MAX_AGE_SECONDS,
+    shared_max_age=settings.CACHE_SEARCH_MAX_AGE_SECONDS * 2
+)
+POPULAR_POLICY = CachePolicy(
+    max_age=settings.CACHE_POPULAR_MAX_AGE_SECONDS,
+    shared_max_age=settings.CACHE_POPULAR_MAX_AGE_SECONDS
+)
+NO_STORE_POLICY = CachePolicy(no_store=True)
+
+def no_store(response: Response):
+    """Router dependency marking responses as uncacheable (bookings, auth)"""
+    response.headers.update(NO_STORE_POLICY.headers())
@@ -0,0 +1,80 @@
+"""
+HTTP content encodings.
+gzip is always available; zstd and brotli are used when installed.
+"""
+import gzip
+import zlib
+from typing import Callable, Dict, Iterable, Optional
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+Encoder = Callable[[bytes], bytes]
+
+def available_encoders(level: int = 6) -> Dict[str, Encoder]:
+    """Get Content-Encoding -> compressor for installed codecs, in server preference order"""
+    encoders: Dict[str, Encoder] = {}
+    if zstandard is not None:
+        encoders["zstd"] = zstandard.ZstdCompressor(level=level).compress
+    if brotli is not None:
+        quality = min(level, 11)
+        encoders["br"] = lambda data: brotli.compress(data, quality=quality)
+    gzip_level = min(max(level, 1), 9)
+    # mtime=0 keeps the output stable for identical input
+    encoders["gzip"] = lambda data: gzip.compress(data, compresslevel=gzip_level, mtime=0)
+    return encoders
+
+class StreamCompressor:
+    """Incremental compressor for one of the available encodings"""
+    def __init__(self, encoding: str, level: int = 6):
+        if encoding == "zstd" and zstandard is not None:
+            compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            self._compress, self._flush = compressor.compress, compressor.flush
+        elif encoding == "br" and brotli is not None:
+            compressor = brotli.Compressor(quality=min(level, 11))
+            self._compress, self._flush = compressor.process, compressor.finish
+        elif encoding == "gzip":
+            # wbits=31 writes a gzip header and trailer
+            compressor = zlib.compressobj(min(max(level, 1), 9), zlib.DEFLATED, 31)
+            self._compress, self._flush = compressor.compress, compressor.flush
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def flush(self) -> bytes:
+        return self._flush()
+
+def choose_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """
+    Pick the content encoding for a request.
+    Follows server preference among the codings the client accepts
+    (q > 0); returns None when the body should be sent uncompressed.
+    """
+    if not accept_encoding:
+        return None
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for coding in available:
+        if accepted.get(coding, wildcard) > 0:
+            return coding
+    return None
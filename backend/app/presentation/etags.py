@@ -0,0 +1,75 @@
+"""
+Entity tags and conditional request handling.
+Hotel tags derive from the hotel id and updated_at, which every write bumps.
+Compressed representations carry the tag suffixed with their content-coding.
+"""
+import hashlib
+from typing import Any, Dict, Iterable, Optional, Union
+from fastapi import Request
+from fastapi.responses import Response
+from app.application.dto.hotel_dto import HotelResponseDTO
+
+def _digest(parts: Iterable[str]) -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+Hotel = Union[HotelResponseDTO, Dict[str, Any]]
+
+def _field(hotel: Hotel, name: str) -> str:
+    # Sparse responses are plain dicts that always carry id and updated_at
+    return hotel[name] if isinstance(hotel, dict) else getattr(hotel, name)
+
+def hotel_etag(hotel: Hotel) -> str:
+    """Strong ETag of one hotel representation"""
+    return f'"{_digest((_field(hotel, "id"), _field(hotel, "updated_at")))}"'
+
+def hotels_etag(hotels: Iterable[Hotel], *extra: object, weak: bool = False) -> str:
+    """ETag of a list of hotels plus any other values that shape the response"""
+    parts = [str(value) for value in extra]
+    for hotel in hotels:
+        parts.append(_field(hotel, "id"))
+        parts.append(_field(hotel, "updated_at"))
+    tag = f'"{_digest(parts)}"'
+    return f"W/{tag}" if weak else tag
+
+# Content-codings a strong tag can be suffixed with
+ENCODING_SUFFIXES = ("zstd", "br", "gzip")
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """Tag of the representation sent with the given content-coding (strong tags differ per coding)"""
+    if not encoding or etag.startswith("W/") or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+def _base(tag: str) -> str:
+    """Tag with any content-coding suffix removed"""
+    for encoding in ENCODING_SUFFIXES:
+        suffix = f'-{encoding}"'
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)] + '"'
+    return tag
+
+def _tags(header: Optional[str]) -> list:
+    return [tag.strip() for tag in header.split(",")] if header else []
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+def none_match(request: Request, etag: str) -> bool:
+    """True when If-None-Match matches etag (weak comparison), i.e. the client copy is current"""
+    tags = _tags(request.headers.get("if-none-match"))
+    return "*" in tags or _base(_opaque(etag)) in {_base(_opaque(tag)) for tag in tags}
+
+def if_match(header: Optional[str], etag: str) -> bool:
+    """True when an If-Match header is absent or matches etag (strong comparison)"""
+    if header is None:
+        return True
+    tags = _tags(header)
+    return "*" in tags or (not etag.startswith("W/") and _base(etag) in {_base(tag) for tag in tags})
+
+def not_modified(etag: str, headers: Optional[dict] = None) -> Response:
+    """304 response carrying the current validator"""
+    return Response(status_code=304, headers={"ETag": etag, **(headers or {})})
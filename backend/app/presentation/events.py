@@ -0,0 +1,40 @@
+"""
+Server-sent events.
+Streams availability feed events as text/event-stream.
+"""
+from typing import AsyncIterator, Iterable
+from fastapi.responses import StreamingResponse
+from app.application.services.availability_feed import AvailabilityFeed, FeedEvent
+from app.presentation.cache_policy import NO_STORE_POLICY
+from app.presentation.responses import render_json
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+RETRY_MILLISECONDS = 3000
+
+def format_event(event: FeedEvent) -> bytes:
+    """Encode one event in the SSE wire format"""
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event.id, event.type.encode(), render_json(event.data))
+
+async def _stream(feed: AvailabilityFeed, topics: Iterable[str], heartbeat_seconds: float) -> AsyncIterator[bytes]:
+    subscription = feed.subscribe(topics)
+    try:
+        yield b"retry: %d\n\n" % RETRY_MILLISECONDS
+        while True:
+            event = await subscription.next(heartbeat_seconds)
+            # Comments keep idle connections open through proxies
+            yield format_event(event) if event is not None else b": keepalive\n\n"
+    finally:
+        # Runs when the client disconnects and Starlette cancels the stream
+        feed.unsubscribe(subscription)
+
+def event_stream_response(feed: AvailabilityFeed, topics: Iterable[str], heartbeat_seconds: float) -> StreamingResponse:
+    """Stream feed events published to the given topics until the client disconnects"""
+    return StreamingResponse(
+        _stream(feed, list(topics), heartbeat_seconds),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={
+            **NO_STORE_POLICY.headers(),
+            # Stop nginx from buffering the stream
+            "X-Accel-Buffering": "no",
+        }
+    )
@@ -0,0 +1,116 @@
+from typing import Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.config import settings
+from app.presentation.compression import StreamCompressor, available_encoders, choose_encoding
+from app.presentation.etags import encoded_etag
+
+# Already compressed payloads, and streams that must not be buffered
+UNCOMPRESSIBLE_TYPES = (
+    "application/gzip",
+    "application/zip",
+    "application/vnd.apache.parquet",
+    "text/event-stream",
+    "image/",
+    "audio/",
+    "video/",
+)
+
+class CompressionMiddleware:
+    """
+    Compresses response bodies with the best encoding the client accepts.
+    Bodies below minimum_size are sent as is, and responses that already
+    carry a Content-Encoding (pre-compressed cached payloads) pass through
+    untouched. Streaming responses are compressed incrementally.
+    """
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, level: int = 6):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.encoders = available_encoders(level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = choose_encoding(request_headers.get("accept-encoding"), self.encoders)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSender(self, encoding, send, request_headers.get("if-none-match")))
+
+class _CompressingSender:
+    """Send wrapper that decides on compression when the first body chunk arrives"""
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send, if_none_match: Optional[str] = None):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.if_none_match = if_none_match
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[StreamCompressor] = None
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return not content_type.startswith(UNCOMPRESSIBLE_TYPES)
+
+    def _revalidated(self, headers: MutableHeaders):
+        # A 304 confirms the representation the client holds, which may be our compressed one
+        etag = headers.get("etag")
+        if etag and self.if_none_match:
+            tagged = encoded_etag(etag, self.encoding)
+            if tagged in (tag.strip() for tag in self.if_none_match.split(",")):
+                headers["ETag"] = tagged
+
+    async def __call__(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            if message["status"] == 304:
+                self._revalidated(MutableHeaders(raw=message["headers"]))
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is not None:
+            data = self.compressor.compress(body)
+            if not more_body:
+                data += self.compressor.flush()
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        headers = MutableHeaders(raw=self.start["headers"])
+        if not self._compressible(headers) or (not more_body and len(body) < self.middleware.minimum_size):
+            self.passthrough = True
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "etag" in headers:
+            headers["ETag"] = encoded_etag(headers["etag"], self.encoding)
+        if not more_body:
+            data = self.middleware.encoders[self.encoding](body)
+            headers["Content-Length"] = str(len(data))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": data})
+            return
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        self.compressor = StreamCompressor(self.encoding, self.middleware.level)
+        await self.send(self.start)
+        await self.send({"type": "http.response.body", "body": self.compressor.compress(body), "more_body": True})
+
+def setup_compression(app):
+    """Configure response compression middleware"""
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        level=settings.RESPONSE_COMPRESSION_LEVEL
+    )
@@ -3,12 +3,12 @@ Global error handling middleware.
 Centralizes error responses.
 """
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from app.presentation.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
     status_code=exc.status_code,
     content={
     "error": exc.detail,
@@ -18,7 +18,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors"""
-    return JSONResponse(
+    return ORJSONResponse(
     status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
     content={
     "error": "Validation error",
@@ -28,7 +28,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
     content={
     "error": "Internal server error",
@@ -0,0 +1,41 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.presentation.negotiation import msgpack, msgpack_response, prefers_msgpack
+
+NEGOTIATED_TYPES = ("application/json", "application/msgpack")
+
+class MessagePackMiddleware:
+    """
+    MessagePack content negotiation.
+    Selects MessagePack responses from the Accept header (rendered by
+    ORJSONResponse). MessagePack request bodies are decoded by
+    MessagePackRoute, straight into the route's body model.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or msgpack is None:
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        token = msgpack_response.set(prefers_msgpack(headers.get("accept")))
+        try:
+            await self.app(scope, receive, self._vary(send))
+        finally:
+            msgpack_response.reset(token)
+
+    @staticmethod
+    def _vary(send: Send) -> Send:
+        """Mark negotiated responses as varying on Accept"""
+        async def send_with_vary(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if headers.get("content-type", "").startswith(NEGOTIATED_TYPES):
+                    headers.add_vary_header("Accept")
+            await send(message)
+        return send_with_vary
+
+def setup_msgpack(app):
+    """Configure MessagePack content negotiation"""
+    app.add_middleware(MessagePackMiddleware)
@@ -0,0 +1,115 @@
+"""
+MessagePack content negotiation.
+Internal clients can send and receive application/msgpack instead of JSON;
+the public JSON contract is unchanged. Requires the optional msgpack package.
+"""
+from contextvars import ContextVar
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Coroutine, Optional
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = {"application/msgpack", "application/x-msgpack", "application/vnd.msgpack"}
+
+# Set per request by MessagePackMiddleware from the Accept header
+msgpack_response: ContextVar[bool] = ContextVar("msgpack_response", default=False)
+
+def _media_type(value: str) -> str:
+    return value.split(";", 1)[0].strip().lower()
+
+def is_msgpack(content_type: Optional[str]) -> bool:
+    """True for a MessagePack Content-Type"""
+    return bool(content_type) and _media_type(content_type) in MSGPACK_MEDIA_TYPES
+
+def prefers_msgpack(accept: Optional[str]) -> bool:
+    """True when the client ranks MessagePack at least as high as JSON"""
+    if msgpack is None or not accept:
+        return False
+    msgpack_quality = 0.0
+    json_quality = 0.0
+    for part in accept.split(","):
+        media_type, _, params = part.partition(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type in ("application/json", "application/*", "*/*"):
+            json_quality = max(json_quality, quality)
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+def _default(obj: Any) -> Any:
+    """Encode values the same way as the JSON responses do"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Exception):
+        return str(obj)
+    raise TypeError(f"Type is not MessagePack serializable: {type(obj).__name__}")
+
+def pack(content: Any) -> bytes:
+    """Encode content (dicts, lists, pydantic models) to MessagePack"""
+    return msgpack.packb(content, default=_default, use_bin_type=True)
+
+def unpack(data: bytes) -> Any:
+    """Decode a MessagePack document; raises ValueError when malformed"""
+    try:
+        return msgpack.unpackb(data, raw=False)
+    except Exception as e:
+        raise ValueError(f"Invalid MessagePack body: {e}")
+
+class MessagePackRequest(Request):
+    """
+    Request with a MessagePack body that FastAPI reads as if it were JSON.
+    The body is unpacked once and the resulting object is validated
+    against the route's body model like a parsed JSON document.
+    """
+    @property
+    def headers(self) -> Headers:
+        if not hasattr(self, "_json_headers"):
+            headers = MutableHeaders(raw=list(self.scope["headers"]))
+            headers["content-type"] = "application/json"
+            self._json_headers = Headers(raw=headers.raw)
+        return self._json_headers
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            try:
+                self._json = unpack(await self.body())
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        return self._json
+
+class MessagePackRoute(APIRoute):
+    """Route that accepts MessagePack request bodies wherever it takes a JSON body"""
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        # Routes without a body model (e.g. streaming uploads) read the raw body themselves
+        if self.body_field is None:
+            return handler
+
+        async def route_handler(request: Request) -> Response:
+            if msgpack is not None and is_msgpack(request.headers.get("content-type")):
+                request = MessagePackRequest(request.scope, request.receive)
+            return await handler(request)
+        return route_handler
@@ -0,0 +1,71 @@
+"""
+Response rendering.
+orjson-based JSON responses used as the application default.
+"""
+from typing import Any, Dict, Optional
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from app.application.services.hotel_detail_cache import EncodedPayload
+from app.presentation.compression import choose_encoding
+from app.presentation.negotiation import MSGPACK_MEDIA_TYPE, msgpack_response, pack
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+def _default(obj: Any) -> Any:
+    """Encode values orjson does not handle natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Exception):
+        # Validation error contexts carry the raised exception
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def render_json(content: Any) -> bytes:
+    """Encode content (dicts, lists, pydantic models) to JSON bytes"""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    Routes can return it directly with a DTO, a pre-built dict or already
+    encoded bytes; FastAPI then skips response_model validation and
+    jsonable_encoder, which matters for large hotel and search payloads.
+    Renders MessagePack instead when the request negotiated it.
+    """
+    def __init__(self, content: Any = None, status_code: int = 200, headers=None, media_type=None, background=None):
+        if media_type is None and msgpack_response.get():
+            media_type = MSGPACK_MEDIA_TYPE
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            if isinstance(content, (bytes, bytearray, memoryview)):
+                content = orjson.loads(content)
+            return pack(content)
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)
+        return render_json(content)
+
+def encoded_response(
+    payload: EncodedPayload,
+    request: Request,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Serve a pre-encoded JSON payload, compressed as the client accepts"""
+    if msgpack_response.get():
+        # Cached bytes are JSON; MessagePack clients get them transcoded
+        response_headers = dict(headers or {})
+        if payload.etag:
+            response_headers["ETag"] = payload.etag
+        return ORJSONResponse(payload.body, headers=response_headers)
+    encoding = choose_encoding(request.headers.get("accept-encoding"), payload.encodings)
+    response_headers = {"Vary": "Accept-Encoding", **(headers or {})}
+    if payload.etag:
+        response_headers["ETag"] = payload.variant_etag(encoding)
+    if encoding:
+        response_headers["Content-Encoding"] = encoding
+    return Response(payload.variant(encoding), headers=response_headers, media_type="application/json")
@@ -0,0 +1,38 @@
+"""
+Rebuild the daily booking analytics rollup from the bookings collection.
+
+Booking writes that fail to update the rollup are recorded; with
+--if-failed the rebuild only runs when there are such failures to
+reconcile, so it can be scheduled cheaply.
+
+Usage (from the backend directory):
+    python -m app.rebuild_booking_stats [--if-failed]
+"""
+import argparse
+import asyncio
+from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.repositories.booking_stats_repository import MongoBookingStatsRepository
+
+async def main():
+    """Recompute booking_daily_stats from scratch"""
+    parser = argparse.ArgumentParser(description="Rebuild the daily booking stats rollup")
+    parser.add_argument("--if-failed", action="store_true", help="Only rebuild when rollup updates have failed")
+    args = parser.parse_args()
+
+    await MongoDB.connect_to_mongo()
+    try:
+        repository = MongoBookingStatsRepository()
+        failures = await repository.count_failures()
+        if failures:
+            print(f"⚠️ {failures} failed rollup updates to reconcile")
+        elif args.if_failed:
+            print("✅ No failed rollup updates, nothing to do")
+            return
+        print("📊 Rebuilding daily booking stats...")
+        rows = await repository.rebuild()
+        print(f"✅ Wrote {rows} daily stats rows")
+    finally:
+        await MongoDB.close_mongo_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,6 +8,7 @@ from typing import List
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from infrastructure.database.mongodb import MongoDB
+from infrastructure.database.bson_dates import date_to_bson
 from domain.models.hotel import Hotel, HotelCategory, Amenity, Room, Location
 from domain.models.user import User, UserRole
 from domain.models.booking import Booking, BookingStatus, PaymentStatus
@@ -342,8 +343,8 @@ class DatabaseSeeder:
             
             # Insert into database
             doc = hotel.to_dict()
-            doc["created_at"] = datetime.utcnow().isoformat()
-            doc["updated_at"] = datetime.utcnow().isoformat()
+            doc["created_at"] = datetime.utcnow()
+            doc["updated_at"] = datetime.utcnow()
             doc.pop("_id", None)  # Remove _id to let MongoDB generate it
             
             result = await hotels_collection.insert_one(doc)
@@ -425,8 +426,8 @@ class DatabaseSeeder:
             
             # Insert into database
             doc = user.to_dict()
-            doc["created_at"] = datetime.utcnow().isoformat()
-            doc["updated_at"] = datetime.utcnow().isoformat()
+            doc["created_at"] = datetime.utcnow()
+            doc["updated_at"] = datetime.utcnow()
             doc.pop("_id", None)
             
             result = await users_collection.insert_one(doc)
@@ -497,8 +498,10 @@ class DatabaseSeeder:
             )
             
             doc = booking.to_dict()
-            doc["created_at"] = datetime.utcnow().isoformat()
-            doc["updated_at"] = datetime.utcnow().isoformat()
+            doc["check_in_date"] = date_to_bson(booking.check_in_date)
+            doc["check_out_date"] = date_to_bson(booking.check_out_date)
+            doc["created_at"] = datetime.utcnow()
+            doc["updated_at"] = datetime.utcnow()
             doc.pop("_id", None)
             
             result = await bookings_collection.insert_one(doc)
@@ -0,0 +1,31 @@
+"""
+Create the declared indexes and check every repository query shape with explain().
+Exits with status 1 if any query shape is answered by a collection scan.
+
+Usage (from the backend directory):
+    python -m app.verify_indexes
+"""
+import asyncio
+import sys
+from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.indexes import ensure_indexes, explain_query_shapes
+from app.dependencies import get_repositories
+
+async def main() -> int:
+    """Ensure indexes and report the winning plan of each query shape"""
+    await MongoDB.connect_to_mongo()
+    try:
+        await ensure_indexes(get_repositories())
+        reports = await explain_query_shapes(get_repositories())
+    finally:
+        await MongoDB.close_mongo_connection()
+
+    failed = False
+    for report in reports:
+        marker = "❌" if report.is_collection_scan else "✅"
+        print(f"{marker} {report.collection}.{report.shape}: {' > '.join(report.stages)}")
+        failed = failed or report.is_collection_scan
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
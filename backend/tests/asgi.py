@@ -0,0 +1,72 @@
+"""Minimal in-process HTTP client that drives an ASGI app directly"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import orjson
+
+@dataclass
+class Reply:
+    status: int
+    headers: Dict[str, str]
+    body: bytes = b""
+    chunks: List[bytes] = field(default_factory=list)
+
+    def json(self):
+        return orjson.loads(self.body)
+
+class AsgiClient:
+    """Sends one request per call; the lifespan (Mongo, background tasks) is never run"""
+    def __init__(self, app):
+        self.app = app
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: bytes = b"",
+        body_chunks: Optional[List[bytes]] = None
+    ) -> Reply:
+        parts = urlsplit(url)
+        raw_headers: List[Tuple[bytes, bytes]] = [
+            (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in (headers or {}).items()
+        ]
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+            "scheme": "http", "path": parts.path, "raw_path": parts.path.encode(),
+            "query_string": parts.query.encode(), "root_path": "", "headers": raw_headers,
+            "client": ("127.0.0.1", 50000), "server": ("testserver", 80)
+        }
+        pending = list(body_chunks) if body_chunks is not None else [body]
+
+        async def receive():
+            if pending:
+                chunk = pending.pop(0)
+                return {"type": "http.request", "body": chunk, "more_body": bool(pending)}
+            return {"type": "http.disconnect"}
+
+        reply = Reply(0, {})
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                reply.status = message["status"]
+                for name, value in message.get("headers", []):
+                    name = name.decode("latin-1")
+                    value = value.decode("latin-1")
+                    # Repeated headers (Vary, Set-Cookie) are joined like a proxy would
+                    reply.headers[name] = f"{reply.headers[name]}, {value}" if name in reply.headers else value
+            elif message["type"] == "http.response.body":
+                reply.chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        reply.body = b"".join(reply.chunks)
+        return reply
+
+    async def get(self, url: str, **kwargs) -> Reply:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Reply:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> Reply:
+        return await self.request("PUT", url, **kwargs)
@@ -0,0 +1,34 @@
+import pytest
+from app import dependencies
+from app.infrastructure.database import bson_dates
+from app.infrastructure.database.mongodb import MongoDB
+from app.main import app
+from asgi import AsgiClient
+from fake_mongo import FakeDatabase
+
+@pytest.fixture
+def db(monkeypatch):
+    """Point MongoDB.get_database() at an in-memory database"""
+    database = FakeDatabase()
+    monkeypatch.setattr(MongoDB, "_database", database)
+    return database
+
+@pytest.fixture(autouse=True)
+def migration_state(monkeypatch):
+    """Start every test with no collection marked as date-migrated"""
+    migrated = set()
+    monkeypatch.setattr(bson_dates, "_migrated_collections", migrated)
+    return migrated
+
+@pytest.fixture
+def api(db):
+    """Drive the application in-process against the in-memory database"""
+    # Process-wide caches and feeds must not leak between tests
+    for provider in (
+        dependencies.get_hotel_detail_cache,
+        dependencies.get_cache_purger,
+        dependencies.get_availability_feed,
+        dependencies.get_popularity_tracker
+    ):
+        provider.cache_clear()
+    return AsgiClient(app)
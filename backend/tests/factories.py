@@ -0,0 +1,52 @@
+"""Builders for domain objects and a minimal in-memory hotel repository"""
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+from app.domain.models.booking import Booking, BookingStatus
+from app.domain.models.hotel import Hotel, HotelCategory, Location, Room
+
+def make_hotel(hotel_id: str = "h1", city: str = "Paris", rooms: Optional[List[Room]] = None, **kwargs) -> Hotel:
+    return Hotel(
+        hotel_id=hotel_id,
+        name=kwargs.pop("name", f"Hotel {hotel_id}"),
+        description="A test hotel",
+        location=Location("1 Test Street", city, kwargs.pop("country", "France"), 48.85, 2.35),
+        category=HotelCategory.STANDARD,
+        star_rating=kwargs.pop("star_rating", 4),
+        amenities=[],
+        rooms=rooms if rooms is not None else [Room("double", 100.0, 2, 5)],
+        images=kwargs.pop("images", []),
+        **kwargs
+    )
+
+def make_booking(
+    hotel_id: str = "h1",
+    check_in: date = date(2030, 1, 10),
+    nights: int = 2,
+    status: BookingStatus = BookingStatus.PENDING,
+    hold_expires_at: Optional[datetime] = None,
+    **kwargs
+) -> Booking:
+    return Booking(
+        booking_id=kwargs.pop("booking_id", None),
+        hotel_id=hotel_id,
+        user_id=kwargs.pop("user_id", "u1"),
+        room_type=kwargs.pop("room_type", "double"),
+        check_in_date=check_in,
+        check_out_date=check_in + timedelta(days=nights),
+        guests_count=2,
+        total_price=kwargs.pop("total_price", 100.0 * nights),
+        status=status,
+        hold_expires_at=hold_expires_at,
+        **kwargs
+    )
+
+class InMemoryHotelRepository:
+    """The hotel lookups the booking services need"""
+    def __init__(self, hotels: List[Hotel]):
+        self.hotels: Dict[str, Hotel] = {hotel.hotel_id: hotel for hotel in hotels}
+
+    async def get_by_id(self, hotel_id: str) -> Optional[Hotel]:
+        return self.hotels.get(hotel_id)
+
+    async def get_by_ids(self, hotel_ids: List[str]) -> List[Hotel]:
+        return [self.hotels[hotel_id] for hotel_id in hotel_ids if hotel_id in self.hotels]
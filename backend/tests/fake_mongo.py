@@ -0,0 +1,329 @@
+"""
+In-memory stand-in for the parts of Motor the repositories use.
+Supports the query operators, projections, updates and cursor methods the app issues,
+with BSON's cross-type ordering, so repository code runs without a server.
+"""
+import copy
+import re
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+_MISSING = object()
+
+def _type_rank(value: Any) -> int:
+    """BSON comparison order of a value's type"""
+    if value is None or value is _MISSING:
+        return 1
+    if isinstance(value, bool):
+        return 8
+    if isinstance(value, (int, float)):
+        return 2
+    if isinstance(value, str):
+        return 3
+    if isinstance(value, dict):
+        return 4
+    if isinstance(value, list):
+        return 5
+    if isinstance(value, ObjectId):
+        return 7
+    if isinstance(value, datetime):
+        return 9
+    raise TypeError(f"Unsupported value in fake collection: {value!r}")
+
+def sort_key(value: Any) -> Tuple[int, Any]:
+    rank = _type_rank(value)
+    return (rank, None if rank == 1 else value)
+
+def _get(doc: Dict[str, Any], path: str) -> Any:
+    value: Any = doc
+    parts = path.split(".")
+    for index, part in enumerate(parts):
+        if isinstance(value, list):
+            # A path through an array reaches the field of every element
+            rest = ".".join(parts[index:])
+            found = [_get(item, rest) for item in value if isinstance(item, dict)]
+            return [item for item in found if item is not _MISSING] or _MISSING
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+def _equals(value: Any, expected: Any) -> bool:
+    if value is _MISSING:
+        return expected is None
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+    return value == expected
+
+def _compare(value: Any, expected: Any, op: str) -> bool:
+    if isinstance(value, list) and not isinstance(expected, list):
+        return any(_compare(item, expected, op) for item in value)
+    # Range operators only match values of the same BSON type
+    if value is _MISSING or _type_rank(value) != _type_rank(expected):
+        return False
+    return {
+        "$gt": value > expected,
+        "$gte": value >= expected,
+        "$lt": value < expected,
+        "$lte": value <= expected,
+    }[op]
+
+TYPE_NAMES = {"date": datetime, "string": str, "objectId": ObjectId}
+
+def _match_condition(value: Any, condition: Any) -> bool:
+    if not (isinstance(condition, dict) and condition and all(k.startswith("$") for k in condition)):
+        return _equals(value, condition)
+    for op, expected in condition.items():
+        if op == "$eq" and not _equals(value, expected):
+            return False
+        if op == "$ne" and _equals(value, expected):
+            return False
+        if op in ("$gt", "$gte", "$lt", "$lte") and not _compare(value, expected, op):
+            return False
+        if op == "$in" and not any(_equals(value, e) for e in expected):
+            return False
+        if op == "$nin" and any(_equals(value, e) for e in expected):
+            return False
+        if op == "$not" and _match_condition(value, expected):
+            return False
+        if op == "$exists" and (value is not _MISSING) != bool(expected):
+            return False
+        if op == "$type" and not (value is not _MISSING and isinstance(value, TYPE_NAMES[expected])):
+            return False
+        if op == "$regex":
+            flags = re.IGNORECASE if "i" in condition.get("$options", "") else 0
+            values = value if isinstance(value, list) else [value]
+            if not any(isinstance(item, str) and re.search(expected, item, flags) for item in values):
+                return False
+    return True
+
+def matches(doc: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    """Evaluate a Mongo filter against one document"""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(matches(doc, q) for q in condition):
+                return False
+        elif key == "$or":
+            if not any(matches(doc, q) for q in condition):
+                return False
+        elif not _match_condition(_get(doc, key), condition):
+            return False
+    return True
+
+def _is_slice(spec: Any) -> bool:
+    return isinstance(spec, dict) and "$slice" in spec
+
+def _pick(value: Any, tree: Dict[str, Any]) -> Any:
+    """Keep the paths of an inclusion tree; arrays apply it to each embedded document"""
+    if isinstance(value, list):
+        return [_pick(item, tree) for item in value if isinstance(item, dict)]
+    kept = {}
+    for key, sub in tree.items():
+        if key not in value:
+            continue
+        if sub is True:
+            kept[key] = value[key]
+        elif _is_slice(sub):
+            kept[key] = value[key][:sub["$slice"]] if isinstance(value[key], list) else value[key]
+        elif isinstance(value[key], (dict, list)):
+            kept[key] = _pick(value[key], sub)
+    return kept
+
+def _project(doc: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    doc = copy.deepcopy(doc)
+    if not projection:
+        return doc
+    slices = {k: v for k, v in projection.items() if _is_slice(v)}
+    fields = {k: v for k, v in projection.items() if not _is_slice(v)}
+    if all(not value for key, value in fields.items() if key != "_id"):
+        kept = {k: v for k, v in doc.items() if fields.get(k, 1)}
+        return {**kept, **_pick(kept, slices)}
+    tree: Dict[str, Any] = {}
+    for path, spec in [*((k, True) for k, v in fields.items() if v and k != "_id"), *slices.items()]:
+        *parents, leaf = path.split(".")
+        node = tree
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = spec
+    kept = _pick(doc, tree)
+    if fields.get("_id", 1) and "_id" in doc:
+        kept["_id"] = doc["_id"]
+    return kept
+
+class FakeCursor:
+    """Lazily ordered, limited view over matching documents"""
+    def __init__(self, docs: List[Dict[str, Any]]):
+        self._docs = docs
+        self._sort: List[Tuple[str, int]] = []
+        self._skip = 0
+        self._limit = 0
+        self._iterator: Optional[Iterator[Dict[str, Any]]] = None
+
+    def sort(self, key_or_list, direction: Optional[int] = None) -> "FakeCursor":
+        self._sort = [(key_or_list, direction or 1)] if isinstance(key_or_list, str) else list(key_or_list)
+        return self
+
+    def skip(self, count: int) -> "FakeCursor":
+        self._skip = count
+        return self
+
+    def limit(self, count: int) -> "FakeCursor":
+        self._limit = count
+        return self
+
+    def batch_size(self, size: int) -> "FakeCursor":
+        return self
+
+    def _results(self) -> List[Dict[str, Any]]:
+        docs = list(self._docs)
+        for field, direction in reversed(self._sort):
+            docs.sort(key=lambda doc: sort_key(_get(doc, field)), reverse=direction < 0)
+        docs = docs[self._skip:]
+        return docs[:self._limit] if self._limit else docs
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        docs = self._results()
+        return docs[:length] if length else docs
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        # Like Motor, the cursor is its own iterator and runs the query on first use
+        if self._iterator is None:
+            self._iterator = iter(self._results())
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+class FakeCollection:
+    def __init__(self, name: str):
+        self.name = name
+        self.docs: List[Dict[str, Any]] = []
+
+    def _find(self, query: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [doc for doc in self.docs if matches(doc, query or {})]
+
+    def find(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None) -> FakeCursor:
+        return FakeCursor([_project(doc, projection) for doc in self._find(query)])
+
+    async def find_one(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None):
+        found = self._find(query)
+        return _project(found[0], projection) if found else None
+
+    async def count_documents(self, query: Dict[str, Any], limit: int = 0) -> int:
+        count = len(self._find(query))
+        return min(count, limit) if limit else count
+
+    async def insert_one(self, doc: Dict[str, Any]):
+        doc.setdefault("_id", ObjectId())
+        if any(existing["_id"] == doc["_id"] for existing in self.docs):
+            raise DuplicateKeyError(f"duplicate _id {doc['_id']}")
+        self.docs.append(copy.deepcopy(doc))
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    async def insert_many(self, docs: Iterable[Dict[str, Any]], ordered: bool = True):
+        ids = [(await self.insert_one(doc)).inserted_id for doc in docs]
+        return SimpleNamespace(inserted_ids=ids)
+
+    @staticmethod
+    def _apply(doc: Dict[str, Any], update: Dict[str, Any]):
+        for field, value in update.get("$set", {}).items():
+            doc[field] = copy.deepcopy(value)
+        for field, value in update.get("$inc", {}).items():
+            doc[field] = (doc.get(field) or 0) + value
+        for field in update.get("$unset", {}):
+            doc.pop(field, None)
+
+    def _upsert(self, query: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+        doc = {k: v for k, v in query.items() if not k.startswith("$") and not isinstance(v, dict)}
+        doc.setdefault("_id", ObjectId())
+        self._apply(doc, update)
+        self._apply(doc, {"$set": update.get("$setOnInsert", {})})
+        self.docs.append(doc)
+        return doc
+
+    async def update_one(self, query: Dict[str, Any], update: Dict[str, Any], upsert: bool = False):
+        found = self._find(query)[:1]
+        for doc in found:
+            self._apply(doc, update)
+        if not found and upsert:
+            self._upsert(query, update)
+        return SimpleNamespace(matched_count=len(found), modified_count=len(found))
+
+    async def update_many(self, query: Dict[str, Any], update: Dict[str, Any], upsert: bool = False):
+        found = self._find(query)
+        for doc in found:
+            self._apply(doc, update)
+        return SimpleNamespace(matched_count=len(found), modified_count=len(found))
+
+    async def replace_one(self, query: Dict[str, Any], replacement: Dict[str, Any], upsert: bool = False):
+        found = self._find(query)[:1]
+        for doc in found:
+            doc.clear()
+            doc.update(copy.deepcopy(replacement))
+        if not found and upsert:
+            self.docs.append(copy.deepcopy(replacement))
+        return SimpleNamespace(matched_count=len(found), modified_count=len(found))
+
+    async def find_one_and_update(self, query, update, return_document=ReturnDocument.BEFORE, projection=None):
+        found = self._find(query)[:1]
+        if not found:
+            return None
+        before = copy.deepcopy(found[0])
+        self._apply(found[0], update)
+        return _project(found[0] if return_document == ReturnDocument.AFTER else before, projection)
+
+    async def delete_one(self, query: Dict[str, Any]):
+        found = self._find(query)[:1]
+        self.docs = [doc for doc in self.docs if not any(doc is f for f in found)]
+        return SimpleNamespace(deleted_count=len(found))
+
+    async def delete_many(self, query: Dict[str, Any]):
+        found = self._find(query)
+        self.docs = [doc for doc in self.docs if not any(doc is f for f in found)]
+        return SimpleNamespace(deleted_count=len(found))
+
+    async def bulk_write(self, operations, ordered: bool = True):
+        """Apply pymongo UpdateOne / ReplaceOne / DeleteOne / InsertOne requests"""
+        result = SimpleNamespace(
+            inserted_count=0, matched_count=0, modified_count=0, deleted_count=0, upserted_count=0
+        )
+        for operation in operations:
+            kind = type(operation).__name__
+            if kind == "InsertOne":
+                await self.insert_one(operation._doc)
+                result.inserted_count += 1
+            elif kind == "DeleteOne":
+                result.deleted_count += (await self.delete_one(operation._filter)).deleted_count
+            elif kind in ("UpdateOne", "ReplaceOne"):
+                method = self.update_one if kind == "UpdateOne" else self.replace_one
+                outcome = await method(operation._filter, operation._doc, upsert=operation._upsert)
+                result.matched_count += outcome.matched_count
+                result.modified_count += outcome.modified_count
+                result.upserted_count += int(not outcome.matched_count and operation._upsert)
+            else:
+                raise NotImplementedError(kind)
+        result.bulk_api_result = {
+            "nInserted": result.inserted_count, "nUpserted": result.upserted_count,
+            "nMatched": result.matched_count, "nModified": result.modified_count,
+            "nRemoved": result.deleted_count, "writeErrors": []
+        }
+        return result
+
+    async def drop(self):
+        self.docs = []
+
+class FakeDatabase:
+    def __init__(self):
+        self._collections: Dict[str, FakeCollection] = {}
+
+    def __getitem__(self, name: str) -> FakeCollection:
+        if name not in self._collections:
+            self._collections[name] = FakeCollection(name)
+        return self._collections[name]
@@ -0,0 +1,69 @@
+import orjson
+from app import dependencies
+from app.application.services.availability_feed import AvailabilityFeed, FeedEvent
+from app.application.services.surrogate_keys import city_key, hotel_key
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from app.presentation.events import _stream, event_stream_response, format_event
+from factories import make_booking, make_hotel
+
+def test_events_use_the_sse_wire_format():
+    event = FeedEvent(7, "availability", {"hotel_id": "h1", "rooms": 2})
+    assert format_event(event) == b'id: 7\nevent: availability\ndata: {"hotel_id":"h1","rooms":2}\n\n'
+
+async def test_events_reach_each_subscriber_of_any_topic_once():
+    feed = AvailabilityFeed()
+    both = feed.subscribe([hotel_key("h1"), city_key("Paris")])
+    other_city = feed.subscribe([city_key("Rome")])
+
+    feed.publish_booking(make_booking("h1"), make_hotel("h1"))
+
+    event = await both.next(1)
+    assert (event.type, event.data["hotel_id"], event.data["check_in_date"]) == ("availability", "h1", "2030-01-10")
+    assert await both.next(0.01) is None
+    assert await other_city.next(0.01) is None
+
+async def test_slow_subscribers_lose_the_oldest_events():
+    feed = AvailabilityFeed(max_queue=2)
+    subscription = feed.subscribe(["t"])
+    for n in range(3):
+        feed.publish(["t"], "tick", {"n": n})
+    assert subscription.dropped == 1
+    assert [(await subscription.next(1)).data["n"] for _ in range(2)] == [1, 2]
+
+    feed.unsubscribe(subscription)
+    assert feed.subscriber_count == 0
+    assert feed.publish(["t"], "tick", {}) == 0
+
+async def test_streams_send_events_and_heartbeats_then_unsubscribe():
+    feed = AvailabilityFeed()
+    stream = _stream(feed, ["t"], heartbeat_seconds=0.01)
+    assert await stream.__anext__() == b"retry: 3000\n\n"
+    assert await stream.__anext__() == b": keepalive\n\n"
+    feed.publish(["t"], "tick", {"n": 1})
+    assert (await stream.__anext__()).startswith(b"id: 1\nevent: tick\n")
+
+    await stream.aclose()
+    assert feed.subscriber_count == 0
+
+def test_event_streams_are_never_cached_or_buffered():
+    response = event_stream_response(AvailabilityFeed(), ["t"], 15)
+    assert response.media_type == "text/event-stream"
+    assert response.headers["cache-control"] == "no-store"
+    assert response.headers["x-accel-buffering"] == "no"
+
+async def test_hotel_updates_are_published_to_hotel_and_city_topics(api):
+    hotel_id = (await MongoHotelRepository().create(make_hotel(None, city="Paris"))).hotel_id
+    feed = dependencies.get_availability_feed()
+    by_hotel = feed.subscribe([hotel_key(hotel_id)])
+    by_city = feed.subscribe([city_key("paris")])
+
+    await api.put(f"/api/v1/hotels/{hotel_id}", body=orjson.dumps({"star_rating": 5}),
+                  headers={"content-type": "application/json"})
+
+    for subscription in (by_hotel, by_city):
+        event = await subscription.next(1)
+        assert (event.type, event.data["hotel_id"], event.data["minimum_price"]) == ("hotel", hotel_id, 100.0)
+
+async def test_feeds_need_a_known_hotel_or_a_destination(api):
+    assert (await api.get("/api/v1/hotels/0123456789abcdef01234567/events")).status == 404
+    assert (await api.get("/api/v1/search/hotels/events?destination=%20")).status == 400
@@ -0,0 +1,71 @@
+from datetime import date, datetime, timedelta
+from bson import ObjectId
+from app.domain.models.booking import BookingStatus
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository, _merge_streams
+from factories import make_booking
+
+CUTOFF = date(2030, 3, 1)
+CREATED = datetime(2030, 1, 1, 12, 0)
+
+async def stream(docs):
+    for doc in docs:
+        yield doc
+
+async def store(db, collection: str = "bookings", created_at: datetime = CREATED, **kwargs) -> dict:
+    doc = MongoBookingRepository()._booking_to_document(make_booking(**kwargs))
+    doc.update(created_at=created_at, updated_at=created_at)
+    await db[collection].insert_one(doc)
+    return doc
+
+async def test_merge_yields_documents_in_both_streams_once():
+    ids = [ObjectId() for _ in range(4)]
+    hot = [{"_id": ids[3], "k": 2}, {"_id": ids[2], "k": 1}, {"_id": ids[0], "k": 1}]
+    archived = [{"_id": ids[2], "k": 1}, {"_id": ids[1], "k": 1}, {"_id": ids[0], "k": 0}]
+    merged = [doc async for doc in _merge_streams(stream(hot), stream(archived), lambda doc: doc["k"], descending=True)]
+    assert [(doc["k"], doc["_id"]) for doc in merged] == [(2, ids[3]), (1, ids[2]), (1, ids[1]), (1, ids[0]), (0, ids[0])]
+
+async def test_only_finished_bookings_past_the_cutoff_are_moved(db):
+    repository = MongoBookingRepository()
+    old = await store(db, check_in=date(2030, 1, 10), status=BookingStatus.COMPLETED)
+    cancelled = await store(db, check_in=date(2030, 2, 1), status=BookingStatus.CANCELLED)
+    await store(db, check_in=date(2030, 1, 10), status=BookingStatus.CONFIRMED)
+    await store(db, check_in=date(2030, 2, 28), status=BookingStatus.COMPLETED)
+
+    assert await repository.archive_finished(CUTOFF, batch_size=10) == 2
+    assert await repository.archive_finished(CUTOFF, batch_size=10) == 0
+
+    assert {doc["_id"] for doc in db["bookings_archive"].docs} == {old["_id"], cancelled["_id"]}
+    assert len(db["bookings"].docs) == 2
+    assert await repository.get_by_id(str(old["_id"])) is None
+    assert (await repository.get_by_id(str(old["_id"]), include_archived=True)).status == BookingStatus.COMPLETED
+
+async def test_a_booking_changed_mid_move_stays_hot(db):
+    repository = MongoBookingRepository()
+    changed = await store(db, check_in=date(2030, 1, 10), status=BookingStatus.COMPLETED)
+    moved = await store(db, check_in=date(2030, 1, 10), status=BookingStatus.COMPLETED)
+    hot = db["bookings"]
+    bulk_write = hot.bulk_write
+
+    async def write_after_concurrent_update(operations, ordered=True):
+        await hot.update_one({"_id": changed["_id"]}, {"$inc": {"version": 1}})
+        return await bulk_write(operations, ordered=ordered)
+    hot.bulk_write = write_after_concurrent_update
+
+    assert await repository.archive_finished(CUTOFF, batch_size=10) == 1
+    assert [doc["_id"] for doc in hot.docs] == [changed["_id"]]
+    assert [doc["_id"] for doc in db["bookings_archive"].docs] == [moved["_id"]]
+
+async def test_history_reads_merge_the_archive_without_duplicates(db):
+    repository = MongoBookingRepository()
+    recent = await store(db, created_at=CREATED + timedelta(days=1))
+    # Copied to the archive but not yet deleted from the hot collection
+    copied = await store(db, status=BookingStatus.COMPLETED)
+    await db["bookings_archive"].insert_one(dict(copied))
+    archived = await store(db, "bookings_archive", created_at=CREATED - timedelta(days=1), status=BookingStatus.COMPLETED)
+
+    history = await repository.get_by_user_id("u1", include_archived=True)
+    assert [booking.booking_id for booking in history] == [str(recent["_id"]), str(copied["_id"]), str(archived["_id"])]
+    assert len(await repository.get_by_user_id("u1")) == 2
+
+    rows = [row async for row in repository.iter_export_rows(include_archived=True, batch_size=1)]
+    assert sorted(row["booking_id"] for row in rows) == sorted(str(doc["_id"]) for doc in (recent, copied, archived))
@@ -0,0 +1,71 @@
+import csv
+import gzip
+import io
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.application.services import booking_export_service
+from app.application.services.booking_export_service import (
+    EXPORT_COLUMNS,
+    WATERMARK_LAG,
+    BookingExportService,
+    ExportFormat,
+    export_watermark
+)
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
+from factories import make_booking
+
+UPDATED = datetime(2030, 1, 1, 12, 0)
+
+async def store(db, updated_at: datetime, **kwargs) -> str:
+    doc = MongoBookingRepository()._booking_to_document(make_booking(**kwargs))
+    doc.update(created_at=updated_at, updated_at=updated_at)
+    return str((await db["bookings"].insert_one(doc)).inserted_id)
+
+async def export(fmt: ExportFormat = ExportFormat.CSV, batch_size: int = 2, **filters) -> bytes:
+    service = BookingExportService(MongoBookingRepository(), batch_size=batch_size)
+    return b"".join([chunk async for chunk in service.open_export(fmt, **filters)])
+
+def read_csv(data: bytes):
+    return list(csv.DictReader(io.StringIO(gzip.decompress(data).decode())))
+
+async def test_csv_export_streams_every_row_in_gzip_batches(db):
+    ids = [await store(db, UPDATED, nights=n) for n in range(1, 6)]
+    rows = read_csv(await export())
+    assert [row["booking_id"] for row in rows] == ids
+    assert list(rows[0]) == EXPORT_COLUMNS
+    assert rows[0]["check_in_date"] == "2030-01-10" and rows[4]["nights"] == "5"
+
+async def test_an_empty_export_is_still_a_csv_with_a_header(db):
+    assert gzip.decompress(await export()).decode().strip() == ",".join(EXPORT_COLUMNS)
+
+async def test_incremental_windows_use_naive_utc_bounds(db):
+    before = await store(db, UPDATED - timedelta(minutes=1))
+    inside = await store(db, UPDATED)
+    await store(db, UPDATED + timedelta(hours=1))
+
+    paris = timezone(timedelta(hours=1))
+    rows = read_csv(await export(
+        updated_since=UPDATED.replace(tzinfo=timezone.utc),
+        updated_before=(UPDATED + timedelta(hours=1)).replace(tzinfo=timezone.utc).astimezone(paris)
+    ))
+    assert [row["booking_id"] for row in rows] == [inside]
+    assert before not in {row["booking_id"] for row in read_csv(await export(updated_since=UPDATED))}
+
+async def test_an_empty_window_is_rejected():
+    with pytest.raises(ValueError):
+        await export(updated_since=UPDATED, updated_before=UPDATED)
+
+def test_the_watermark_trails_the_clock():
+    assert export_watermark() <= datetime.utcnow() - WATERMARK_LAG
+
+async def test_columnar_formats_need_pyarrow(db, monkeypatch):
+    monkeypatch.setattr(booking_export_service, "pa", None)
+    with pytest.raises(ValueError, match="pyarrow"):
+        await export(ExportFormat.PARQUET)
+
+async def test_arrow_stream_round_trip(db):
+    pa = pytest.importorskip("pyarrow")
+    await store(db, UPDATED)
+    table = pa.ipc.open_stream(await export(ExportFormat.ARROW)).read_all()
+    assert table.column_names == EXPORT_COLUMNS
+    assert table.num_rows == 1
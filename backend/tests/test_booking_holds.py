@@ -0,0 +1,62 @@
+from datetime import date, datetime, timedelta
+import pytest
+from app.domain.models.booking import BookingStatus
+from app.application.services.availability_feed import AvailabilityFeed
+from app.application.services.booking_service import BookingService
+from app.application.services.surrogate_keys import city_key
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
+from factories import InMemoryHotelRepository, make_booking, make_hotel
+
+PAST = datetime.utcnow() - timedelta(minutes=5)
+FUTURE = datetime.utcnow() + timedelta(minutes=15)
+
+def test_confirming_an_expired_hold_fails():
+    booking = make_booking(hold_expires_at=PAST)
+    assert booking.is_hold_expired()
+    with pytest.raises(ValueError):
+        booking.confirm()
+
+def test_place_hold_sets_expiry():
+    booking = make_booking()
+    booking.place_hold(timedelta(minutes=15))
+    assert not booking.is_hold_expired()
+    assert booking.is_hold_expired(now=datetime.utcnow() + timedelta(minutes=16))
+
+async def test_lapsed_holds_do_not_block_availability(db):
+    repository = MongoBookingRepository()
+    for _ in range(repository.MAX_ROOMS_PER_TYPE):
+        await repository.create(make_booking(hold_expires_at=PAST))
+    assert await repository.check_availability("h1", "double", date(2030, 1, 10), date(2030, 1, 12))
+
+    await repository.create(make_booking(hold_expires_at=FUTURE))
+    for _ in range(repository.MAX_ROOMS_PER_TYPE - 1):
+        await repository.create(make_booking(status=BookingStatus.CONFIRMED))
+    assert not await repository.check_availability("h1", "double", date(2030, 1, 10), date(2030, 1, 12))
+
+async def test_expire_holds_cancels_only_lapsed_pending_bookings(db):
+    repository = MongoBookingRepository()
+    lapsed = await repository.create(make_booking(hold_expires_at=PAST))
+    held = await repository.create(make_booking(hold_expires_at=FUTURE))
+    confirmed = await repository.create(make_booking(status=BookingStatus.CONFIRMED))
+
+    expired = await repository.expire_holds(datetime.utcnow(), batch_size=10)
+
+    assert [booking.booking_id for booking in expired] == [lapsed.booking_id]
+    assert expired[0].status == BookingStatus.CANCELLED
+    assert expired[0].hold_expires_at is None
+    assert expired[0].version == 1
+    assert (await repository.get_by_id(held.booking_id)).status == BookingStatus.PENDING
+    assert (await repository.get_by_id(confirmed.booking_id)).status == BookingStatus.CONFIRMED
+
+async def test_sweeper_expires_every_batch_and_announces_it(db):
+    repository = MongoBookingRepository()
+    for _ in range(5):
+        await repository.create(make_booking(hold_expires_at=PAST))
+    feed = AvailabilityFeed()
+    subscription = feed.subscribe([city_key("Paris")])
+    service = BookingService(repository, InMemoryHotelRepository([make_hotel()]), availability_feed=feed)
+
+    assert await service.expire_stale_holds(batch_size=2) == 5
+    assert await repository.expire_holds(datetime.utcnow(), batch_size=10) == []
+    events = [await subscription.next(1) for _ in range(5)]
+    assert {event.data["status"] for event in events} == {"cancelled"}
@@ -0,0 +1,93 @@
+from datetime import date, datetime, timedelta
+from typing import List
+import pytest
+from bson import ObjectId
+from app.domain.models.booking import BookingStatus
+from app.infrastructure.database.repositories.booking_repository import (
+    MongoBookingRepository,
+    _decode_cursor,
+    _encode_cursor
+)
+from factories import make_booking
+
+CREATED = datetime(2030, 1, 1, 12, 0)
+
+async def insert(db, collection: str = "bookings", **kwargs) -> str:
+    """Store a booking document directly so created_at is under test control"""
+    repository = MongoBookingRepository()
+    created_at = kwargs.pop("created_at", CREATED)
+    doc = repository._booking_to_document(make_booking(**kwargs))
+    doc.update(created_at=created_at, updated_at=created_at)
+    result = await db[collection].insert_one(doc)
+    return str(result.inserted_id)
+
+async def all_pages(fetch, limit: int) -> List[str]:
+    ids, cursor = [], None
+    while True:
+        bookings, cursor = await fetch(cursor=cursor, limit=limit)
+        ids += [booking.booking_id for booking in bookings]
+        if cursor is None:
+            return ids
+
+async def test_pages_cover_every_booking_once_with_tied_sort_values(db):
+    repository = MongoBookingRepository()
+    newest = await insert(db, created_at=CREATED + timedelta(hours=1))
+    tied = [await insert(db) for _ in range(5)]
+    oldest = await insert(db, created_at=CREATED - timedelta(hours=1))
+
+    ids = await all_pages(lambda **kw: repository.list_by_user("u1", **kw), limit=2)
+
+    assert ids == [newest] + sorted(tied, reverse=True) + [oldest]
+
+async def test_last_full_page_has_no_cursor(db):
+    repository = MongoBookingRepository()
+    for _ in range(2):
+        await insert(db)
+    bookings, cursor = await repository.list_by_user("u1", limit=2)
+    assert len(bookings) == 2 and cursor is None
+
+async def test_hotel_listing_filters_by_status_and_check_in_range(db):
+    repository = MongoBookingRepository()
+    expected = []
+    for day in range(1, 8):
+        booking_id = await insert(db, check_in=date(2030, 3, day), status=BookingStatus.CONFIRMED)
+        if 3 <= day < 6:
+            expected.append(booking_id)
+        await insert(db, check_in=date(2030, 3, day), status=BookingStatus.CANCELLED)
+
+    ids = await all_pages(lambda **kw: repository.list_by_hotel(
+        "h1", statuses=[BookingStatus.CONFIRMED], check_in_from=date(2030, 3, 3), check_in_to=date(2030, 3, 6), **kw
+    ), limit=2)
+
+    assert ids == expected
+
+async def test_archived_bookings_are_merged_into_the_same_order(db):
+    repository = MongoBookingRepository()
+    live = await insert(db, created_at=CREATED)
+    archived = await insert(db, "bookings_archive", created_at=CREATED - timedelta(hours=1))
+    newest = await insert(db, created_at=CREATED + timedelta(hours=1))
+
+    ids = await all_pages(lambda **kw: repository.list_by_user("u1", include_archived=True, **kw), limit=1)
+
+    assert ids == [newest, live, archived]
+
+async def test_legacy_string_dates_sort_before_bson_dates_across_pages(db):
+    repository = MongoBookingRepository()
+    legacy = await insert(db, check_in=date(2030, 3, 20))
+    await db["bookings"].update_one({}, {"$set": {"check_in_date": "2030-03-20", "check_out_date": "2030-03-22"}})
+    native = [await insert(db, check_in=date(2030, 3, day)) for day in (1, 2)]
+
+    ids = await all_pages(lambda **kw: repository.list_by_hotel("h1", **kw), limit=1)
+
+    # Mongo orders every string before every date
+    assert ids == [legacy] + native
+
+def test_cursor_round_trip():
+    doc_id = ObjectId()
+    assert _decode_cursor(_encode_cursor(CREATED, doc_id)) == (CREATED, doc_id)
+    assert _decode_cursor(_encode_cursor("2030-01-01", doc_id)) == ("2030-01-01", doc_id)
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", "WzEsMl0="])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError):
+        _decode_cursor(cursor)
@@ -0,0 +1,61 @@
+import logging
+from datetime import date
+from bson import ObjectId
+from app.domain.models.booking import BookingStatus
+from app.application.services.booking_service import BookingService
+from app.infrastructure.database.repositories.booking_stats_repository import MongoBookingStatsRepository
+from factories import make_booking
+
+JAN_10 = date(2030, 1, 10)
+
+async def rows(repository):
+    stats = await repository.get_daily_stats("h1", date(2030, 1, 1), date(2030, 2, 1))
+    return {(s.day.day, s.pending_rooms, s.confirmed_rooms, s.revenue) for s in stats}
+
+async def test_transitions_move_nights_between_counters(db):
+    repository = MongoBookingStatsRepository()
+    booking = make_booking(check_in=JAN_10, nights=2, total_price=300.0)
+
+    await repository.record_transitions([(booking, None, BookingStatus.PENDING)])
+    assert await rows(repository) == {(10, 1, 0, 0), (11, 1, 0, 0)}
+
+    await repository.record_transitions([(booking, BookingStatus.PENDING, BookingStatus.CONFIRMED)])
+    assert await rows(repository) == {(10, 0, 1, 150.0), (11, 0, 1, 150.0)}
+
+    await repository.record_transitions([(booking, BookingStatus.CONFIRMED, BookingStatus.CANCELLED)])
+    assert await rows(repository) == {(10, 0, 0, 0), (11, 0, 0, 0)}
+
+async def test_catch_up_applies_the_difference_from_the_snapshot(db):
+    repository = MongoBookingStatsRepository()
+    snapshot, scratch = db["snapshot"], db["scratch"]
+    booking_id = ObjectId()
+    before = {
+        "_id": booking_id, "hotel_id": "h1", "room_type": "double", "check_in_date": "2030-01-10",
+        "check_out_date": "2030-01-12", "total_price": 200.0, "status": "pending"
+    }
+    await snapshot.insert_one(dict(before))
+    after = {**before, "status": "confirmed"}
+
+    assert await repository._apply_changes([after], snapshot, scratch) == 1
+    increments = {doc["date"]: (doc["pending_rooms"], doc["confirmed_rooms"], doc["revenue"]) for doc in scratch.docs}
+    assert increments == {"2030-01-10": (-1, 1, 100.0), "2030-01-11": (-1, 1, 100.0)}
+    # The snapshot now holds the applied state, so a repeated pass is a no-op
+    assert await repository._apply_changes([after], snapshot, scratch) == 0
+
+async def test_failed_rollup_updates_are_logged_and_recorded(db, caplog):
+    repository = MongoBookingStatsRepository()
+
+    async def fail(transitions):
+        raise RuntimeError("rollup unavailable")
+    repository.record_transitions = fail
+    service = BookingService(None, None, stats_repository=repository)
+    booking = make_booking(booking_id=str(ObjectId()))
+
+    with caplog.at_level(logging.ERROR):
+        await service._record_stats([(booking, None, BookingStatus.PENDING)])
+
+    assert booking.booking_id in caplog.text
+    assert await repository.count_failures() == 1
+    failure = db["booking_daily_stats_failures"].docs[0]
+    assert failure["booking_ids"] == [booking.booking_id]
+    assert failure["error"] == "rollup unavailable"
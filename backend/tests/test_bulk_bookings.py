@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+import pytest
+from pymongo.errors import BulkWriteError
+from app.domain.models.booking import BookingStatus
+from app.application.dto.booking_dto import BulkBookingMode, BulkCreateBookingDTO, CreateBookingDTO
+from app.application.services.booking_service import BookingService
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
+from factories import InMemoryHotelRepository, make_booking, make_hotel
+
+JAN_10 = date(2030, 1, 10)
+
+def line(check_in: date = JAN_10, nights: int = 2, **kwargs) -> CreateBookingDTO:
+    return CreateBookingDTO(
+        hotel_id=kwargs.pop("hotel_id", "h1"),
+        user_id="u1",
+        room_type=kwargs.pop("room_type", "double"),
+        check_in_date=check_in,
+        check_out_date=check_in + timedelta(days=nights),
+        guests_count=2
+    )
+
+async def test_accepted_stays_count_against_later_ones_in_the_batch(db):
+    repository = MongoBookingRepository()
+    limit = repository.MAX_ROOMS_PER_TYPE
+    for _ in range(limit - 2):
+        await repository.create(make_booking(status=BookingStatus.CONFIRMED))
+
+    stays = [(JAN_10, JAN_10 + timedelta(days=2))] * 3 + [(JAN_10 + timedelta(days=2), JAN_10 + timedelta(days=3))]
+    assert await repository.check_availability_bulk("h1", "double", stays) == [True, True, False, True]
+
+async def test_bulk_check_ignores_other_room_types_and_disjoint_dates(db):
+    repository = MongoBookingRepository()
+    for _ in range(repository.MAX_ROOMS_PER_TYPE):
+        await repository.create(make_booking(room_type="suite", status=BookingStatus.CONFIRMED))
+        await repository.create(make_booking(check_in=date(2030, 2, 1), status=BookingStatus.CONFIRMED))
+    assert await repository.check_availability_bulk("h1", "double", [(JAN_10, JAN_10 + timedelta(days=2))]) == [True]
+    assert await repository.check_availability_bulk("h1", "double", []) == []
+
+async def test_all_or_nothing_creates_nothing_when_a_line_fails(db):
+    service = BookingService(MongoBookingRepository(), InMemoryHotelRepository([make_hotel()]))
+    result = await service.create_bookings_bulk(BulkCreateBookingDTO(
+        bookings=[line(), line(room_type="penthouse"), line(hotel_id="missing")]
+    ))
+    assert result.created == []
+    assert [(f.index, f.error) for f in result.failed] == [(1, "Invalid room type"), (2, "Hotel not found")]
+    assert db["bookings"].docs == []
+
+async def test_best_effort_books_what_fits(db):
+    repository = MongoBookingRepository()
+    service = BookingService(repository, InMemoryHotelRepository([make_hotel()]))
+    lines = [line() for _ in range(repository.MAX_ROOMS_PER_TYPE + 1)]
+    result = await service.create_bookings_bulk(BulkCreateBookingDTO(bookings=lines, mode=BulkBookingMode.BEST_EFFORT))
+
+    assert len(result.created) == repository.MAX_ROOMS_PER_TYPE
+    assert [f.index for f in result.failed] == [repository.MAX_ROOMS_PER_TYPE]
+    assert all(booking.status == BookingStatus.PENDING for booking in result.created)
+    assert len(db["bookings"].docs) == repository.MAX_ROOMS_PER_TYPE
+
+async def test_create_many_removes_a_partial_insert(db, monkeypatch):
+    collection = db["bookings"]
+    insert_one = collection.insert_one
+    inserted = 0
+
+    async def failing_insert_many(docs, ordered=True):
+        nonlocal inserted
+        for doc in docs:
+            if inserted == 1:
+                raise BulkWriteError({"writeErrors": [{"index": 1}]})
+            await insert_one(doc)
+            inserted += 1
+    monkeypatch.setattr(collection, "insert_many", failing_insert_many)
+
+    with pytest.raises(BulkWriteError):
+        await MongoBookingRepository().create_many([make_booking(), make_booking()])
+    assert collection.docs == []
@@ -0,0 +1,64 @@
+import orjson
+from app import dependencies
+from app.application.services.hotel_service import HotelService
+from app.presentation.cache_policy import CachePolicy
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from factories import make_hotel
+
+JSON = {"content-type": "application/json"}
+
+def test_policies_render_cache_control_and_deduplicated_keys():
+    policy = CachePolicy(max_age=60, shared_max_age=300, stale_while_revalidate=30)
+    assert policy.headers(["hotel-1", "catalog", "hotel-1"]) == {
+        "Cache-Control": "public, max-age=60, s-maxage=300, stale-while-revalidate=30",
+        "Surrogate-Key": "hotel-1 catalog"
+    }
+    assert CachePolicy(no_store=True).headers() == {"Cache-Control": "no-store"}
+
+def purged():
+    return [keys for _, keys in dependencies.get_cache_purger().history]
+
+async def test_hotel_and_search_responses_carry_surrogate_keys(api):
+    hotel_id = (await MongoHotelRepository().create(make_hotel(None, city="New York"))).hotel_id
+
+    detail = await api.get(f"/api/v1/hotels/{hotel_id}")
+    assert detail.headers["cache-control"].startswith("public")
+    assert detail.headers["surrogate-key"].split() == [f"hotel-{hotel_id}", "catalog"]
+
+    search = await api.get("/api/v1/search/hotels?destination=New%20York")
+    assert {"search", "catalog", "city-new-york", f"hotel-{hotel_id}"} <= set(search.headers["surrogate-key"].split())
+
+async def test_writes_purge_the_hotel_and_its_city_listings(api):
+    body = {
+        "name": "Harbour", "description": "d", "category": "standard", "star_rating": 3,
+        "location": {"address": "a", "city": "New York", "country": "United States", "latitude": 40.7, "longitude": -74.0},
+        "rooms": [{"room_type": "double", "price_per_night": 120, "capacity": 2, "available_count": 4}]
+    }
+    created = await api.post("/api/v1/hotels/", body=orjson.dumps(body), headers=JSON)
+    assert created.status == 201
+    hotel_id = created.json()["id"]
+    await api.put(f"/api/v1/hotels/{hotel_id}", body=b'{"star_rating": 4}', headers=JSON)
+    await api.request("DELETE", f"/api/v1/hotels/{hotel_id}")
+
+    assert purged() == [
+        ["hotels", "city-new-york"],
+        [f"hotel-{hotel_id}", "city-new-york"],
+        [f"hotel-{hotel_id}"]
+    ]
+
+async def test_a_failed_purge_does_not_fail_the_write(db):
+    class BrokenPurger:
+        async def purge(self, keys):
+            raise ConnectionError("CDN unreachable")
+
+    repository = MongoHotelRepository()
+    hotel = await repository.create(make_hotel(None))
+    service = HotelService(repository, purger=BrokenPurger())
+    assert await service.delete_hotel(hotel.hotel_id)
+
+async def test_account_responses_are_never_stored(api):
+    registered = await api.post("/api/v1/auth/register", headers=JSON, body=orjson.dumps(
+        {"email": "guest@example.com", "password": "secret-password", "full_name": "Guest"}
+    ))
+    assert registered.status == 201
+    assert registered.headers["cache-control"] == "no-store"
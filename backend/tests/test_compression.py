@@ -0,0 +1,79 @@
+import gzip
+from starlette.responses import Response, StreamingResponse
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from app.presentation.compression import choose_encoding
+from app.presentation.middleware.compression import CompressionMiddleware
+from asgi import AsgiClient
+from factories import make_hotel
+
+LARGE = b"x" * 2000
+GZIP = {"accept-encoding": "gzip"}
+
+def test_encoding_follows_server_preference_among_accepted_codings():
+    available = ["zstd", "br", "gzip"]
+    assert choose_encoding("gzip, br", available) == "br"
+    assert choose_encoding("br;q=0, gzip;q=0.5", available) == "gzip"
+    assert choose_encoding("*", available) == "zstd"
+    assert choose_encoding("*, zstd;q=0, br;q=0", available) == "gzip"
+    assert choose_encoding("identity", available) is None
+    assert choose_encoding(None, available) is None
+
+def client_for(response_factory, minimum_size: int = 1024) -> AsgiClient:
+    async def app(scope, receive, send):
+        await response_factory()(scope, receive, send)
+    middleware = CompressionMiddleware(app, minimum_size=minimum_size)
+    # Tests run with gzip only, whatever codecs happen to be installed
+    middleware.encoders = {"gzip": middleware.encoders["gzip"]}
+    return AsgiClient(middleware)
+
+async def test_large_bodies_are_compressed_and_retagged():
+    client = client_for(lambda: Response(LARGE, media_type="application/json", headers={"ETag": '"a"'}))
+    reply = await client.get("/", headers=GZIP)
+    assert gzip.decompress(reply.body) == LARGE
+    assert reply.headers["content-encoding"] == "gzip"
+    assert reply.headers["content-length"] == str(len(reply.body))
+    assert reply.headers["vary"] == "Accept-Encoding"
+    assert reply.headers["etag"] == '"a-gzip"'
+
+    identity = await client.get("/")
+    assert identity.body == LARGE and identity.headers["etag"] == '"a"'
+
+async def test_small_encoded_and_binary_bodies_pass_through():
+    small = await client_for(lambda: Response(b"{}", media_type="application/json")).get("/", headers=GZIP)
+    assert small.body == b"{}" and "content-encoding" not in small.headers
+
+    encoded = client_for(lambda: Response(LARGE, headers={"Content-Encoding": "br"}))
+    assert (await encoded.get("/", headers=GZIP)).body == LARGE
+
+    archive = client_for(lambda: Response(LARGE, media_type="application/gzip"))
+    assert "content-encoding" not in (await archive.get("/", headers=GZIP)).headers
+
+async def test_streams_are_compressed_incrementally():
+    async def chunks():
+        for _ in range(3):
+            yield LARGE
+
+    reply = await client_for(lambda: StreamingResponse(chunks(), media_type="text/csv")).get("/", headers=GZIP)
+    assert len(reply.chunks) >= 3
+    assert "content-length" not in reply.headers
+    assert gzip.decompress(reply.body) == LARGE * 3
+
+async def test_not_modified_echoes_the_compressed_tag_the_client_holds():
+    client = client_for(lambda: Response(status_code=304, headers={"ETag": '"a"'}))
+    compressed = await client.get("/", headers={**GZIP, "if-none-match": '"a-gzip"'})
+    assert (compressed.status, compressed.headers["etag"]) == (304, '"a-gzip"')
+
+    identity = await client.get("/", headers={**GZIP, "if-none-match": '"a"'})
+    assert identity.headers["etag"] == '"a"'
+
+async def test_hotel_listings_revalidate_with_the_compressed_tag(api):
+    repository = MongoHotelRepository()
+    for i in range(10):
+        await repository.create(make_hotel(None, name=f"Hotel {i}"))
+
+    listing = await api.get("/api/v1/hotels/", headers=GZIP)
+    assert listing.headers["content-encoding"] == "gzip"
+    assert listing.headers["etag"].endswith('-gzip"')
+
+    revalidated = await api.get("/api/v1/hotels/", headers={**GZIP, "if-none-match": listing.headers["etag"]})
+    assert (revalidated.status, revalidated.headers["etag"]) == (304, listing.headers["etag"])
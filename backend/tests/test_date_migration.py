@@ -0,0 +1,82 @@
+from datetime import date, datetime
+from bson import ObjectId
+from app.infrastructure.database.bson_dates import (
+    bson_to_date,
+    bson_to_datetime,
+    date_to_bson,
+    has_legacy_dates,
+    load_migration_state
+)
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
+from app.migrate_dates import DATE_FIELDS, _convert, migrate_collection
+
+FIELDS = DATE_FIELDS["bookings"]
+
+def legacy_booking(**overrides):
+    doc = {
+        "_id": ObjectId(), "hotel_id": "h1", "room_type": "double", "status": "confirmed",
+        "check_in_date": "2030-01-10", "check_out_date": "2030-01-12",
+        "created_at": "2029-12-01T10:30:00.123000", "updated_at": "2029-12-01T10:30:00.123000",
+        "hold_expires_at": None
+    }
+    doc.update(overrides)
+    return doc
+
+def test_readers_accept_both_representations():
+    assert bson_to_date("2030-01-10") == bson_to_date(date_to_bson(date(2030, 1, 10))) == date(2030, 1, 10)
+    assert bson_to_datetime("2029-12-01T10:30:00") == datetime(2029, 12, 1, 10, 30)
+    assert bson_to_datetime(None) is None
+
+def test_convert_stores_dates_as_midnight_utc():
+    assert _convert("2030-01-10", "date") == datetime(2030, 1, 10)
+    assert _convert("2029-12-01T10:30:00.123000", "datetime") == datetime(2029, 12, 1, 10, 30, 0, 123000)
+
+def test_archive_is_migrated_like_bookings():
+    assert DATE_FIELDS["bookings_archive"] == FIELDS
+
+async def test_migration_converts_strings_and_marks_the_collection_done(db):
+    collection = db["bookings"]
+    legacy = legacy_booking()
+    native = legacy_booking(check_in_date=datetime(2030, 2, 1), check_out_date=datetime(2030, 2, 3),
+                            created_at=datetime(2029, 1, 1), updated_at=datetime(2029, 1, 1))
+    broken = legacy_booking(check_in_date="not a date")
+    await collection.insert_many([legacy, native, broken])
+
+    updated = await migrate_collection("bookings", FIELDS, batch_size=2, pause_ms=0, restart=False)
+
+    assert updated == 1
+    converted = await collection.find_one({"_id": legacy["_id"]})
+    assert converted["check_in_date"] == datetime(2030, 1, 10)
+    assert converted["created_at"] == datetime(2029, 12, 1, 10, 30, 0, 123000)
+    assert converted["hold_expires_at"] is None
+    assert (await collection.find_one({"_id": broken["_id"]}))["check_in_date"] == "not a date"
+    checkpoint = await db["migrations"].find_one({"_id": "bson_dates.bookings"})
+    assert checkpoint["done"] and checkpoint["updated"] == 1
+
+    # A finished collection is skipped on the next run
+    await collection.insert_one(legacy_booking())
+    assert await migrate_collection("bookings", FIELDS, batch_size=2, pause_ms=0, restart=False) == 0
+
+async def test_an_interrupted_run_resumes_after_its_checkpoint(db):
+    first, second = legacy_booking(), legacy_booking()
+    await db["bookings"].insert_many([first, second])
+    await db["migrations"].insert_one({"_id": "bson_dates.bookings", "last_id": first["_id"], "updated": 1, "done": False})
+
+    assert await migrate_collection("bookings", FIELDS, batch_size=10, pause_ms=0, restart=False) == 2
+    assert (await db["bookings"].find_one({"_id": first["_id"]}))["check_in_date"] == "2030-01-10"
+    assert (await db["bookings"].find_one({"_id": second["_id"]}))["check_in_date"] == datetime(2030, 1, 10)
+
+async def test_queries_stop_matching_strings_once_the_migration_is_done(db):
+    repository = MongoBookingRepository()
+    await db["bookings"].insert_one(legacy_booking(status="pending", hold_expires_at=datetime(2100, 1, 1)))
+    assert has_legacy_dates("bookings")
+    overlap = repository._overlap_query("h1", "double", date(2030, 1, 11), date(2030, 1, 13))
+    assert await db["bookings"].count_documents(overlap) == 1
+
+    await db["migrations"].insert_one({"_id": "bson_dates.bookings", "done": True})
+    await db["migrations"].insert_one({"_id": "bson_dates.bookings_archive", "done": False})
+    assert await load_migration_state(db) == {"bookings"}
+    assert not has_legacy_dates("bookings")
+    assert has_legacy_dates("bookings", "bookings_archive")
+    overlap = repository._overlap_query("h1", "double", date(2030, 1, 11), date(2030, 1, 13))
+    assert "$or" not in overlap
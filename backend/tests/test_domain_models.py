@@ -0,0 +1,33 @@
+import pytest
+from app.domain.models.hotel import Amenity, Room, amenity_mask
+from factories import make_booking, make_hotel
+
+def test_models_use_slots():
+    hotel = make_hotel()
+    with pytest.raises(AttributeError):
+        hotel.unexpected = 1
+    assert not hasattr(make_booking(), "__dict__")
+
+def test_amenity_bitset_follows_reassignment():
+    hotel = make_hotel()
+    assert not hotel.has_amenity(Amenity.WIFI)
+    hotel.amenities = [Amenity.WIFI, Amenity.POOL]
+    assert hotel.has_amenity(Amenity.WIFI) and hotel.has_amenity(Amenity.POOL)
+    assert not hotel.has_amenity(Amenity.SPA)
+    assert amenity_mask([Amenity.WIFI, "unknown"]) == amenity_mask([Amenity.WIFI])
+
+def test_room_aggregates_refresh_when_rooms_change():
+    hotel = make_hotel(rooms=[Room("double", 100.0, 2, 3)])
+    assert (hotel.get_minimum_price(), hotel.get_available_rooms_count()) == (100.0, 3)
+
+    hotel.rooms = hotel.rooms + [Room("single", 60.0, 1, 2)]
+    assert (hotel.get_minimum_price(), hotel.get_available_rooms_count()) == (60.0, 5)
+
+    hotel.rooms[0].available_count = 0
+    hotel.mark_dirty("rooms")
+    assert hotel.get_available_rooms_count() == 2
+    assert "rooms" in hotel.get_dirty_fields()
+
+def test_room_types_are_interned():
+    first, second = Room("".join(["dou", "ble"]), 1.0, 1, 1), Room("double", 1.0, 1, 1)
+    assert first.room_type is second.room_type
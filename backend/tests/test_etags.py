@@ -0,0 +1,83 @@
+import asyncio
+from types import SimpleNamespace
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from app.presentation.etags import encoded_etag, if_match, none_match
+from factories import make_hotel
+
+JSON = {"content-type": "application/json"}
+
+def request(if_none_match: str):
+    return SimpleNamespace(headers={"if-none-match": if_none_match})
+
+def test_if_none_match_compares_weakly_and_ignores_coding_suffixes():
+    assert none_match(request('"a"'), '"a"')
+    assert none_match(request('W/"a"'), '"a"')
+    assert none_match(request('"x", "a-gzip"'), '"a"')
+    assert none_match(request('"a"'), encoded_etag('"a"', "br"))
+    assert none_match(request("*"), '"a"')
+    assert not none_match(request('"b"'), '"a"')
+
+def test_if_match_compares_strongly():
+    assert if_match(None, '"a"')
+    assert if_match('"x", "a"', '"a"')
+    assert if_match('"a-zstd"', '"a"')
+    assert if_match("*", 'W/"a"')
+    assert not if_match('W/"a"', 'W/"a"')
+    assert not if_match('"b"', '"a"')
+
+def test_weak_and_malformed_tags_get_no_coding_suffix():
+    assert encoded_etag('"a"', "gzip") == '"a-gzip"'
+    assert encoded_etag('W/"a"', "gzip") == 'W/"a"'
+    assert encoded_etag('"a"', None) == '"a"'
+
+async def create_hotel(**kwargs) -> str:
+    return (await MongoHotelRepository().create(make_hotel(None, **kwargs))).hotel_id
+
+async def test_hotel_detail_revalidates_per_representation(api):
+    url = f"/api/v1/hotels/{await create_hotel()}"
+    plain = await api.get(url)
+    etag = plain.headers["etag"]
+
+    cached = await api.get(url, headers={"if-none-match": etag})
+    assert (cached.status, cached.body, cached.headers["etag"]) == (304, b"", etag)
+    assert "cache-control" in cached.headers
+
+    gzipped = await api.get(url, headers={"accept-encoding": "gzip"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"] == encoded_etag(etag, "gzip")
+    assert (await api.get(url, headers={"if-none-match": gzipped.headers["etag"]})).status == 304
+
+    sparse = await api.get(f"{url}?fields=name", headers={"if-none-match": etag})
+    assert sparse.status == 200 and sparse.headers["etag"] != etag
+    revalidated = await api.get(f"{url}?fields=name", headers={"if-none-match": sparse.headers["etag"]})
+    assert revalidated.status == 304
+
+async def test_updates_honour_if_match_and_change_the_tag(api):
+    url = f"/api/v1/hotels/{await create_hotel()}"
+    etag = (await api.get(url)).headers["etag"]
+    # updated_at is the version; make sure the clock moves between writes
+    await asyncio.sleep(0.002)
+
+    stale = await api.put(url, body=b'{"name": "B"}', headers={**JSON, "if-match": '"stale"'})
+    assert stale.status == 412
+
+    updated = await api.put(url, body=b'{"name": "B"}', headers={**JSON, "if-match": etag})
+    assert updated.status == 200 and updated.headers["etag"] != etag
+    assert (await api.get(url, headers={"if-none-match": etag})).status == 200
+    assert (await api.get(url, headers={"if-none-match": updated.headers["etag"]})).status == 304
+
+    again = await api.put(url, body=b'{"name": "C"}', headers={**JSON, "if-match": etag})
+    assert again.status == 412
+
+async def test_lists_and_searches_revalidate(api):
+    await create_hotel(name="A")
+    await create_hotel(name="B")
+
+    listing = await api.get("/api/v1/hotels/?limit=10")
+    assert len(listing.json()) == 2
+    assert (await api.get("/api/v1/hotels/?limit=10", headers={"if-none-match": listing.headers["etag"]})).status == 304
+    assert (await api.get("/api/v1/hotels/?limit=1", headers={"if-none-match": listing.headers["etag"]})).status == 200
+
+    search = await api.get("/api/v1/search/hotels")
+    assert search.status == 200 and search.headers["etag"].startswith("W/")
+    assert (await api.get("/api/v1/search/hotels", headers={"if-none-match": search.headers["etag"]})).status == 304
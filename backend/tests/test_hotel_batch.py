@@ -0,0 +1,41 @@
+import orjson
+from bson import ObjectId
+from app.application.dto.hotel_dto import MAX_BATCH_HOTELS
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from factories import make_hotel
+
+async def create_hotels(count: int):
+    repository = MongoHotelRepository()
+    return [(await repository.create(make_hotel(None, name=f"Hotel {i}"))).hotel_id for i in range(count)]
+
+async def test_hotels_come_back_in_requested_order_with_missing_ids_reported(api):
+    first, second = await create_hotels(2)
+    unknown = str(ObjectId())
+
+    reply = await api.get(f"/api/v1/hotels/batch?ids={second},{unknown}&ids={first}&ids={second}&ids=not-an-id")
+
+    assert reply.status == 200
+    body = reply.json()
+    assert [hotel["id"] for hotel in body["hotels"]] == [second, first]
+    assert body["missing"] == [unknown, "not-an-id"]
+    assert set(reply.headers["surrogate-key"].split()) >= {"catalog", f"hotel-{first}", f"hotel-{second}"}
+
+async def test_batches_revalidate_with_their_etag(api):
+    ids = ",".join(await create_hotels(2))
+    reply = await api.get(f"/api/v1/hotels/batch?ids={ids}")
+    assert (await api.get(f"/api/v1/hotels/batch?ids={ids}", headers={"if-none-match": reply.headers["etag"]})).status == 304
+    assert (await api.get(f"/api/v1/hotels/batch?ids={ids}&fields=name",
+                          headers={"if-none-match": reply.headers["etag"]})).status == 200
+
+async def test_post_accepts_long_id_lists(api):
+    ids = await create_hotels(3)
+    reply = await api.post("/api/v1/hotels/batch?fields=name", body=orjson.dumps({"ids": ids[::-1]}),
+                           headers={"content-type": "application/json"})
+    assert [hotel["name"] for hotel in reply.json()["hotels"]] == ["Hotel 2", "Hotel 1", "Hotel 0"]
+
+async def test_batch_size_is_bounded(api):
+    too_many = ",".join(str(ObjectId()) for _ in range(MAX_BATCH_HOTELS + 1))
+    assert (await api.get(f"/api/v1/hotels/batch?ids={too_many}")).status == 400
+    assert (await api.get("/api/v1/hotels/batch?ids=,")).status == 400
+    empty = await api.post("/api/v1/hotels/batch", body=b'{"ids": []}', headers={"content-type": "application/json"})
+    assert empty.status == 422
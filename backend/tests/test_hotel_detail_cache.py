@@ -0,0 +1,91 @@
+import asyncio
+import gzip
+from app.application.services.hotel_detail_cache import HotelDetailCache
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from factories import make_hotel
+
+def make_cache(**kwargs) -> HotelDetailCache:
+    return HotelDetailCache(
+        lambda content: content.encode(),
+        {"gzip": gzip.compress},
+        tagger=lambda content: f'"{content}"',
+        variant_tagger=lambda etag, encoding: f'{etag[:-1]}-{encoding}"',
+        **kwargs
+    )
+
+class Loader:
+    def __init__(self, value="v1"):
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.value
+
+async def test_concurrent_misses_share_one_load():
+    cache, loader = make_cache(), Loader()
+    loader.release.clear()
+    waiting = [asyncio.ensure_future(cache.get_or_load("h1", loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    loader.release.set()
+    payloads = await asyncio.gather(*waiting)
+    assert loader.calls == 1
+    assert all(payload is payloads[0] for payload in payloads)
+    assert (await cache.get_or_load("h1", loader)) is payloads[0] and loader.calls == 1
+
+async def test_a_write_during_a_load_keeps_the_stale_result_out():
+    cache, loader = make_cache(), Loader()
+    loader.release.clear()
+    loading = asyncio.ensure_future(cache.get_or_load("h1", loader))
+    while not loader.calls:
+        await asyncio.sleep(0)
+    cache.invalidate("h1")
+    loader.release.set()
+    await loading
+    await cache.get_or_load("h1", loader)
+    assert loader.calls == 2
+
+async def test_missing_hotels_expired_and_evicted_entries_are_reloaded():
+    cache, loader = make_cache(max_entries=1), Loader(None)
+    assert await cache.get_or_load("h1", loader) is None
+    assert await cache.get_or_load("h1", loader) is None and loader.calls == 2
+
+    loader.value = "v1"
+    await cache.get_or_load("h1", loader)
+    await cache.get_or_load("h2", loader)
+    await cache.get_or_load("h1", loader)
+    assert loader.calls == 5
+
+    expiring = make_cache(ttl_seconds=0)
+    await expiring.get_or_load("h1", loader)
+    await expiring.get_or_load("h1", loader)
+    assert loader.calls == 7
+
+async def test_compressed_variants_are_built_once_and_tagged_per_encoding():
+    payload = await make_cache().get_or_load("h1", Loader("body"))
+    assert payload.variant(None) == b"body"
+    assert gzip.decompress(payload.variant("gzip")) == b"body"
+    assert payload.variant("gzip") is payload.variant("gzip")
+    assert (payload.variant_etag(None), payload.variant_etag("gzip")) == ('"body"', '"body-gzip"')
+
+async def test_detail_views_are_served_from_the_cache_until_the_hotel_changes(api, db):
+    hotel = await MongoHotelRepository().create(make_hotel(None, name="Before"))
+    url = f"/api/v1/hotels/{hotel.hotel_id}"
+    reads = 0
+    find_one = db["hotels"].find_one
+
+    async def counting_find_one(*args, **kwargs):
+        nonlocal reads
+        reads += 1
+        return await find_one(*args, **kwargs)
+    db["hotels"].find_one = counting_find_one
+
+    first, second = await api.get(url), await api.get(url)
+    assert first.body == second.body and first.json()["name"] == "Before"
+    assert reads == 1
+
+    assert (await api.put(url, body=b'{"name": "After"}', headers={"content-type": "application/json"})).status == 200
+    assert (await api.get(url)).json()["name"] == "After"
@@ -0,0 +1,90 @@
+import json
+from typing import List, Tuple
+import pytest
+from app.application.dto.import_dto import ImportFormat
+from app.application.services.hotel_import_service import (
+    HotelImportService,
+    iter_csv_records,
+    iter_msgpack_records,
+    iter_text_lines
+)
+
+ROOMS = json.dumps([{"room_type": "double", "price_per_night": 120, "capacity": 2, "available_count": 4}])
+HEADER = "external_id,name,description,address,city,country,latitude,longitude,category,star_rating,amenities,rooms"
+
+def csv_row(external_id: str, description: str = "Nice", star_rating: str = "4") -> str:
+    rooms = ROOMS.replace('"', '""')
+    return (f'{external_id},Hotel {external_id},{description},1 Main St,Paris,France,48.8,2.3,'
+            f'standard,{star_rating},wifi|pool,"{rooms}"')
+
+class RecordingRepository:
+    def __init__(self):
+        self.hotels = []
+
+    async def upsert_many_by_external_id(self, hotels):
+        self.hotels += hotels
+        return len(hotels), 0, []
+
+async def lines(*items: str):
+    for item in items:
+        yield item
+
+async def chunks(*items: bytes):
+    for item in items:
+        yield item
+
+async def run_import(fmt: ImportFormat, records, chunk_size: int = 2) -> Tuple[object, RecordingRepository]:
+    repository = RecordingRepository()
+    result = await HotelImportService(repository, chunk_size=chunk_size).import_lines(records, fmt)
+    return result, repository
+
+async def test_text_lines_are_split_across_chunk_boundaries():
+    collected = [line async for line in iter_text_lines(chunks(b"a,b\nc", b",d\n\ne", b"\n"))]
+    assert collected == ["a,b", "c,d", "", "e"]
+
+async def test_quoted_fields_span_lines_and_keep_their_whitespace():
+    result, repository = await run_import(ImportFormat.CSV, lines(
+        HEADER,
+        csv_row("s-1", '"  Sea view,\n  second line  "'),
+        "",
+        csv_row("s-2"),
+    ))
+    assert (result.processed, result.inserted, result.failed) == (2, 2, 0)
+    assert repository.hotels[0].description == "  Sea view,\n  second line  "
+    assert repository.hotels[0].rooms[0].price_per_night == 120
+    assert [hotel.external_id for hotel in repository.hotels] == ["s-1", "s-2"]
+
+async def test_csv_records_are_numbered_by_their_first_line():
+    records = [r async for r in iter_csv_records(lines('a,"b\n', 'c"', "d", '"unterminated'))]
+    assert records == [(1, 'a,"b\nc"'), (3, "d"), (4, '"unterminated')]
+
+async def test_bad_lines_are_reported_and_skipped():
+    result, repository = await run_import(ImportFormat.CSV, lines(
+        HEADER,
+        csv_row("s-1", star_rating="9"),
+        csv_row("s-2"),
+        'broken,"unterminated',
+    ))
+    assert (result.processed, result.inserted, result.failed) == (3, 1, 2)
+    assert [error.line for error in result.errors] == [2, 4]
+    assert "star_rating" in result.errors[0].message
+
+async def test_malformed_header_is_rejected():
+    with pytest.raises(ValueError):
+        await run_import(ImportFormat.CSV, lines('external_id,"name'))
+
+async def test_ndjson_import():
+    record = {
+        "external_id": "n-1", "name": "Hotel", "description": "d", "category": "resort", "star_rating": 5,
+        "location": {"address": "a", "city": "Nice", "country": "France", "latitude": 43.7, "longitude": 7.2},
+        "rooms": json.loads(ROOMS)
+    }
+    result, repository = await run_import(ImportFormat.NDJSON, lines(json.dumps(record), "  ", "{not json"))
+    assert (result.inserted, result.failed) == (1, 1)
+    assert repository.hotels[0].location.city == "Nice"
+
+async def test_msgpack_records_decode_across_chunks():
+    msgpack = pytest.importorskip("msgpack")
+    data = msgpack.packb({"a": 1}) + msgpack.packb({"b": 2})
+    records: List[dict] = [r async for r in iter_msgpack_records(chunks(data[:3], data[3:]))]
+    assert records == [{"a": 1}, {"b": 2}]
@@ -0,0 +1,28 @@
+from app.application.dto.hotel_dto import VERSION_FIELDS, HotelResponseDTO
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository, read_projection
+from app.domain.models.hotel import Room
+from factories import make_hotel
+
+async def test_read_documents_render_like_hydrated_hotels(db):
+    repository = MongoHotelRepository()
+    hotel = await repository.create(make_hotel(
+        hotel_id=None, rooms=[Room("double", 120.0, 2, 3), Room("suite", 90.0, 4, 1)]
+    ))
+
+    doc = await repository.get_document_by_id(hotel.hotel_id)
+    assert "version" not in doc and "_id" not in doc
+    fast = HotelResponseDTO.from_document(doc)
+    hydrated = HotelResponseDTO.from_domain(await repository.get_by_id(hotel.hotel_id))
+    assert fast.model_dump(mode="json") == hydrated.model_dump(mode="json")
+    assert (fast.minimum_price, fast.available_rooms) == (90.0, 4)
+
+def test_projection_covers_only_the_requested_fields():
+    assert read_projection(None) == {"version": 0}
+    assert read_projection(["name", "minimum_price"]) == {"name": 1, "rooms.price_per_night": 1}
+    # A parent path wins over its sub-paths
+    assert read_projection(["rooms", "minimum_price", "available_rooms"]) == {"rooms": 1}
+    assert read_projection(["primary_image"]) == {"images": {"$slice": 1}}
+
+def test_revalidation_reads_a_non_empty_projection():
+    # An empty projection would return the whole document
+    assert read_projection(VERSION_FIELDS) == {"updated_at": 1}
@@ -0,0 +1,116 @@
+from typing import Any, Dict, List, Set
+import pytest
+from pymongo import ASCENDING, IndexModel
+from app.dependencies import get_repositories
+from app.infrastructure.database.indexes import (
+    QueryShape,
+    _plan_stages,
+    ensure_collection_indexes,
+    verify_query_shapes
+)
+from app.infrastructure.database.mongodb import MongoDB
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
+
+def filter_fields(query: Dict[str, Any]) -> Set[str]:
+    """Fields every document matching the filter is constrained on"""
+    fields = set()
+    for key, value in query.items():
+        if key == "$and":
+            for part in value:
+                fields |= filter_fields(part)
+        elif key == "$or":
+            fields |= set.intersection(*(filter_fields(part) for part in value))
+        elif not key.startswith("$"):
+            fields.add(key)
+    return fields
+
+class PlannerCollection:
+    """
+    Explains a query the way the planner would pick an index: when the
+    filter or the sort constrains the leading key of a declared index.
+    """
+    def __init__(self, name: str, indexes: List[IndexModel]):
+        self.name = name
+        self.leading_keys = {next(iter(index.document["key"])) for index in indexes}
+        self.created: List[str] = []
+        self._filter: Dict[str, Any] = {}
+        self._sort: List = []
+
+    def find(self, query):
+        self._filter, self._sort = query, []
+        return self
+
+    def sort(self, sort):
+        self._sort = sort
+        return self
+
+    async def explain(self):
+        fields = filter_fields(self._filter) | {field for field, _ in self._sort[:1]}
+        stage = "IXSCAN" if fields & self.leading_keys else "COLLSCAN"
+        return {"queryPlanner": {"winningPlan": {"stage": "FETCH", "inputStage": {"stage": stage}}}}
+
+    async def index_information(self):
+        return {"_id_": {}, "existing": {}}
+
+    async def create_indexes(self, indexes):
+        self.created += [index.document["name"] for index in indexes]
+
+class PlannerDatabase:
+    def __init__(self, repositories):
+        self.collections = {
+            repository.collection_name: PlannerCollection(repository.collection_name, repository.INDEXES)
+            for repository in repositories
+        }
+
+    def __getitem__(self, name):
+        return self.collections[name]
+
+@pytest.fixture
+def planner(monkeypatch):
+    database = PlannerDatabase(get_repositories())
+    monkeypatch.setattr(MongoDB, "_database", database)
+    return database
+
+@pytest.mark.parametrize("migrated", [set(), {"bookings", "bookings_archive"}])
+async def test_every_declared_query_shape_uses_an_index(planner, migration_state, migrated):
+    migration_state.update(migrated)
+    reports = await verify_query_shapes(get_repositories())
+    assert reports and all(report.stages[-1] == "IXSCAN" for report in reports)
+
+async def test_verification_fails_on_a_collection_scan(planner):
+    class Repository:
+        collection_name = "bookings"
+
+        def query_shapes(self):
+            return [QueryShape("by_guest_name", {"guest_name": "x"})]
+
+    with pytest.raises(RuntimeError, match="bookings.by_guest_name"):
+        await verify_query_shapes([Repository()])
+
+def test_shapes_follow_the_live_query_builders(migration_state):
+    repository = MongoBookingRepository()
+    shapes = {shape.name: shape.filter for shape in repository.query_shapes()}
+    assert "$or" in shapes["availability"]
+
+    migration_state.update({"bookings"})
+    shapes = {shape.name: shape.filter for shape in repository.query_shapes()}
+    assert "$or" not in shapes["availability"]
+    assert set(shapes["availability"]) >= {"hotel_id", "room_type", "status", "check_in_date"}
+
+async def test_only_missing_indexes_are_created():
+    collection = PlannerCollection("c", [])
+    indexes = [
+        IndexModel([("a", ASCENDING)], name="existing"),
+        IndexModel([("b", ASCENDING)], name="new"),
+    ]
+    report = await ensure_collection_indexes(collection, indexes)
+    assert (report.created, report.existing) == (["new"], ["existing"])
+    assert collection.created == ["new"]
+
+def test_plan_stages_flatten_nested_plans():
+    plan = {
+        "stage": "SORT_MERGE",
+        "inputStages": [{"stage": "IXSCAN"}, {"stage": "FETCH", "inputStage": {"stage": "COLLSCAN"}}]
+    }
+    assert _plan_stages(plan) == ["SORT_MERGE", "IXSCAN", "FETCH", "COLLSCAN"]
+    assert _plan_stages({"queryPlan": {"stage": "IXSCAN"}}) == ["IXSCAN"]
@@ -0,0 +1,47 @@
+from collections import Counter
+from datetime import date
+from app.generate_load_data import LoadDataGenerator, write_collection
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+
+START = date(2030, 1, 1)
+
+def generate(seed: int = 7, hotels: int = 200, users: int = 20, bookings: int = 300):
+    generator = LoadDataGenerator(seed, cities=30, start_date=START, days=365)
+    return (
+        list(generator.hotels(hotels)),
+        list(generator.users(users, "hash")),
+        list(generator.bookings(bookings))
+    )
+
+def without_timestamps(docs):
+    """Timestamps follow the run's clock, everything else follows the seed"""
+    return [{k: v for k, v in doc.items() if k not in ("created_at", "updated_at")} for doc in docs]
+
+def test_the_same_seed_produces_the_same_documents():
+    first, second = generate(), generate()
+    assert [without_timestamps(docs) for docs in first] == [without_timestamps(docs) for docs in second]
+    assert [doc["_id"] for doc in generate(seed=8)[0]] != [doc["_id"] for doc in first[0]]
+
+def test_cities_and_bookings_are_skewed():
+    hotels, _, bookings = generate()
+    by_city = Counter(doc["location"]["city"] for doc in hotels).most_common()
+    assert by_city[0][0] == "Paris"
+    assert by_city[0][1] > 3 * by_city[-1][1]
+    assert len(by_city) > 15
+
+    hotel_ids = {str(doc["_id"]) for doc in hotels}
+    user_ids = {str(doc["_id"]) for doc in generate()[1]}
+    assert all(doc["hotel_id"] in hotel_ids and doc["user_id"] in user_ids for doc in bookings)
+    assert all(doc["check_out_date"] > doc["check_in_date"] for doc in bookings)
+
+async def test_generated_documents_load_through_the_repositories(db):
+    hotels, _, bookings = generate(hotels=20, users=5, bookings=30)
+    assert await write_collection("hotels", iter(hotels), batch_size=7, concurrency=2) == 20
+    assert await write_collection("bookings", iter(bookings), batch_size=7, concurrency=2) == 30
+
+    hotel = await MongoHotelRepository().get_by_id(str(hotels[0]["_id"]))
+    booking = await MongoBookingRepository().get_by_id(str(bookings[0]["_id"]))
+    assert hotel.rooms and hotel.location.city == hotels[0]["location"]["city"]
+    assert booking.check_in_date >= START
+    assert booking.total_price == bookings[0]["total_price"]
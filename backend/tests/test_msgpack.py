@@ -0,0 +1,59 @@
+import pytest
+
+msgpack = pytest.importorskip("msgpack")
+
+from app.presentation import negotiation
+from app.presentation.negotiation import prefers_msgpack
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from factories import make_hotel
+
+MSGPACK = "application/msgpack"
+HOTEL = {
+    "name": "Harbour", "description": "d", "category": "standard", "star_rating": 3,
+    "location": {"address": "a", "city": "Lisbon", "country": "Portugal", "latitude": 38.7, "longitude": -9.1},
+    "rooms": [{"room_type": "double", "price_per_night": 120, "capacity": 2, "available_count": 4}]
+}
+
+def test_msgpack_is_chosen_only_when_ranked_at_least_as_high_as_json():
+    assert prefers_msgpack("application/msgpack")
+    assert prefers_msgpack("application/json;q=0.5, application/x-msgpack")
+    assert not prefers_msgpack("application/json, application/msgpack;q=0.9")
+    assert not prefers_msgpack("*/*")
+    assert not prefers_msgpack(None)
+
+async def test_msgpack_bodies_are_decoded_once_into_the_body_model(api, monkeypatch):
+    calls = []
+    unpack = negotiation.unpack
+    monkeypatch.setattr(negotiation, "unpack", lambda data: calls.append(data) or unpack(data))
+
+    reply = await api.post("/api/v1/hotels/", body=msgpack.packb(HOTEL), headers={"content-type": MSGPACK})
+
+    assert reply.status == 201 and reply.json()["name"] == "Harbour"
+    assert len(calls) == 1
+
+async def test_malformed_and_invalid_bodies(api):
+    malformed = await api.post("/api/v1/hotels/", body=b"\xc1", headers={"content-type": MSGPACK})
+    assert malformed.status == 400
+
+    invalid = await api.post("/api/v1/hotels/", body=msgpack.packb({**HOTEL, "star_rating": 9}),
+                             headers={"content-type": MSGPACK, "accept": MSGPACK})
+    assert invalid.status == 422
+    assert invalid.headers["content-type"] == MSGPACK
+    assert msgpack.unpackb(invalid.body)["details"][0]["loc"] == ["body", "star_rating"]
+
+async def test_responses_are_negotiated_from_accept(api):
+    hotel_id = (await MongoHotelRepository().create(make_hotel(None, name="Packed"))).hotel_id
+    url = f"/api/v1/hotels/{hotel_id}"
+
+    packed = await api.get(url, headers={"accept": MSGPACK})
+    assert packed.headers["content-type"] == MSGPACK
+    assert "Accept" in packed.headers["vary"]
+    assert msgpack.unpackb(packed.body) == (await api.get(url)).json()
+    assert (await api.get(url, headers={"accept": MSGPACK, "if-none-match": packed.headers["etag"]})).status == 304
+
+async def test_raw_body_routes_read_the_stream_themselves(api):
+    records = b"".join(msgpack.packb({**HOTEL, "external_id": f"x-{i}"}) for i in range(2))
+    reply = await api.post("/api/v1/hotels/import?format=msgpack", body_chunks=[records[:5], records[5:]],
+                           headers={"content-type": MSGPACK})
+    assert reply.status == 200
+    assert reply.json()["processed"] == 2 and reply.json()["failed"] == 0
@@ -0,0 +1,57 @@
+from bson import ObjectId
+import pytest
+from app.domain.exceptions import ConcurrentModificationError
+from app.domain.models.booking import BookingStatus
+from app.infrastructure.database.partial_update import update_changed_fields
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
+from factories import make_booking
+
+def test_entities_record_only_changed_fields():
+    booking = make_booking()
+    assert booking.get_dirty_fields() == set()
+    booking.confirm()
+    assert booking.get_dirty_fields() == {"status", "hold_expires_at", "updated_at"}
+    booking.mark_clean()
+    assert booking.get_dirty_fields() == set()
+
+async def test_update_sends_only_changed_fields_and_bumps_the_version(db):
+    collection = db["bookings"]
+    doc_id = ObjectId()
+    await collection.insert_one({"_id": doc_id, "status": "pending", "guests_count": 2, "version": 0})
+
+    updated = await update_changed_fields(
+        collection, doc_id, {"status": "confirmed", "guests_count": 3}, ["status"], 0, "Booking"
+    )
+
+    assert updated["status"] == "confirmed"
+    assert updated["guests_count"] == 2
+    assert updated["version"] == 1
+
+async def test_stale_versions_are_rejected(db):
+    collection = db["bookings"]
+    doc_id = ObjectId()
+    await collection.insert_one({"_id": doc_id, "status": "pending", "version": 3})
+
+    with pytest.raises(ConcurrentModificationError):
+        await update_changed_fields(collection, doc_id, {"status": "confirmed"}, ["status"], 2, "Booking")
+    assert await update_changed_fields(collection, ObjectId(), {"status": "x"}, ["status"], 0, "Booking") is None
+
+async def test_documents_written_before_versioning_count_as_version_zero(db):
+    collection = db["bookings"]
+    doc_id = ObjectId()
+    await collection.insert_one({"_id": doc_id, "status": "pending"})
+    updated = await update_changed_fields(collection, doc_id, {"status": "cancelled"}, ["status"], 0, "Booking")
+    assert updated["version"] == 1
+
+async def test_repository_update_round_trip(db):
+    repository = MongoBookingRepository()
+    booking = await repository.create(make_booking())
+    stale = await repository.get_by_id(booking.booking_id)
+
+    booking.confirm()
+    saved = await repository.update(booking.booking_id, booking)
+    assert (saved.status, saved.version) == (BookingStatus.CONFIRMED, 1)
+
+    stale.cancel()
+    with pytest.raises(ConcurrentModificationError):
+        await repository.update(stale.booking_id, stale)
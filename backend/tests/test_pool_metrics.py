@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+import pytest
+from app.infrastructure.database.pool_metrics import PoolMetricsListener
+
+ADDRESS = ("db", 27017)
+
+def event(duration: float = 0.0):
+    return SimpleNamespace(address=ADDRESS, duration=duration)
+
+def test_checkouts_track_waiting_in_use_and_wait_times():
+    listener = PoolMetricsListener()
+    listener.pool_created(event())
+    listener.connection_created(event())
+    listener.connection_check_out_started(event())
+    listener.connection_check_out_started(event())
+    listener.connection_checked_out(event(0.002))
+    listener.connection_check_out_failed(event(0.006))
+
+    stats = listener.snapshot()["db:27017"]
+    assert (stats["open_connections"], stats["in_use"], stats["waiting"], stats["max_waiting"]) == (1, 1, 0, 2)
+    assert (stats["checkouts"], stats["checkout_failures"]) == (1, 1)
+    assert stats["checkout_wait_max_ms"] == pytest.approx(6.0)
+    assert stats["checkout_wait_avg_ms"] == pytest.approx(4.0)
+
+    listener.connection_checked_in(event())
+    listener.connection_closed(event())
+    listener.pool_cleared(event())
+    stats = listener.snapshot()["db:27017"]
+    assert (stats["open_connections"], stats["in_use"], stats["pool_clears"]) == (0, 0, 1)
+
+def test_snapshot_is_a_copy():
+    listener = PoolMetricsListener()
+    listener.pool_created(event())
+    listener.snapshot()["db:27017"]["in_use"] = 99
+    assert listener.snapshot()["db:27017"]["in_use"] == 0
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+import pytest
+from app.domain.models.booking import BookingStatus
+from app.application.services.booking_service import BookingService
+from app.application.services.popularity_tracker import DecayingCounter, PopularityTracker
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
+from factories import InMemoryHotelRepository, make_booking, make_hotel
+
+HOUR = 3600.0
+
+def test_scores_halve_every_half_life():
+    counter = DecayingCounter(HOUR, landmark=0)
+    counter.add("a", 8, timestamp=0)
+    counter.add("b", 1, timestamp=2 * HOUR)
+    assert counter.top(2, now=2 * HOUR) == [("a", pytest.approx(2.0)), ("b", pytest.approx(1.0))]
+
+def test_compaction_rebases_and_drops_faded_keys():
+    counter = DecayingCounter(HOUR, landmark=0)
+    counter.add("old", 1, timestamp=0)
+    counter.add("new", 1, timestamp=10 * HOUR)
+    counter.compact(now=10 * HOUR)
+    assert len(counter) == 1
+    assert counter.top(1, now=10 * HOUR) == [("new", pytest.approx(1.0))]
+
+class CatalogRepository(InMemoryHotelRepository):
+    async def get_all(self, skip: int, limit: int):
+        return list(self.hotels.values())[skip:skip + limit]
+
+    async def get_city_hotel_counts(self, cities=None, limit: int = 50):
+        counts = {}
+        for hotel in self.hotels.values():
+            key = (hotel.location.city, hotel.location.country)
+            counts[key] = counts.get(key, 0) + 1
+        return [{"city": city, "country": country, "hotels_count": n} for (city, country), n in counts.items()]
+
+def hotel_scores(tracker):
+    return {hotel_id: round(score, 6) for hotel_id, score in tracker._hotels.top(10)}
+
+async def test_cancellation_takes_back_exactly_what_the_booking_added():
+    tracker = PopularityTracker(CatalogRepository([]), None)
+    hotel = make_hotel()
+    booking = make_booking(created_at=datetime.utcnow() - timedelta(hours=5))
+    tracker.record_booking(hotel, timestamp=(booking.created_at - datetime(1970, 1, 1)).total_seconds())
+    tracker.record_booking(hotel)
+    tracker.record_cancellation(hotel, booking)
+    assert hotel_scores(tracker) == {"h1": pytest.approx(1.0, abs=1e-3)}
+
+async def test_cancelling_and_expiring_bookings_lower_popularity(db):
+    hotels = CatalogRepository([make_hotel("h1"), make_hotel("h2", city="Rome")])
+    repository = MongoBookingRepository()
+    tracker = PopularityTracker(hotels, repository)
+    service = BookingService(repository, hotels, popularity_tracker=tracker)
+    kept = await repository.create(make_booking("h2", status=BookingStatus.CONFIRMED))
+    cancelled = await repository.create(make_booking("h1", status=BookingStatus.CONFIRMED))
+    lapsed = await repository.create(make_booking("h1", hold_expires_at=datetime.utcnow() - timedelta(minutes=1)))
+    for booking in (kept, cancelled, lapsed):
+        tracker.record_booking(await hotels.get_by_id(booking.hotel_id))
+
+    await service.cancel_booking(cancelled.booking_id)
+    await service.expire_stale_holds()
+    await tracker.refresh()
+
+    assert [hotel.id for hotel in tracker.get_trending_hotels(10)] == ["h2"]
+    assert tracker.get_popular_destinations(1)[0]["city"] == "Rome"
+
+async def test_warm_up_skips_cancelled_bookings(db):
+    hotels = CatalogRepository([make_hotel("h1"), make_hotel("h2", city="Rome")])
+    repository = MongoBookingRepository()
+    await repository.create(make_booking("h1", status=BookingStatus.CANCELLED))
+    await repository.create(make_booking("h2", status=BookingStatus.CONFIRMED))
+    tracker = PopularityTracker(hotels, repository)
+
+    await tracker.warm_up(timedelta(days=1))
+
+    assert set(hotel_scores(tracker)) == {"h2"}
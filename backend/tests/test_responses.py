@@ -0,0 +1,35 @@
+from datetime import date, datetime
+import orjson
+import pytest
+from pydantic import BaseModel
+from app.presentation.responses import ORJSONResponse, render_json
+
+class Point(BaseModel):
+    x: int
+    when: date
+
+def test_render_json_handles_models_sets_and_dates():
+    rendered = render_json({"point": Point(x=1, when=date(2030, 1, 10)), "tags": {"a"}, 1: datetime(2030, 1, 1)})
+    assert orjson.loads(rendered) == {"point": {"x": 1, "when": "2030-01-10"}, "tags": ["a"], "1": "2030-01-01T00:00:00"}
+
+def test_render_json_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        render_json({"value": object()})
+
+def test_pre_encoded_bytes_are_sent_as_is():
+    body = b'{"already":"encoded"}'
+    response = ORJSONResponse(body)
+    assert response.body == body
+    assert response.headers["content-type"] == "application/json"
+
+async def test_routes_and_error_handlers_render_with_orjson(api):
+    health = await api.get("/health")
+    assert (health.status, health.body) == (200, b'{"status":"healthy"}')
+
+    invalid = await api.get("/api/v1/hotels/?limit=0")
+    assert invalid.status == 422
+    assert invalid.json()["details"][0]["loc"] == ["query", "limit"]
+
+    missing = await api.get("/api/v1/hotels/0123456789abcdef01234567")
+    assert missing.status == 404
+    assert missing.json() == {"error": "Hotel not found", "status_code": 404}
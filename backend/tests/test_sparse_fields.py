@@ -0,0 +1,52 @@
+import pytest
+from app.application.dto.hotel_dto import HOTEL_FIELD_PRESETS, parse_hotel_fields
+from app.domain.models.hotel import Room
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from factories import make_hotel
+
+def test_fields_always_carry_the_version_fields():
+    assert parse_hotel_fields("name, name,location") == ("id", "name", "location", "updated_at")
+    assert parse_hotel_fields(" card ") == HOTEL_FIELD_PRESETS["card"]
+    assert parse_hotel_fields("detail") is None
+    assert parse_hotel_fields(None) is None
+    with pytest.raises(ValueError, match="password, rooms.price"):
+        parse_hotel_fields("name,password,rooms.price")
+
+async def create_hotel() -> str:
+    hotel = make_hotel(None, rooms=[Room("double", 180.0, 2, 3), Room("single", 90.0, 1, 4)], images=["a.jpg", "b.jpg"])
+    return (await MongoHotelRepository().create(hotel)).hotel_id
+
+async def test_card_preset_returns_only_its_fields(api, db):
+    hotel_id = await create_hotel()
+    full = (await api.get(f"/api/v1/hotels/{hotel_id}")).json()
+    projections = []
+    find_one = db["hotels"].find_one
+
+    async def recording_find_one(query=None, projection=None):
+        projections.append(projection)
+        return await find_one(query, projection)
+    db["hotels"].find_one = recording_find_one
+
+    card = (await api.get(f"/api/v1/hotels/{hotel_id}?fields=card")).json()
+
+    assert list(card) == list(HOTEL_FIELD_PRESETS["card"])
+    assert (card["minimum_price"], card["primary_image"]) == (90.0, "a.jpg")
+    shared = ("id", "name", "location", "star_rating", "updated_at")
+    assert [card[field] for field in shared] == [full[field] for field in shared]
+    assert "rooms" not in projections[0] and "description" not in projections[0]
+
+async def test_listings_searches_and_batches_accept_fields(api):
+    hotel_id = await create_hotel()
+    listing = (await api.get("/api/v1/hotels/?fields=available_rooms")).json()
+    search = (await api.get("/api/v1/search/hotels?fields=available_rooms")).json()
+    batch = (await api.get(f"/api/v1/hotels/batch?ids={hotel_id}&fields=available_rooms")).json()
+
+    for hotels in (listing, search["hotels"], batch["hotels"]):
+        assert [list(hotel) for hotel in hotels] == [["id", "available_rooms", "updated_at"]]
+        assert (hotels[0]["id"], hotels[0]["available_rooms"]) == (hotel_id, 7)
+
+async def test_unknown_fields_are_a_bad_request(api):
+    hotel_id = await create_hotel()
+    for url in (f"/api/v1/hotels/{hotel_id}?fields=secret", "/api/v1/hotels/?fields=secret", "/api/v1/search/hotels?fields=secret"):
+        reply = await api.get(url)
+        assert reply.status == 400 and "secret" in reply.json()["error"]
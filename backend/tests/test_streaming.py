@@ -0,0 +1,43 @@
+from datetime import date, datetime, timedelta
+from app.infrastructure.database.repositories.booking_repository import MongoBookingRepository
+from app.infrastructure.database.repositories.hotel_repository import MongoHotelRepository
+from factories import make_booking, make_hotel
+
+async def collect(stream):
+    return [item async for item in stream]
+
+async def test_hotels_stream_in_id_order(db):
+    repository = MongoHotelRepository(batch_size=2)
+    created = [await repository.create(make_hotel(hotel_id=None, name=f"Hotel {i}")) for i in range(5)]
+    streamed = await collect(repository.iter_all(batch_size=2))
+    assert [hotel.hotel_id for hotel in streamed] == sorted(hotel.hotel_id for hotel in created)
+
+async def test_get_by_ids_skips_unknown_and_malformed_ids(db):
+    repository = MongoHotelRepository()
+    hotel = await repository.create(make_hotel(hotel_id=None))
+    found = await repository.get_by_ids([hotel.hotel_id, hotel.hotel_id, "0" * 24, "not-an-id"])
+    assert [h.hotel_id for h in found] == [hotel.hotel_id]
+
+async def test_booking_streams_keep_their_order(db):
+    repository = MongoBookingRepository(batch_size=2)
+    for day in (15, 3, 9):
+        await repository.create(make_booking(check_in=date(2030, 1, day)))
+    await repository.create(make_booking(user_id="u2"))
+
+    by_hotel = await collect(repository.iter_by_hotel_id("h1"))
+    assert [b.check_in_date.day for b in by_hotel] == [3, 9, 10, 15]
+
+    by_user = await collect(repository.iter_by_user_id("u1"))
+    assert [b.created_at for b in by_user] == sorted((b.created_at for b in by_user), reverse=True)
+    assert len(by_user) == 3
+
+async def test_created_since_streams_only_recent_bookings_oldest_first(db):
+    repository = MongoBookingRepository()
+    old = await repository.create(make_booking())
+    await db["bookings"].update_one({}, {"$set": {"created_at": datetime.utcnow() - timedelta(days=30)}})
+    recent = [await repository.create(make_booking()) for _ in range(3)]
+
+    streamed = await collect(repository.iter_created_since(datetime.utcnow() - timedelta(days=1), batch_size=2))
+
+    assert old.booking_id not in {b.booking_id for b in streamed}
+    assert [b.booking_id for b in streamed] == [b.booking_id for b in recent]